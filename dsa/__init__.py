@@ -0,0 +1,74 @@
+"""Data structures and algorithms, one module per structure or technique.
+
+Importing the package loads none of its modules. The public names below
+are looked up in _EXPORTS the first time they are used, and only the
+module that defines the name, with its own imports, is loaded then. A
+short-lived process that needs a Queue never pays for the executor, the
+shared-memory queue or multiprocessing.
+
+    from dsa import Queue, josephus
+
+Modules can still be imported directly, e.g. from dsa.queue import Queue.
+Module names start in lower case and never match a public name, so
+import dsa.queue always gives the module and dsa.Queue always the class.
+"""
+import sys
+
+# Public name -> module that defines it
+_EXPORTS = {
+    "ArrayLinkedList": "arrayLinkedList",
+    "BlockDeque": "blockDeque",
+    "AsyncQueue": "blockingQueue",
+    "BlockingQueue": "blockingQueue",
+    "Deque": "deque",
+    "HeapEntry": "indexedPriorityQueue",
+    "IndexedPriorityQueue": "indexedPriorityQueue",
+    "LinkedList": "linkedList",
+    "MinMaxStack": "minMaxStack",
+    "CountedNode": "node",
+    "Node": "node",
+    "WeakrefNode": "node",
+    "OrderedList": "orderedList",
+    "PersistentList": "persistentList",
+    "PersistentStack": "persistentStack",
+    "PriorityQueue": "priorityQueue",
+    "Queue": "queue",
+    "QueueWithRearAtStartOfList": "queueWithRearAtStartOfList",
+    "RingBufferQueue": "ringBufferQueue",
+    "SharedMemoryQueue": "sharedMemoryQueue",
+    "SkipList": "skipList",
+    "SpillingQueue": "spillingQueue",
+    "Stack": "stack",
+    "UnorderedList": "unorderedList",
+    "UnrolledLinkedList": "unrolledLinkedList",
+    "UnrolledOrderedList": "unrolledOrderedList",
+    "UnrolledUnorderedList": "unrolledUnorderedList",
+    "WorkStealingDeque": "workStealingDeque",
+    "WorkStealingExecutor": "workStealingExecutor",
+    "hot_potato": "hotPotato",
+    "hot_potato_order": "hotPotato",
+    "josephus": "josephusProblem",
+    "josephus_order": "josephusProblem",
+    "sliding_window_max": "slidingWindow",
+    "sliding_window_min": "slidingWindow",
+    "STORAGE_BACKENDS": "storageBackends",
+    "create_storage": "storageBackends",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    """Import the module that defines a public name and return the name."""
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    __import__(f"{__name__}.{module}")
+    value = getattr(sys.modules[f"{__name__}.{module}"], name)
+    globals()[name] = value  # Later lookups no longer reach __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
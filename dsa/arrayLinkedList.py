@@ -0,0 +1,428 @@
+from array import array
+from typing import Any, Iterable, List, Union
+
+NIL = -1  # Slot index meaning "no node"
+
+class ArrayLinkedList:
+    """A doubly linked list whose nodes live in parallel arrays.
+
+    Slot i holds its payload in _data[i] and its links in _next[i] and
+    _prev[i], so no Python object is allocated per element. Freed slots are
+    chained through _next into a free list and reused by later inserts.
+
+    Operations: remove, search, is_empty, size, append, index, insert, pop
+                add, extend, add_many, pop_front_many, pop_rear_many, rotate
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty list with no head, tail, and a count of 0."""
+        self._data: List[Any] = []
+        self._next = array("q")
+        self._prev = array("q")
+        self._free: int = NIL
+        self.head: int = NIL
+        self.tail: int = NIL
+        self.count: int = 0
+
+
+    def is_empty(self) -> bool:
+        """Checks if the list is empty.
+
+        Returns:
+            bool: True if the list is empty, False otherwise.
+        """
+        return self.head == NIL
+
+
+    def size(self) -> int:
+        """Returns the number of elements in the list.
+
+        Returns:
+            int: The number of elements in the list.
+        """
+        return self.count
+
+
+    def __len__(self) -> int:
+        """Returns the number of elements in the list.
+
+        Returns:
+            int: The number of elements in the list.
+        """
+        return self.size()
+
+
+    def _allocate(self, item: Any, next: int, prev: int) -> int:
+        """Store an item in a free slot, growing the arrays if needed, and return the slot."""
+        slot = self._free
+        if slot == NIL:
+            slot = len(self._data)
+            self._data.append(item)
+            self._next.append(next)
+            self._prev.append(prev)
+        else:
+            self._free = self._next[slot]
+            self._data[slot] = item
+            self._next[slot] = next
+            self._prev[slot] = prev
+        return slot
+
+
+    def _release(self, slot: int) -> Any:
+        """Put a slot on the free list and return the item it held."""
+        item = self._data[slot]
+        self._data[slot] = None  # Drop the reference so the item can be collected
+        self._next[slot] = self._free
+        self._free = slot
+        return item
+
+
+    def _get_slot(self, index: int) -> int:
+        """Return the slot at a valid, non-negative index, walking from the nearer end."""
+        if index < self.count // 2:
+            slot = self.head
+            for _ in range(index):
+                slot = self._next[slot]
+        else:
+            slot = self.tail
+            for _ in range(self.count - 1 - index):
+                slot = self._prev[slot]
+        return slot
+
+
+    def search(self, item: Any) -> bool:
+        """Searches for an item in the list.
+
+        Args:
+            item (Any): The item to search for in the list.
+
+        Returns:
+            bool: True if the item is found, False otherwise.
+        """
+        try:
+            self.index(item)
+            return True
+        except ValueError:
+            return False
+
+
+    def index(self, item: Any) -> int:
+        """Finds the index of an item in the list.
+
+        Args:
+            item (Any): The item whose index to find.
+
+        Raises:
+            ValueError: If the item is not found in the list.
+
+        Returns:
+            int: The index of the item in the list.
+        """
+        data, next_slots = self._data, self._next
+        slot = self.head
+        position = 0
+        while slot != NIL and data[slot] != item:
+            slot = next_slots[slot]
+            position += 1
+
+        if slot == NIL:
+            raise ValueError(f"{item} is not in list")
+        return position
+
+
+    def remove(self, item: Any) -> None:
+        """Removes an item from the list.
+
+        Args:
+            item (Any): The item to remove from the list.
+
+        Raises:
+            ValueError: If the item is not found in the list.
+        """
+        data, next_slots = self._data, self._next
+        slot = self.head
+        while slot != NIL and data[slot] != item:
+            slot = next_slots[slot]
+
+        if slot == NIL:
+            raise ValueError(f"{item} not found!")
+        self._unlink(slot)
+
+
+    def _unlink(self, slot: int) -> Any:
+        """Detach a slot from the chain, free it and return its item."""
+        next_slot = self._next[slot]
+        prev_slot = self._prev[slot]
+
+        if prev_slot == NIL:
+            self.head = next_slot
+        else:
+            self._next[prev_slot] = next_slot
+
+        if next_slot == NIL:
+            self.tail = prev_slot
+        else:
+            self._prev[next_slot] = prev_slot
+
+        self.count -= 1
+        return self._release(slot)
+
+
+    def pop(self, index: int = -1) -> Any:
+        """Removes and returns the element at the specified index in the list.
+
+        Args:
+            index (int): The index (default is -1) of the element to pop.
+
+        Raises:
+            IndexError: If the index is out of range or the list is empty.
+
+        Returns:
+            Any: The removed item.
+        """
+        if self.is_empty():
+            raise IndexError("Cannot pop from empty list.")
+
+        if not (0 <= index < self.size() or -self.size() <= index < 0):
+            raise IndexError(f"{index} is out of range.")
+
+        if index < 0:
+            index = self.size() + index
+
+        return self._unlink(self._get_slot(index))
+
+
+    def add(self, item: Any) -> None:
+        """Adds an item to the beginning of the list.
+
+        Arg:
+            item (Any): The item to insert.
+        """
+        self.insert(0, item)
+
+
+    def append(self, item: Any) -> None:
+        """Adds an item to the end of the list.
+
+        Arg:
+            item (Any): The item to insert.
+        """
+        self.insert(self.size(), item)
+
+
+    def insert(self, index: int = 0, item: Any = None) -> None:
+        """
+        Inserts an item at a specific index in the list. If the index is negative,
+        it is treated as counting from the end of the list.
+
+        Args:
+            item (Any): The item to insert.
+            index (int): The index to insert at (default is 0).
+        """
+        if index < 0:
+            index = self.size() + index if index >= -self.size() else 0
+
+        if index == 0 or self.is_empty():  # Insert at the head
+            slot = self._allocate(item, self.head, NIL)
+            if self.head != NIL:
+                self._prev[self.head] = slot
+            self.head = slot
+            if self.tail == NIL:  # If the list was empty
+                self.tail = slot
+
+        elif index >= self.size():  # Insert at the tail
+            slot = self._allocate(item, NIL, self.tail)
+            self._next[self.tail] = slot
+            self.tail = slot
+
+        else:  # Insert at the middle
+            current = self._get_slot(index)
+            prev_slot = self._prev[current]
+            slot = self._allocate(item, current, prev_slot)
+            self._next[prev_slot] = slot
+            self._prev[current] = slot
+
+        self.count += 1
+
+
+    def extend(self, items: Iterable[Any]) -> None:
+        """Adds every item of an iterable to the end of the list.
+
+        Args:
+            items (Iterable[Any]): The items to append.
+        """
+        if items is self:
+            items = self._get_list_items()  # Snapshot, since appending would never end
+        for item in items:
+            slot = self._allocate(item, NIL, self.tail)
+            if self.tail == NIL:
+                self.head = slot
+            else:
+                self._next[self.tail] = slot
+            self.tail = slot
+            self.count += 1
+
+
+    def add_many(self, items: Iterable[Any]) -> None:
+        """Adds every item of an iterable to the beginning of the list, as repeated add would.
+
+        Args:
+            items (Iterable[Any]): The items to add.
+        """
+        if items is self:
+            items = self._get_list_items()
+        for item in items:
+            slot = self._allocate(item, self.head, NIL)
+            if self.head == NIL:
+                self.tail = slot
+            else:
+                self._prev[self.head] = slot
+            self.head = slot
+            self.count += 1
+
+
+    def pop_front_many(self, count: int) -> List[Any]:
+        """Removes up to count items from the front of the list and returns them, front first.
+
+        Every slot still goes back on the free list one at a time, but the
+        head is relinked only once.
+
+        Args:
+            count (int): The largest number of items to remove.
+        """
+        items = []
+        slot = self.head
+        for _ in range(min(count, self.count)):
+            next_slot = self._next[slot]
+            items.append(self._release(slot))
+            slot = next_slot
+
+        self.head = slot
+        if slot == NIL:
+            self.tail = NIL
+        else:
+            self._prev[slot] = NIL
+        self.count -= len(items)
+        return items
+
+
+    def pop_rear_many(self, count: int) -> List[Any]:
+        """Removes up to count items from the rear of the list and returns them, rear first.
+
+        Args:
+            count (int): The largest number of items to remove.
+        """
+        items = []
+        slot = self.tail
+        for _ in range(min(count, self.count)):
+            prev_slot = self._prev[slot]
+            items.append(self._release(slot))
+            slot = prev_slot
+
+        self.tail = slot
+        if slot == NIL:
+            self.head = NIL
+        else:
+            self._next[slot] = NIL
+        self.count -= len(items)
+        return items
+
+
+    def rotate(self, count: int = 1) -> None:
+        """Moves the last count items to the front of the list, like collections.deque.rotate.
+
+        Only the links around the old and new ends change; no slot moves.
+
+        Args:
+            count (int): The number of steps to rotate to the right; negative rotates left.
+        """
+        if self.count < 2 or count % self.count == 0:
+            return
+        new_head = self._get_slot(self.count - count % self.count)
+        new_tail = self._prev[new_head]
+        self._next[self.tail] = self.head
+        self._prev[self.head] = self.tail
+        self._next[new_tail] = self._prev[new_head] = NIL
+        self.head, self.tail = new_head, new_tail
+
+
+    def _get_list_items(self) -> List[Any]:
+        """Return a list of the items in order."""
+        items = []
+        slot = self.head
+        while slot != NIL:
+            items.append(self._data[slot])
+            slot = self._next[slot]
+        return items
+
+
+    def _stringify(self,
+                   items: List[Any],
+                   start: str = "[",
+                   end: str = "]",
+                   separator: str = ", ") -> str:
+        """Return a string representation of the items with custom formatting."""
+        return f"{start}{separator.join(str(item) for item in items)}{end}"
+
+
+    def __str__(self) -> str:
+        """Returns a string representation of the list with arrows."""
+        return self._stringify(self._get_list_items(), start="Head | ", end=" | Ground", separator=" -> ")
+
+
+    def __repr__(self) -> str:
+        """Returns a detailed representation of the list."""
+        return self._stringify(self._get_list_items(), start="[", end="]", separator=", ")
+
+
+    def __getitem__(self, index: Union[int, slice] = 0) -> Union[Any, List[Any]]:
+        """
+        Retrieve an item by its index, or a list of items by a slice.
+
+        Follows the same indexing and slicing rules as LinkedList.__getitem__.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if isinstance(index, int):
+            if not (0 <= index < self.size() or -self.size() <= index < 0):
+                raise IndexError(f"{index} is out of range.")
+
+            if index < 0:
+                index = self.size() + index
+
+            return self._data[self._get_slot(index)]
+        else: # Handle slicing
+
+            if index.step:
+                raise NotImplementedError
+
+            start = index.start
+            stop = index.stop
+
+            # Edge case
+            if start > 0 and stop > 0 and start > stop:
+                return []
+
+            if start < 0:
+                start = self.size() + start
+
+            if stop < 0:
+                stop = self.size() + stop
+
+            starting_index = min(start, stop)
+            ending_index = max(start, stop)
+
+            # Nothing to return when the slice starts at or after the last item
+            position = max(starting_index, 0)
+            if position >= self.size() - 1:
+                return []
+
+            items = []
+            slot = self._get_slot(position)
+            while slot != NIL and position <= ending_index:
+                items.append(self._data[slot])
+                slot = self._next[slot]
+                position += 1
+
+            return items[:-1] if start < stop else items[::-1]
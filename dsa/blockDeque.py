@@ -0,0 +1,145 @@
+from typing import Any, Iterator, List
+
+BLOCK_SIZE = 64
+CENTER = (BLOCK_SIZE - 1) // 2
+
+class Block:
+    """A fixed-size block of deque slots, linked to its neighbouring blocks."""
+    __slots__ = ("items", "next", "prev")
+
+    def __init__(self, next: 'Block' = None, prev: 'Block' = None):
+        """
+        Initializes a new Block with BLOCK_SIZE empty slots.
+
+        Args:
+            next (Block): A reference to the next block (default is None).
+            prev (Block): A reference to the previous block (default is None).
+        """
+        self.items: List[Any] = [None] * BLOCK_SIZE
+        self.next = next
+        self.prev = prev
+
+
+class BlockDeque:
+    """Deque implementation as a doubly linked list of fixed-size blocks.
+
+    This is the layout of CPython's collections.deque. The front item is at
+    _left.items[_left_index] and the rear item at _right.items[_right_index].
+    A new block is linked in only when an end block fills up, and an end
+    block is dropped when it empties, so every element costs about one
+    pointer and indexing hops a whole block at a time.
+
+    Operations: add_front, add_rear, pop_front, pop_rear, is_empty, size
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty deque with a single block and both ends at its centre."""
+        self._left = self._right = Block()
+        self._left_index = CENTER + 1
+        self._right_index = CENTER
+        self._count = 0
+
+    def is_empty(self) -> bool:
+        """Check if the Deque is empty"""
+        return self._count == 0
+
+    def add_front(self, item: Any) -> None:
+        """Add an item to the front of the deque"""
+        if self._left_index == 0:
+            block = Block(self._left)
+            self._left.prev = block
+            self._left = block
+            self._left_index = BLOCK_SIZE
+        self._left_index -= 1
+        self._left.items[self._left_index] = item
+        self._count += 1
+
+    def add_rear(self, item: Any) -> None:
+        """Add an item to the rear of the deque"""
+        if self._right_index == BLOCK_SIZE - 1:
+            block = Block(None, self._right)
+            self._right.next = block
+            self._right = block
+            self._right_index = -1
+        self._right_index += 1
+        self._right.items[self._right_index] = item
+        self._count += 1
+
+    def pop_front(self) -> Any:
+        """Remove the item at front of Deque."""
+        if self._count == 0:
+            raise IndexError("pop_front from an empty deque.")
+        item = self._left.items[self._left_index]
+        self._left.items[self._left_index] = None  # Drop the reference so the item can be collected
+        self._left_index += 1
+        self._count -= 1
+
+        if self._count == 0:  # Recentre so both ends have room to grow
+            self._left_index = CENTER + 1
+            self._right_index = CENTER
+        elif self._left_index == BLOCK_SIZE:
+            self._left = self._left.next
+            self._left.prev = None
+            self._left_index = 0
+        return item
+
+    def pop_rear(self) -> Any:
+        """Remove an item from the rear of the deque"""
+        if self._count == 0:
+            raise IndexError("pop_rear from an empty deque.")
+        item = self._right.items[self._right_index]
+        self._right.items[self._right_index] = None  # Drop the reference so the item can be collected
+        self._right_index -= 1
+        self._count -= 1
+
+        if self._count == 0:  # Recentre so both ends have room to grow
+            self._left_index = CENTER + 1
+            self._right_index = CENTER
+        elif self._right_index < 0:
+            self._right = self._right.prev
+            self._right.next = None
+            self._right_index = BLOCK_SIZE - 1
+        return item
+
+    def size(self) -> int:
+        """Get the number of items in the deque"""
+        return self._count
+
+    def __len__(self) -> int:
+        """Get the number of items in the deque"""
+        return self._count
+
+    def __getitem__(self, index: int) -> Any:
+        """Return the item at an index, hopping a block at a time from the nearer end.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if not (0 <= index < self._count or -self._count <= index < 0):
+            raise IndexError(f"{index} is out of range.")
+
+        if index < 0:
+            index = self._count + index
+
+        if index < self._count // 2:
+            offset = self._left_index + index
+            block = self._left
+            while offset >= BLOCK_SIZE:
+                offset -= BLOCK_SIZE
+                block = block.next
+        else:
+            offset = self._right_index - (self._count - 1 - index)
+            block = self._right
+            while offset < 0:
+                offset += BLOCK_SIZE
+                block = block.prev
+        return block.items[offset]
+
+    def __iter__(self) -> Iterator[Any]:
+        """Yield the items from front to rear."""
+        block, offset = self._left, self._left_index
+        for _ in range(self._count):
+            yield block.items[offset]
+            offset += 1
+            if offset == BLOCK_SIZE:
+                block, offset = block.next, 0
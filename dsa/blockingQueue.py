@@ -0,0 +1,215 @@
+import asyncio
+import threading
+from queue import Empty, Full
+from typing import Any, Optional
+from .ringBufferQueue import RingBufferQueue
+
+class QueueCore:
+    """Bounded FIFO storage and task accounting shared by the queue front ends.
+
+    The core never blocks and is not synchronised; BlockingQueue adds
+    locking and waiting for threads, and AsyncQueue adds waiting for
+    coroutines on one event loop. A maxsize of 0 means unbounded.
+    """
+
+    def __init__(self, maxsize: int = 0) -> None:
+        """Initialize an empty core with the given capacity."""
+        self.maxsize = maxsize
+        self._items = RingBufferQueue()
+        self._unfinished_tasks = 0
+
+    def _full(self) -> bool:
+        """Check if the queue is at its capacity."""
+        return 0 < self.maxsize <= self._items.size()
+
+    def _push(self, item: Any) -> None:
+        """Add an item to the back and count it as an unfinished task."""
+        self._items.enqueue(item)
+        self._unfinished_tasks += 1
+
+    def _pop(self) -> Any:
+        """Remove and return the front item."""
+        return self._items.dequeue()
+
+    def _task_done(self) -> bool:
+        """Mark one task as finished and report whether none are left."""
+        if self._unfinished_tasks <= 0:
+            raise ValueError("task_done() called too many times.")
+        self._unfinished_tasks -= 1
+        return self._unfinished_tasks == 0
+
+
+class BlockingQueue(QueueCore):
+    """A thread-safe bounded queue with blocking, timeout-aware put and get.
+
+    Operations: put, get, enqueue, dequeue, task_done, join, size, is_empty
+    """
+
+    def __init__(self, maxsize: int = 0) -> None:
+        """Initialize the queue, its lock and the conditions waiting on it."""
+        super().__init__(maxsize)
+        self._mutex = threading.Lock()
+        self._not_empty = threading.Condition(self._mutex)
+        self._not_full = threading.Condition(self._mutex)
+        self._all_tasks_done = threading.Condition(self._mutex)
+
+    def put(self, item: Any, block: bool = True, timeout: Optional[float] = None) -> None:
+        """Add an item to the back, waiting for free space if the queue is full.
+
+        Raises:
+            Full: If there is no free space when block is False or the timeout expires.
+        """
+        with self._not_full:
+            if self._full() and not self._not_full.wait_for(lambda: not self._full(), timeout if block else 0):
+                raise Full
+            self._push(item)
+            self._not_empty.notify()
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        """Remove and return the front item, waiting for one if the queue is empty.
+
+        Raises:
+            Empty: If there is no item when block is False or the timeout expires.
+        """
+        with self._not_empty:
+            if self._items.is_empty() and not self._not_empty.wait_for(self._items.size, timeout if block else 0):
+                raise Empty
+            item = self._pop()
+            self._not_full.notify()
+            return item
+
+    def enqueue(self, item: Any) -> None:
+        """Add the given item to the back of the queue, blocking while it is full."""
+        self.put(item)
+
+    def dequeue(self) -> Any:
+        """Remove and return the front element, blocking while the queue is empty."""
+        return self.get()
+
+    def task_done(self) -> None:
+        """Mark a task taken with get as finished, waking join when none are left.
+
+        Raises:
+            ValueError: If called more times than there were items put.
+        """
+        with self._all_tasks_done:
+            if self._task_done():
+                self._all_tasks_done.notify_all()
+
+    def join(self) -> None:
+        """Block until every item put has been marked with task_done."""
+        with self._all_tasks_done:
+            self._all_tasks_done.wait_for(lambda: self._unfinished_tasks == 0)
+
+    def size(self) -> int:
+        """Return the number of items in the queue."""
+        with self._mutex:
+            return self._items.size()
+
+    def is_empty(self) -> bool:
+        """Check if the queue is empty."""
+        with self._mutex:
+            return self._items.is_empty()
+
+
+class AsyncQueue(QueueCore):
+    """A bounded queue for coroutines on one event loop, with awaitable put and get.
+
+    Waiters sleep on events that are set whenever the state they wait for
+    may have changed, and recheck it on waking.
+
+    Operations: put, get, put_nowait, get_nowait, task_done, join, size, is_empty
+    """
+
+    def __init__(self, maxsize: int = 0) -> None:
+        """Initialize the queue and the events its waiters sleep on."""
+        super().__init__(maxsize)
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._finished = asyncio.Event()
+        self._finished.set()
+
+    async def put(self, item: Any, timeout: Optional[float] = None) -> None:
+        """Add an item to the back, waiting for free space if the queue is full.
+
+        Raises:
+            Full: If the timeout expires before there is free space.
+        """
+        try:
+            await asyncio.wait_for(self._put_when_not_full(item), timeout)
+        except asyncio.TimeoutError:
+            raise Full from None
+
+    async def get(self, timeout: Optional[float] = None) -> Any:
+        """Remove and return the front item, waiting for one if the queue is empty.
+
+        Raises:
+            Empty: If the timeout expires before an item arrives.
+        """
+        try:
+            return await asyncio.wait_for(self._get_when_not_empty(), timeout)
+        except asyncio.TimeoutError:
+            raise Empty from None
+
+    async def _put_when_not_full(self, item: Any) -> None:
+        """Sleep until the queue has free space, then add the item.
+
+        Nothing is awaited between the final check and the push, so a
+        waiter woken together with others cannot find the space taken.
+        """
+        while self._full():
+            self._not_full.clear()
+            await self._not_full.wait()
+        self.put_nowait(item)
+
+    async def _get_when_not_empty(self) -> Any:
+        """Sleep until the queue has an item, then remove and return it."""
+        while self._items.is_empty():
+            self._not_empty.clear()
+            await self._not_empty.wait()
+        return self.get_nowait()
+
+    def put_nowait(self, item: Any) -> None:
+        """Add an item to the back without waiting.
+
+        Raises:
+            Full: If the queue is full.
+        """
+        if self._full():
+            raise Full
+        self._push(item)
+        self._finished.clear()
+        self._not_empty.set()
+
+    def get_nowait(self) -> Any:
+        """Remove and return the front item without waiting.
+
+        Raises:
+            Empty: If the queue is empty.
+        """
+        if self._items.is_empty():
+            raise Empty
+        item = self._pop()
+        self._not_full.set()
+        return item
+
+    def task_done(self) -> None:
+        """Mark a task taken with get as finished, waking join when none are left.
+
+        Raises:
+            ValueError: If called more times than there were items put.
+        """
+        if self._task_done():
+            self._finished.set()
+
+    async def join(self) -> None:
+        """Wait until every item put has been marked with task_done."""
+        await self._finished.wait()
+
+    def size(self) -> int:
+        """Return the number of items in the queue."""
+        return self._items.size()
+
+    def is_empty(self) -> bool:
+        """Check if the queue is empty."""
+        return self._items.is_empty()
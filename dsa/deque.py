@@ -0,0 +1,64 @@
+from typing import Any, Iterable, List
+from .storageBackends import create_storage
+
+class Deque: 
+    def __init__(self, backend: str = "linked") -> None: 
+        """Initalize Deque using Doubly Linked List, or another storage backend.
+        Assuming front is at index 0 and rear at index -1. 
+        
+        Operations: add_front, add_rear, pop_front, pop_rear, is_empty, size
+                    add_front_many, add_rear_many, pop_front_many, pop_rear_many, rotate
+        
+        Args:
+            backend (str): The storage for the items, a key of STORAGE_BACKENDS.
+        """
+        self._items = create_storage(backend)
+        
+    def is_empty(self) -> int: 
+        """Check if the Deque is empty"""
+        return len(self._items) == 0
+    
+    def add_front(self, item: Any) -> None: 
+        """Remove an item from the front of the deque"""
+        self._items.insert(0, item)
+        
+    def add_rear(self, item: Any) -> None: 
+        """Add an item to the rear of the deque"""
+        self._items.append(item)
+        
+    def pop_front(self) -> Any: 
+        """Remove the item at front of Deque."""
+        return self._items.pop(0)
+        
+    def pop_rear(self) -> Any: 
+        """Remove an item from the rear of the deque"""
+        return self._items.pop()
+    
+    def add_front_many(self, items: Iterable[Any]) -> None:
+        """Add every item to the front of the deque, as repeated add_front would"""
+        self._items.add_many(items)
+
+    def add_rear_many(self, items: Iterable[Any]) -> None:
+        """Add every item to the rear of the deque in one operation"""
+        self._items.extend(items)
+
+    def pop_front_many(self, count: int) -> List[Any]:
+        """Remove up to count items from the front of the deque, front first"""
+        return self._items.pop_front_many(count)
+
+    def pop_rear_many(self, count: int) -> List[Any]:
+        """Remove up to count items from the rear of the deque, rear first"""
+        return self._items.pop_rear_many(count)
+
+    def rotate(self, count: int = 1) -> None:
+        """Move count items from the rear to the front, or from the front to the rear if negative.
+        
+        Same as collections.deque.rotate. The linked backends relink their
+        ends, so this costs O(min(k, n - k)) whichever way it turns.
+        """
+        self._items.rotate(count)
+    
+    def size(self) -> None: 
+        """Get the number of items in the deque"""
+        return len(self._items)
+        
@@ -0,0 +1,39 @@
+from .josephusProblem import josephus, josephus_order
+from typing import List
+
+def hot_potato(names: List[str], num: int) -> str:
+    """Simulates the children's game hot potato.
+
+    Passing the potato num times and dropping whoever holds it eliminates
+    every (num + 1)-th player, so this is the Josephus problem with
+    k = num + 1. The survivor is computed rather than simulated, which
+    handles millions of players and large counts.
+
+    Args:
+        names: List of people participating in the game.
+        num: The count that determines who gets eliminated.
+
+    Raises:
+        ValueError: If there are no players or num is negative.
+
+    Returns:
+        The name of the last remaining person.
+    """
+    if num < 0:
+        raise ValueError("num must not be negative.")
+    return names[josephus(len(names), num + 1)]
+
+
+def hot_potato_order(names: List[str], num: int) -> List[str]:
+    """Returns the names in the order the players are eliminated, survivor last.
+
+    Args:
+        names: List of people participating in the game.
+        num: The count that determines who gets eliminated.
+
+    Raises:
+        ValueError: If there are no players or num is negative.
+    """
+    if num < 0:
+        raise ValueError("num must not be negative.")
+    return [names[position] for position in josephus_order(len(names), num + 1)]
@@ -0,0 +1,169 @@
+from typing import Any, Iterable, List, Tuple
+from .priorityQueue import PriorityQueue
+
+class HeapEntry:
+    """An item in an IndexedPriorityQueue, which doubles as its handle."""
+    __slots__ = ("item", "priority", "position")
+
+    def __init__(self, item: Any, priority: Any):
+        """
+        Initializes a new HeapEntry that is not in any heap yet.
+
+        Args:
+            item (Any): The item stored in the entry.
+            priority (Any): The priority the heap is ordered by.
+        """
+        self.item = item
+        self.priority = priority
+        self.position = -1  # Slot in the heap, or -1 once removed
+
+    def __lt__(self, other: 'HeapEntry') -> bool:
+        """Order entries by priority."""
+        return self.priority < other.priority
+
+
+class IndexedPriorityQueue(PriorityQueue):
+    """A d-ary min-heap of items with separate priorities, addressable by handle.
+
+    push returns a HeapEntry handle that always knows its slot in the
+    heap, so decrease_key and remove reach an item without searching and
+    cost O(log n). The handle must not be modified directly.
+
+    Operations: push, pop, peek, decrease_key, remove, heapify, is_empty, size.
+    """
+
+    def __init__(self, arity: int = 2) -> None:
+        """Initializes an empty heap.
+
+        The queue takes no initial items, since their handles would be lost;
+        call heapify to add a batch in O(n) and get its handles back.
+
+        Args:
+            arity (int): The number of children per slot (default is 2).
+        """
+        super().__init__((), arity)
+
+    def push(self, item: Any, priority: Any) -> HeapEntry:
+        """Add an item with a priority in O(log n) and return its handle."""
+        entry = HeapEntry(item, priority)
+        entry.position = len(self._heap)
+        self._heap.append(entry)
+        self._sift_up(entry.position)
+        return entry
+
+    def pop(self) -> Any:
+        """Remove and return the item with the smallest priority.
+
+        Raises:
+            IndexError: If the priority queue is empty.
+        """
+        if not self._heap:
+            raise IndexError("Pop from empty priority queue.")
+        return self._remove_at(0).item
+
+    def peek(self) -> Any:
+        """Return the item with the smallest priority without removing it.
+
+        Raises:
+            IndexError: If the priority queue is empty.
+        """
+        if not self._heap:
+            raise IndexError("Peek from empty priority queue.")
+        return self._heap[0].item
+
+    def decrease_key(self, handle: HeapEntry, priority: Any) -> None:
+        """Lower the priority of an item in the queue in O(log n).
+
+        Raises:
+            ValueError: If the handle is not in the queue or the priority is larger.
+        """
+        self._check(handle)
+        if handle.priority < priority:
+            raise ValueError("decrease_key cannot raise a priority.")
+        handle.priority = priority
+        self._sift_up(handle.position)
+
+    def remove(self, handle: HeapEntry) -> Any:
+        """Remove an item by its handle in O(log n) and return it.
+
+        Raises:
+            ValueError: If the handle is not in the queue.
+        """
+        self._check(handle)
+        return self._remove_at(handle.position).item
+
+    def __contains__(self, handle: HeapEntry) -> bool:
+        """Check if a handle belongs to an item still in the queue."""
+        return 0 <= handle.position < len(self._heap) and self._heap[handle.position] is handle
+
+    def heapify(self, items: Iterable[Tuple[Any, Any]]) -> List[HeapEntry]:
+        """Add (item, priority) pairs, restore heap order in O(n), and return their handles."""
+        entries = [HeapEntry(item, priority) for item, priority in items]
+        for position, entry in enumerate(entries, len(self._heap)):
+            entry.position = position
+        self._heap.extend(entries)
+        for pos in reversed(range((len(self._heap) - 2) // self.arity + 1)):
+            self._sift_down(pos)
+        return entries
+
+    def _check(self, handle: HeapEntry) -> None:
+        """Raise ValueError unless a handle belongs to an item in this queue."""
+        if handle not in self:
+            raise ValueError("Handle is not in the priority queue.")
+
+    def _remove_at(self, pos: int) -> HeapEntry:
+        """Remove the entry at a slot, filling the hole with the last entry."""
+        heap = self._heap
+        entry = heap[pos]
+        last = heap.pop()
+        if last is not entry:
+            heap[pos] = last
+            last.position = pos
+            if pos > 0 and last.priority < heap[(pos - 1) // self.arity].priority:
+                self._sift_up(pos)
+            else:
+                self._sift_down(pos)
+        entry.position = -1
+        return entry
+
+    def _sift_up(self, pos: int) -> None:
+        """Move the entry at pos up until its parent is no larger, tracking positions."""
+        heap, arity = self._heap, self.arity
+        entry = heap[pos]
+        priority = entry.priority
+        while pos > 0:
+            parent = (pos - 1) // arity
+            above = heap[parent]
+            if not priority < above.priority:
+                break
+            heap[pos] = above
+            above.position = pos
+            pos = parent
+        heap[pos] = entry
+        entry.position = pos
+
+    def _sift_down(self, pos: int) -> None:
+        """Move the entry at pos down until no child is smaller, tracking positions."""
+        heap, arity = self._heap, self.arity
+        count = len(heap)
+        entry = heap[pos]
+        priority = entry.priority
+        while True:
+            child = arity * pos + 1
+            if child >= count:
+                break
+            if arity == 2:
+                if child + 1 < count and heap[child + 1].priority < heap[child].priority:
+                    child += 1
+            else:
+                for other in range(child + 1, min(child + arity, count)):
+                    if heap[other].priority < heap[child].priority:
+                        child = other
+            below = heap[child]
+            if not below.priority < priority:
+                break
+            heap[pos] = below
+            below.position = pos
+            pos = child
+        heap[pos] = entry
+        entry.position = pos
@@ -0,0 +1,118 @@
+from typing import Iterator, List
+
+LAP_LIMIT = 4096  # Largest count for which eliminations are done a whole lap at a time
+
+
+def _check(n: int, k: int) -> None:
+    """Raise ValueError unless there is at least one player and a positive count."""
+    if n < 1:
+        raise ValueError("n must be at least 1.")
+    if k < 1:
+        raise ValueError("k must be at least 1.")
+
+
+def josephus(n: int, k: int) -> int:
+    """Return the position of the last player left when every k-th player is eliminated.
+
+    Players stand in a circle at positions 0 to n - 1. Counting starts at
+    position 0, and the player on each k-th count leaves the circle.
+    Counting carries on from the next player. The answer comes from the
+    recurrence J(1) = 0, J(m) = (J(m - 1) + k) % m, which takes O(n) steps
+    and O(1) memory. Once the circle has k players, J(m) + k often stays
+    below m, so the modulo does nothing and whole runs of steps are taken
+    in one jump. That needs only about k log n steps when k is small.
+
+    Args:
+        n: The number of players.
+        k: The count at which a player is eliminated.
+
+    Raises:
+        ValueError: If n or k is less than 1.
+
+    Returns:
+        The 0-based position of the survivor.
+    """
+    _check(n, k)
+    survivor = 0
+    # Below k players every step wraps around
+    for players in range(2, min(k, n) + 1):
+        survivor = (survivor + k) % players
+    players = max(1, min(k, n))
+    while players < n:
+        # Steps that do not wrap around add k to the position and 1 to the circle
+        jump = min((players - survivor - 1) // (k - 1), n - players) if k > 1 else n - players
+        if jump:
+            survivor += jump * k
+            players += jump
+        else:
+            players += 1
+            survivor = (survivor + k) % players
+    return survivor
+
+
+def josephus_order(n: int, k: int) -> Iterator[int]:
+    """Yield the positions of the players in the order they are eliminated.
+
+    The last position yielded is the survivor, josephus(n, k). For k up to
+    LAP_LIMIT, each lap around the circle removes every k-th remaining
+    player with one extended-slice deletion. That is O(n) work in C per
+    lap and about n * k in total. Once a lap would remove only a few
+    players, or from the start when k is larger, the rest are found with a
+    Fenwick tree in O(n log n).
+
+    Args:
+        n: The number of players.
+        k: The count at which a player is eliminated.
+
+    Raises:
+        ValueError: If n or k is less than 1.
+
+    Returns:
+        An iterator over all n positions, 0-based.
+    """
+    _check(n, k)
+    return _eliminate(n, k)
+
+
+def _eliminate(n: int, k: int) -> Iterator[int]:
+    """Yield the elimination order, lapping while that is cheap, then using a Fenwick tree."""
+    players = list(range(n))
+    start = 0  # Rank, among the remaining players, where the next count begins
+    if k <= LAP_LIMIT:
+        while len(players) >= 2 * k:
+            first = (start + k - 1) % len(players)
+            eliminated = players[first::k]
+            del players[first::k]
+            yield from eliminated
+            # The count resumes just after the last eliminated player
+            start = first + (len(eliminated) - 1) * (k - 1)
+    yield from _eliminate_ranked(players, start, k)
+
+
+def _eliminate_ranked(players: List[int], start: int, k: int) -> Iterator[int]:
+    """Yield the elimination order of the players left, finding each by rank in a Fenwick tree.
+
+    The tree counts the players still in the circle. A binary descent
+    finds the slot holding the player of a given rank in O(log n). The
+    nodes the descent does not step past are the ones whose ranges
+    contain that slot, so the player is removed from the counts during
+    the same descent.
+    """
+    size = len(players)
+    tree = [index & -index for index in range(size + 1)]  # Every slot starts occupied
+    top = 1 << (size.bit_length() - 1) if size else 0
+    rank = start
+    for remaining in range(size, 0, -1):
+        rank = (rank + k - 1) % remaining
+        target = rank + 1
+        slot, step = 0, top
+        while step:
+            node = slot + step
+            if node <= size:
+                if tree[node] < target:
+                    slot = node
+                    target -= tree[node]
+                else:
+                    tree[node] -= 1
+            step >>= 1
+        yield players[slot]
@@ -0,0 +1,569 @@
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Set, Tuple, Type, Union
+from .node import Node
+
+class LinkedList:
+    """A class representing a doubly linked list.
+    
+    Operations: remove, search, is_empty, size, append, index, insert, pop
+                remove_all, pop_front_many, pop_rear_many,
+                del ll[index], del ll[start:stop:step]
+    
+    Every mutation bumps a version counter, which the iterators check to
+    detect changes made to the list while it is being iterated.
+    
+    The list also keeps a finger: the (version, index, node) of the last
+    positional access. A lookup walks from the head, the tail or the finger,
+    whichever is closest, so sequential index loops cost O(1) per step. The
+    finger is only trusted while its version matches the list's version.
+    
+    An indexed list also keeps a hash index from each value to the set of
+    nodes holding it, which makes search and remove O(1) and lets index()
+    walk back from the found node instead of scanning. Values of an indexed
+    list must be hashable.
+    """
+    # Class used for new nodes; set to WeakrefNode to allow weak references.
+    node_type: Type[Node] = Node
+
+    def __init__(self, indexed: bool = False) -> None:
+        """Initializes an empty linked list with no head, tail, and a count of 0.
+        
+        Args:
+            indexed (bool): Keep a value-to-node hash index (default is False).
+        """
+        self.head : Node = None
+        self.tail : Node = None
+        self.count : int = 0
+        self._version : int = 0
+        self._finger : Tuple[int, int, Node] = (-1, 0, None)
+        self._value_index : Dict[Any, Set[Node]] = {} if indexed else None
+
+
+    def is_empty(self) -> bool:
+        """Checks if the linked list is empty.
+        
+        Returns:
+            bool: True if the list is empty, False otherwise.
+        """
+        return self.head is None
+
+
+    def size(self) -> int:
+        """Returns the number of elements in the linked list.
+        
+        Returns:
+            int: The number of elements in the list.
+        """
+        return self.count
+
+
+    def __len__(self) -> int:
+        """Returns the number of elements in the linked list.
+        
+        Returns:
+            int: The number of elements in the list.
+        """
+        return self.size()
+
+
+    def search(self, item: Any) -> bool:
+        """Searches for an item in the linked list.
+        
+        Args:
+            item (Any): The item to search for in the list.
+        
+        Returns:
+            bool: True if the item is found, False otherwise.
+        """
+        return item in self
+
+
+    def index(self, item: Any) -> int:
+        """Finds the index of an item in the linked list.
+        
+        Args:
+            item (Any): The item whose index to find.
+        
+        Raises:
+            ValueError: If the item is not found in the list.
+        
+        Returns:
+            int: The index of the item in the list.
+        """
+        current, position = self._find_node_and_index(item)
+        if not current:
+            raise ValueError(f"{item} is not in list")  # Item not found
+        return position
+
+
+    def _find_node_and_index(self, item: Any) -> Tuple[Node, int]:
+        """Return the first node holding an item and its index, or (None, -1)."""
+        if self._value_index is not None:
+            current = self._find_node(item)
+            if not current:
+                return None, -1
+            node, position = current, 0
+            while current.prev:  # Walk back to the head to count the position
+                current = current.prev
+                position += 1
+            return node, position
+
+        current = self.head
+        position = 0
+        while current and current.data != item:
+            current = current.next
+            position += 1
+        return (current, position) if current else (None, -1)
+
+
+    def remove(self, item: Any) -> None:
+        """Removes an item from the linked list.
+        
+        Args:
+            item (Any): The item to remove from the list.
+        
+        Raises:
+            ValueError: If the item is not found in the list.
+        """
+        current = self._find_node(item)
+        if not current:
+            raise ValueError(f"{item} not found!")  # Item not found
+        self._unlink(current)
+
+
+    def remove_all(self, item: Union[Any, Callable[[Any], bool]]) -> int:
+        """Removes every matching item in a single traversal.
+        
+        Args:
+            item (Union[Any, Callable[[Any], bool]]): The item to remove, or a
+                predicate; a callable is always treated as a predicate.
+        
+        Returns:
+            int: The number of items removed.
+        """
+        if not callable(item) and self._value_index is not None:
+            nodes = list(self._value_index.get(item, ()))
+            for current in nodes:
+                self._unlink(current)
+            return len(nodes)
+
+        matches = item if callable(item) else lambda data: data == item
+        removed = 0
+        current = self.head
+        while current:
+            following = current.next
+            if matches(current.data):
+                self._unlink(current)
+                removed += 1
+            current = following
+        return removed
+
+
+    def _find_node(self, item: Any) -> Node:
+        """Return the first node holding an item, or None if there is none."""
+        if self._value_index is None:
+            current = self.head
+            while current and current.data != item:
+                current = current.next
+            return current
+
+        nodes = self._value_index.get(item)
+        if not nodes:
+            return None
+        current = next(iter(nodes))
+        if len(nodes) == 1:
+            return current
+
+        # Walk back from any match; the last match seen is the first in the list
+        first = current
+        while current:
+            if current in nodes:
+                first = current
+            current = current.prev
+        return first
+
+
+    def pop(self, index: int = -1) -> Any:
+        """Removes and returns the element at the specified index in the linked list.
+        
+        Args:
+            index (int): The index (default is 0) of the element to pop.
+        
+        Raises:
+            IndexError: If the index is out of range or the list is empty.
+        
+        Returns:
+            Any: The data of the removed node.
+        """
+        # Handle the case where the list is empty
+        if self.is_empty():
+            raise IndexError("Cannot pop from empty list.")
+
+        # Check if index is valid (within the range)
+        if not (0 <= index < self.size() or -self.size() <= index < 0):
+            raise IndexError(f"{index} is out of range.")
+
+        # Convert negative index to positive
+        if index < 0:
+            index = self.size() + index
+
+        current = self._get_node(index)
+        self._unlink(current)
+        # The node after the removed one now sits at the same index
+        self._finger = (self._version, index, current.next)
+        return current.data  # Return the data of the removed node
+
+
+    def _unlink(self, current: Node) -> None:
+        """Detach a node from the list and drop it from the hash index."""
+        # Removing from the head of the list
+        if current is self.head:
+            self.head = self.head.next
+            if self.head is None:  # If the list becomes empty
+                self.tail = None
+            else:
+                self.head.prev = None
+        # Removing from the tail of the list
+        elif current is self.tail:
+            self.tail = self.tail.prev
+            self.tail.next = None
+        else:  # Removing from the middle
+            prev_node = current.prev
+            next_node = current.next
+            prev_node.next = next_node
+            next_node.prev = prev_node
+
+        self.count -= 1  # Decrease the count of the list
+        self._version += 1
+        self._unindex_node(current)
+
+
+    def pop_front_many(self, count: int) -> List[Any]:
+        """Removes up to count items from the front of the list and returns them.
+        
+        The removed nodes are cut off as one chain, so the list is relinked
+        once instead of once per item.
+        
+        Args:
+            count (int): The largest number of items to remove.
+        
+        Returns:
+            List[Any]: The removed items, front first, as repeated pop(0) would return them.
+        """
+        items = []
+        current = self.head
+        for _ in range(min(count, self.count)):
+            items.append(current.data)
+            self._unindex_node(current)
+            current = current.next
+
+        if items:
+            self.head = current
+            if current:
+                current.prev = None
+            else:
+                self.tail = None
+            self.count -= len(items)
+            self._version += 1
+        return items
+
+
+    def pop_rear_many(self, count: int) -> List[Any]:
+        """Removes up to count items from the rear of the list and returns them.
+        
+        Args:
+            count (int): The largest number of items to remove.
+        
+        Returns:
+            List[Any]: The removed items, rear first, as repeated pop() would return them.
+        """
+        items = []
+        current = self.tail
+        for _ in range(min(count, self.count)):
+            items.append(current.data)
+            self._unindex_node(current)
+            current = current.prev
+
+        if items:
+            self.tail = current
+            if current:
+                current.next = None
+            else:
+                self.head = None
+            self.count -= len(items)
+            self._version += 1
+        return items
+
+
+    def _index_node(self, node: Node) -> None:
+        """Add a newly linked node to the hash index, if the list keeps one."""
+        if self._value_index is not None:
+            self._value_index.setdefault(node.data, set()).add(node)
+
+
+    def _unindex_node(self, node: Node) -> None:
+        """Drop an unlinked node from the hash index, if the list keeps one."""
+        if self._value_index is not None:
+            nodes = self._value_index[node.data]
+            nodes.discard(node)
+            if not nodes:
+                del self._value_index[node.data]
+
+
+    def _build_chain(self, items: Iterable[Any]) -> Tuple[Node, Node, int]:
+        """Build an unattached chain of new nodes and return its head, tail and count.
+        
+        The nodes are added to the hash index if the list keeps one.
+        """
+        head = tail = None
+        count = 0
+        for item in items:
+            new_node = self.node_type(item, None, tail)
+            if tail:
+                tail.next = new_node
+            else:
+                head = new_node
+            tail = new_node
+            count += 1
+            self._index_node(new_node)
+        return head, tail, count
+
+
+    def _take_chain(self, other: 'LinkedList') -> Tuple[Node, Node, int]:
+        """Detach every node of another list and return its head, tail and count.
+        
+        The other list is left empty, and the nodes are added to this list's
+        hash index if it keeps one. If the other list's nodes are not of
+        this list's node_type, for example plain Nodes moving into a list
+        that counts hits, the items are copied into new nodes instead.
+        """
+        if other is self:
+            raise ValueError("Cannot move a list's nodes into itself.")
+
+        head, tail, count = other.head, other.tail, other.count
+        other.head = other.tail = None
+        other.count = 0
+        other._version += 1
+        if other._value_index is not None:
+            other._value_index = {}
+
+        if not issubclass(other.node_type, self.node_type):
+            items = []
+            while head:
+                items.append(head.data)
+                head = head.next
+            return self._build_chain(items)
+
+        if self._value_index is not None:
+            current = head
+            while current:
+                self._index_node(current)
+                current = current.next
+        return head, tail, count
+
+
+    def _get_node(self, index: int) -> Node:
+        """Return the node at a valid, non-negative index.
+        
+        The walk starts from the head, the tail or the finger, whichever is
+        closest to the index, and the finger is then moved to the result.
+        """
+        current, steps = self.head, index
+        if self.count - 1 - index < index:
+            current, steps = self.tail, index - (self.count - 1)
+
+        version, finger_index, finger_node = self._finger
+        if version == self._version and finger_node and abs(index - finger_index) < abs(steps):
+            current, steps = finger_node, index - finger_index
+
+        if steps > 0:
+            for _ in range(steps):
+                current = current.next
+        else:
+            for _ in range(-steps):
+                current = current.prev
+
+        self._finger = (self._version, index, current)
+        return current
+
+
+    def __iter__(self) -> Iterator[Any]:
+        """Yield the items from head to tail.
+        
+        Raises:
+            RuntimeError: If the list is mutated during iteration.
+        """
+        version = self._version
+        current = self.head
+        while current:
+            yield current.data
+            if self._version != version:
+                raise RuntimeError("LinkedList mutated during iteration.")
+            current = current.next
+
+
+    def __reversed__(self) -> Iterator[Any]:
+        """Yield the items from tail to head.
+        
+        Raises:
+            RuntimeError: If the list is mutated during iteration.
+        """
+        version = self._version
+        current = self.tail
+        while current:
+            yield current.data
+            if self._version != version:
+                raise RuntimeError("LinkedList mutated during iteration.")
+            current = current.prev
+
+
+    def __contains__(self, item: Any) -> bool:
+        """Checks if an item is in the linked list, using the hash index if there is one."""
+        if self._value_index is not None:
+            return item in self._value_index
+        for data in self:
+            if data == item:
+                return True
+        return False
+
+
+    def _stringify(self, 
+                   items: Iterable[Any], 
+                   start: str = "[", 
+                   end: str = "]", 
+                   separator: str = ", ") -> str:
+        """Return a string representation of the items with custom formatting."""
+        # Join the string representation of the items with the separator
+        item_data = separator.join(map(str, items))
+        return f"{start}{item_data}{end}"
+
+
+    def __str__(self) -> str:
+        """Returns a string representation of the linked list with arrows."""
+        return self._stringify(self, start="Head | ", end=" | Ground", separator=" -> ")
+
+
+    def __repr__(self) -> str:
+        """Returns a detailed representation of the linked list."""
+        return self._stringify(self, start="[", end="]", separator=", ")
+    
+    def __getitem__(self, index: Union[int, slice] = 0) -> Union[Any, List[Any]]:
+        """
+        Retrieve an item by its index in the linked list.
+
+        This method supports both direct indexing and slicing, allowing access
+        to elements by index or a range of elements.
+
+        Args:
+            index (Union[int, slice]): The index of the item to retrieve, or a slice 
+                                        object for a range of items.
+                                        - If an integer is provided, it retrieves the 
+                                        element at that index.
+                                        - If a slice object is provided, it returns a 
+                                        list of elements from the start to the stop index 
+                                        (inclusive of start, exclusive of stop).
+
+        Returns:
+            Union[Any, List[Any]]:
+                - If an integer index is provided, returns the element at that index.
+                - If a slice object is provided, returns a list of elements from the 
+                linked list within the specified range.
+
+        Raises:
+            IndexError: If the index is out of range.
+        
+        Example:
+            >>> ll = LinkedList()
+            >>> for i in range(1, 11):
+            >>>     ll.append(i)
+            >>> ll[2]
+            3
+            >>> ll[2:5]
+            [3, 4, 5]
+        """
+        if isinstance(index, int): 
+            # Check if index is valid (within the range)
+            if not (0 <= index < self.size() or -self.size() <= index < 0):
+                raise IndexError(f"{index} is out of range.")
+            
+            if index == -1: 
+                return self.tail.data
+            
+            if index == 0: 
+                return self.head.data
+            
+            if index < 0:
+                index = self.size() + index
+
+            return self._get_node(index).data
+        else: # Handle slicing
+            
+            if index.step: 
+                raise NotImplementedError
+             
+            start = index.start
+            stop = index.stop
+            
+            # Edge case
+            if start > 0 and stop > 0 and start > stop: 
+                return []
+                        
+            if start < 0:
+                start = self.size() + start
+            
+            if stop < 0: 
+                stop = self.size() + stop
+                
+            starting_index = min(start, stop)
+            ending_index = max(start, stop)
+            
+            position = 0
+            current = self.head
+            items = []
+            
+            while current and position < starting_index: 
+                current = current.next
+                position += 1
+                
+            if not current or not current.next: 
+                return items
+            
+            while current and position <= ending_index: 
+                items.append(current.data)
+                current = current.next
+                position += 1
+                
+            return items[:-1] if start < stop else items[::-1]
+            # ll[-2:-5] == [9, 8, 7, 6] "<=" in while and [-1] - corner case
+
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        """
+        Delete an item by its index, or every item selected by a slice.
+
+        Slices follow the same rules as for Python lists, including steps, and
+        are deleted in a single walk that starts at the first selected node.
+
+        Args:
+            index (Union[int, slice]): The index or slice of the items to delete.
+
+        Raises:
+            IndexError: If an integer index is out of range.
+        """
+        if isinstance(index, int):
+            self.pop(index)
+            return
+
+        positions = range(*index.indices(self.size()))
+        if positions.step < 0:
+            positions = positions[::-1]
+        if not positions:
+            return
+
+        current = self._get_node(positions[0])
+        for remaining in reversed(range(len(positions))):
+            following = current
+            if remaining:  # Hop to the next selected node before unlinking this one
+                for _ in range(positions.step):
+                    following = following.next
+            self._unlink(current)
+            current = following
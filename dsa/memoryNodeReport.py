@@ -0,0 +1,63 @@
+from .linkedList import LinkedList
+from .node import Node, WeakrefNode
+from .unorderedList import UnorderedList
+from .stack import Stack
+from .queue import Queue
+from .deque import Deque
+import tracemalloc
+
+LIST_SIZE = 100_000
+
+
+class DictNode:
+    """The Node layout before __slots__, with a per-instance __dict__."""
+    def __init__(self, item=None, next=None, prev=None):
+        self.data = item
+        self.next = next
+        self.prev = prev
+
+
+def bytes_per_element(container, add: str) -> float:
+    """Return the traced bytes allocated per element added to the container."""
+    tracemalloc.start()
+    instance = container()
+    add_item = getattr(instance, add)
+    for _ in range(LIST_SIZE):
+        add_item(None)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size / LIST_SIZE
+
+
+containers = [
+    ("UnorderedList", UnorderedList, "append"),
+    ("Stack", Stack, "push"),
+    ("Queue", Queue, "enqueue"),
+    ("Deque", Deque, "add_rear"),
+]
+node_types = [("dict", DictNode), ("slots", Node), ("weakref", WeakrefNode)]
+
+print(f"{'container':16s}" + "".join(f"{name:>12s}" for name, _ in node_types))
+
+for name, container, add in containers:
+    results = []
+    for _, node_type in node_types:
+        LinkedList.node_type = node_type
+        results.append(bytes_per_element(container, add))
+    print(f"{name:16s}" + "".join(f"{result:>12.1f}" for result in results))
+
+LinkedList.node_type = Node
+
+
+output = """
+container               dict       slots     weakref
+UnorderedList           96.0        56.0        64.0
+Stack                   96.0        56.0        64.0
+Queue                   96.0        56.0        64.0
+Deque                   96.0        56.0        64.0
+
+Bytes are the container overhead per element (payloads are all None).
+On Python 3.11 the __dict__ values are already stored inline, so the saving
+is about 40% rather than 3x; older interpreters allocate a separate dict per
+node and gain much more. The weakref slot adds 8 bytes per element.
+"""
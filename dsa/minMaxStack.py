@@ -0,0 +1,52 @@
+from typing import Any
+from .stack import Stack
+
+class MinMaxStack(Stack):
+    """A stack that also reports its smallest and largest items in O(1).
+
+    Two auxiliary stacks hold the running minimum and maximum. A pushed
+    item goes onto one of them only if it ties or beats the extreme on
+    top, and a popped item leaves it only if it is that extreme, so the
+    top of each auxiliary stack is always the extreme of the whole stack.
+
+    Operations: push, pop, peek, get_min, get_max, is_empty, size.
+    """
+
+    def __init__(self, backend: str = "linked") -> None:
+        """Create a new stack and its auxiliary stacks.
+
+        Args:
+            backend (str): The storage for the items, a key of STORAGE_BACKENDS.
+        """
+        super().__init__(backend)
+        self._mins = Stack(backend)
+        self._maxes = Stack(backend)
+
+    def push(self, item: Any) -> None:
+        """Add an item to the stack, recording it if it is a new extreme."""
+        super().push(item)
+        if self._mins.is_empty() or not self._mins.peek() < item:
+            self._mins.push(item)
+        if self._maxes.is_empty() or not item < self._maxes.peek():
+            self._maxes.push(item)
+
+    def pop(self) -> Any:
+        """Remove and return the top item from the stack."""
+        item = super().pop()
+        if not self._mins.peek() < item:
+            self._mins.pop()
+        if not item < self._maxes.peek():
+            self._maxes.pop()
+        return item
+
+    def get_min(self) -> Any:
+        """Return the smallest item in the stack."""
+        if self.is_empty():
+            raise IndexError("get_min from empty stack.")
+        return self._mins.peek()
+
+    def get_max(self) -> Any:
+        """Return the largest item in the stack."""
+        if self.is_empty():
+            raise IndexError("get_max from empty stack.")
+        return self._maxes.peek()
@@ -0,0 +1,49 @@
+from typing import Any
+
+class Node:
+    """A class representing a node in a doubly linked list.
+    
+    Nodes use __slots__ instead of a per-instance __dict__, which keeps
+    every element of the linked containers down to three references.
+    """
+    __slots__ = ("data", "next", "prev")
+
+    def __init__(self, item: Any = None, 
+                 next: 'Node' = None,
+                 prev: 'Node' = None): 
+        """
+        Initializes a new Node.
+
+        Args:
+            item (Any): The data to store in the node.
+            next (Node): A reference to the next node in the list (default is None).
+            prev (Node): A reference to the previous node in the list (default is None).
+        """
+        self.data = item
+        self.next = next
+        self.prev = prev
+
+
+class WeakrefNode(Node):
+    """A Node that can be the target of a weak reference.
+    
+    Costs one extra slot per element, so it is only used by lists that
+    opt in through LinkedList.node_type.
+    """
+    __slots__ = ("__weakref__",)
+
+
+class CountedNode(Node):
+    """A Node that counts how often a search has found it.
+    
+    Used by self-organizing lists in "count" mode, which keep nodes in
+    order of decreasing hits.
+    """
+    __slots__ = ("hits",)
+
+    def __init__(self, item: Any = None,
+                 next: 'Node' = None,
+                 prev: 'Node' = None):
+        """Initializes a new CountedNode with no hits."""
+        super().__init__(item, next, prev)
+        self.hits = 0
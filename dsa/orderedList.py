@@ -0,0 +1,108 @@
+from typing import Any, Iterable
+from .linkedList import LinkedList
+from .node import Node
+
+class OrderedList(LinkedList): 
+    """A class that implements an ordered linked list, inheriting from the LinkedList class.
+    
+    Operations: remove, search, is_empty, size, append, index, insert, pop
+                add, add_many, merge
+    """
+    def __init__(self, indexed: bool = False): 
+        super().__init__(indexed)
+
+    def add(self, item: Any) -> None: 
+        """
+        Adds an item to the ordered linked list while maintaining the sorted order.
+
+        Args:
+            item (Any): The item to insert into the list. It is assumed that the list
+                        supports comparison between elements to determine the order.
+        """
+        new_node = self.node_type(item)
+        self.count += 1
+        self._version += 1
+        self._index_node(new_node)
+        
+        # Case 1: Empty list
+        if not self.head: 
+            self.head = self.tail = new_node
+            return
+        
+        # Traverse the list to find the correct position
+        current = self.head
+        while current and current.data < item: 
+            current = current.next
+        
+        # Case 2: Insert at the tail (end of the list)
+        if not current: 
+            self.tail.next = new_node
+            new_node.prev = self.tail
+            self.tail = new_node
+        else:
+            # Case 3: Insert in the middle or at the head
+            new_node.next = current
+            new_node.prev = current.prev
+            if current.prev:
+                current.prev.next = new_node
+            else:
+                # If current is the head, update the head
+                self.head = new_node
+            current.prev = new_node
+
+
+
+    def add_many(self, items: Iterable[Any]) -> None:
+        """
+        Adds a batch of items in a single pass over the list.
+
+        The batch is sorted once and its nodes are merged into the existing
+        chain, which costs O(n + k log k) instead of k separate walks.
+
+        Args:
+            items (Iterable[Any]): The items to insert into the list.
+        """
+        self._merge_chain(*self._build_chain(sorted(items)))
+
+
+    def merge(self, other: 'OrderedList') -> None:
+        """
+        Moves every node of another ordered list into this one in O(n + m).
+
+        The nodes are relinked rather than copied, and the other list is left
+        empty.
+
+        Args:
+            other (OrderedList): The ordered list to merge into this one.
+        """
+        self._merge_chain(*self._take_chain(other))
+
+
+    def _merge_chain(self, head: Node, tail: Node, count: int) -> None:
+        """Merge a sorted chain of unlinked nodes into the list in one pass."""
+        if not head:
+            return
+
+        # Incoming nodes go before equal existing ones, as they do in add
+        dummy = last = self.node_type()
+        current, incoming = self.head, head
+        while current and incoming:
+            if current.data < incoming.data:
+                last.next, current.prev = current, last
+                last, current = current, current.next
+            else:
+                last.next, incoming.prev = incoming, last
+                last, incoming = incoming, incoming.next
+
+        if current:
+            last.next, current.prev = current, last
+        elif incoming:
+            last.next, incoming.prev = incoming, last
+            self.tail = tail
+        else:
+            self.tail = last
+
+        self.head = dummy.next
+        self.head.prev = None
+        self.count += count
+        self._version += 1
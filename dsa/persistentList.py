@@ -0,0 +1,91 @@
+from typing import Any, Iterable, Iterator
+
+class PersistentList:
+    """An immutable singly linked cons-list whose versions share their tails.
+
+    Every instance is one cell: a first item, the rest of the list, and the
+    length. cons() returns a new cell that points at the old list, so
+    adding to the front costs O(1) and never changes an existing version.
+    Keeping a snapshot is as cheap as keeping a reference.
+
+    Operations: cons, first, rest, is_empty, size
+    """
+    __slots__ = ("_first", "_rest", "_count")
+
+    def __init__(self, items: Iterable[Any] = ()) -> None:
+        """Build a list holding the given items, with the first item at the front.
+
+        Args:
+            items (Iterable[Any]): The items of the list (default is none).
+        """
+        cell = self._empty()
+        for item in reversed(list(items)):
+            cell = cell.cons(item)
+        self._first, self._rest, self._count = cell._first, cell._rest, cell._count
+
+    @classmethod
+    def _empty(cls) -> 'PersistentList':
+        """Return a new empty list of this class without going through __init__."""
+        cell = cls.__new__(cls)
+        cell._first = cell._rest = None
+        cell._count = 0
+        return cell
+
+    def cons(self, item: Any) -> 'PersistentList':
+        """Return a new list with the item in front of this one, in O(1)."""
+        cell = self.__class__.__new__(self.__class__)
+        cell._first = item
+        cell._rest = self
+        cell._count = self._count + 1
+        return cell
+
+    def first(self) -> Any:
+        """Return the item at the front of the list.
+
+        Raises:
+            IndexError: If the list is empty.
+        """
+        if self._count == 0:
+            raise IndexError("first of an empty list.")
+        return self._first
+
+    def rest(self) -> 'PersistentList':
+        """Return the list without its front item, in O(1).
+
+        Raises:
+            IndexError: If the list is empty.
+        """
+        if self._count == 0:
+            raise IndexError("rest of an empty list.")
+        return self._rest
+
+    def is_empty(self) -> bool:
+        """Check if the list is empty."""
+        return self._count == 0
+
+    def size(self) -> int:
+        """Return the number of items in the list."""
+        return self._count
+
+    def __len__(self) -> int:
+        """Return the number of items in the list."""
+        return self._count
+
+    def __iter__(self) -> Iterator[Any]:
+        """Yield the items from front to back."""
+        cell = self
+        while cell._count:
+            yield cell._first
+            cell = cell._rest
+
+    def __eq__(self, other: Any) -> bool:
+        """Check if two lists hold equal items in the same order."""
+        if not isinstance(other, PersistentList):
+            return NotImplemented
+        return self._count == other._count and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None  # Equality compares contents, which may be unhashable
+
+    def __repr__(self) -> str:
+        """Return a representation of the list with its items in front-to-back order."""
+        return f"{self.__class__.__name__}([{', '.join(map(repr, self))}])"
@@ -0,0 +1,37 @@
+from typing import Any
+from .persistentList import PersistentList
+
+class PersistentStack(PersistentList):
+    """An immutable stack on a cons-list, where every push and pop makes a new version.
+
+    The top of the stack is the front of the list. push and pop are O(1)
+    and return a new stack that shares every item below the top with the
+    old one, so a snapshot is just a reference to the current version.
+
+    Operations: push, pop, peek, is_empty, size.
+    """
+    __slots__ = ()
+
+    def push(self, item: Any) -> 'PersistentStack':
+        """Return a new stack with the item on top."""
+        return self.cons(item)
+
+    def pop(self) -> 'PersistentStack':
+        """Return the stack without its top item; read the item first with peek.
+
+        Raises:
+            IndexError: If the stack is empty.
+        """
+        if self.is_empty():
+            raise IndexError("Pop from empty stack.")
+        return self._rest
+
+    def peek(self) -> Any:
+        """Return the top item of the stack.
+
+        Raises:
+            IndexError: If the stack is empty.
+        """
+        if self.is_empty():
+            raise IndexError("Peek from empty stack.")
+        return self._first
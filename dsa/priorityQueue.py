@@ -0,0 +1,114 @@
+from typing import Any, Iterable, List
+
+class PriorityQueue:
+    """Min-priority queue implementation as an array-backed d-ary heap.
+
+    The heap lives in a Python list: the children of slot i are slots
+    d*i + 1 to d*i + d, and every item is no larger than its children, so
+    the smallest item is at slot 0. A binary heap (arity 2) does the
+    fewest comparisons per pop. A 4-ary heap is half as deep, so a push
+    moves fewer items, but a pop compares four children at every level.
+
+    Operations: push, pop, peek, heapify, is_empty, size.
+    """
+
+    def __init__(self, items: Iterable[Any] = (), arity: int = 2) -> None:
+        """Build a heap from the given items in O(n).
+
+        Args:
+            items (Iterable[Any]): The initial items (default is none).
+            arity (int): The number of children per slot (default is 2).
+        """
+        if arity < 2:
+            raise ValueError("arity must be at least 2.")
+        self.arity = arity
+        self._heap: List[Any] = []
+        self.heapify(items)
+
+    def is_empty(self) -> bool:
+        """Check if the priority queue is empty."""
+        return len(self._heap) == 0
+
+    def size(self) -> int:
+        """Return the number of items in the priority queue."""
+        return len(self._heap)
+
+    def __len__(self) -> int:
+        """Return the number of items in the priority queue."""
+        return len(self._heap)
+
+    def push(self, item: Any) -> None:
+        """Add an item in O(log n)."""
+        self._heap.append(item)
+        self._sift_up(len(self._heap) - 1)
+
+    def pop(self) -> Any:
+        """Remove and return the smallest item in O(d log n / log d).
+
+        Raises:
+            IndexError: If the priority queue is empty.
+        """
+        if not self._heap:
+            raise IndexError("Pop from empty priority queue.")
+        last = self._heap.pop()
+        if not self._heap:
+            return last
+        smallest = self._heap[0]
+        self._heap[0] = last
+        self._sift_down(0)
+        return smallest
+
+    def peek(self) -> Any:
+        """Return the smallest item without removing it.
+
+        Raises:
+            IndexError: If the priority queue is empty.
+        """
+        if not self._heap:
+            raise IndexError("Peek from empty priority queue.")
+        return self._heap[0]
+
+    def heapify(self, items: Iterable[Any]) -> None:
+        """Add every item of an iterable and restore heap order in one O(n) pass.
+
+        Sifting down every parent slot from the last one to the root costs
+        less than n pushes, because most slots sit near the leaves.
+        """
+        self._heap.extend(items)
+        for pos in reversed(range((len(self._heap) - 2) // self.arity + 1)):
+            self._sift_down(pos)
+
+    def _sift_up(self, pos: int) -> None:
+        """Move the item at pos up until its parent is no larger."""
+        heap, arity = self._heap, self.arity
+        item = heap[pos]
+        while pos > 0:
+            parent = (pos - 1) // arity
+            if not item < heap[parent]:
+                break
+            heap[pos] = heap[parent]  # Move the parent down into the hole
+            pos = parent
+        heap[pos] = item
+
+    def _sift_down(self, pos: int) -> None:
+        """Move the item at pos down until none of its children is smaller."""
+        heap, arity = self._heap, self.arity
+        count = len(heap)
+        item = heap[pos]
+        while True:
+            child = arity * pos + 1
+            if child >= count:
+                break
+            if arity == 2:  # The common case; two children need no slice
+                if child + 1 < count and heap[child + 1] < heap[child]:
+                    child += 1
+                smallest = heap[child]
+            else:  # Let min scan the children at C speed
+                children = heap[child:child + arity]
+                smallest = min(children)
+                child += children.index(smallest)
+            if not smallest < item:
+                break
+            heap[pos] = smallest  # Move the smallest child up into the hole
+            pos = child
+        heap[pos] = item
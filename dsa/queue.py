@@ -0,0 +1,63 @@
+from typing import Any, Iterable, List
+from .storageBackends import create_storage
+
+class Queue:
+    """Queue implementation as a doubly linked list, or another storage backend.
+    Assuming front is at index 0 and rear is at index -1.
+    
+    Operations: enqueue, dequeue, enqueue_many, dequeue_many, rotate, size, and is_empty.
+    """
+
+    def __init__(self, backend: str = "linked") -> None:
+        """Initialize the queue with empty storage from the given backend.
+        
+        Args:
+            backend (str): The storage for the items, a key of STORAGE_BACKENDS.
+        """
+        self._items = create_storage(backend)
+        
+    def is_empty(self) -> bool:
+        """Check if the queue is empty."""
+        return len(self._items) == 0
+    
+    def enqueue(self, item: Any) -> None:
+        """Add the given item to the back of the queue."""
+        self._items.append(item)
+        # if rear at start of list
+        # self._items.insert(0, item)
+        
+    def dequeue(self) -> Any:
+        """Remove and return the front element from the queue."""
+        if self.is_empty():
+            raise ValueError("Cannot dequeue from an empty queue.")
+        return self._items.pop(0)
+        # if front at end of list
+        # return self._items.pop()
+    
+    def enqueue_many(self, items: Iterable[Any]) -> None:
+        """Add every item of an iterable to the back of the queue in one operation."""
+        self._items.extend(items)
+
+    def dequeue_many(self, count: int) -> List[Any]:
+        """Remove and return up to count items from the front, front first.
+        
+        The items are detached from the storage in one operation. An empty
+        queue gives an empty list rather than an error, so batch consumers
+        can take whatever has arrived.
+        """
+        return self._items.pop_front_many(count)
+
+    def rotate(self, count: int = 1) -> None:
+        """Move count items from the front to the back, as count enqueue(dequeue()) calls would.
+        
+        The linked backends relink their ends instead of moving items, so
+        this costs O(min(k, n - k)) rather than a dequeue and an enqueue per
+        step. An empty queue is left as it is.
+        """
+        self._items.rotate(-count)
+    
+    def size(self) -> int:
+        """Return the number of items in the queue."""
+        return len(self._items)
+    
+    
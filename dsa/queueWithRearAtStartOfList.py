@@ -0,0 +1,36 @@
+from typing import Any, Iterable, List
+from .queue import Queue
+
+class QueueWithRearAtStartOfList(Queue):
+    """Queue implementation as a list.
+    Assuming front is at index -1 and rear is at index 0.
+    
+    Operations: enqueue, dequeue, size, and is_empty.
+    """
+    def __init__(self, backend: str = "linked") -> None:
+        """Initialize the queue with empty storage from the given backend."""
+        super().__init__(backend)
+
+    def enqueue(self, item: Any) -> None:
+        """Add the given item to the back of the queue."""
+        self._items.insert(0, item)
+        
+    def dequeue(self) -> Any:
+        """Remove and return the front element from the queue."""
+        if self.is_empty():
+            raise ValueError("Cannot dequeue from an empty queue.")
+        return self._items.pop()
+
+    def enqueue_many(self, items: Iterable[Any]) -> None:
+        """Add every item of an iterable to the back of the queue in one operation."""
+        self._items.add_many(items)
+
+    def dequeue_many(self, count: int) -> List[Any]:
+        """Remove and return up to count items from the front, front first."""
+        return self._items.pop_rear_many(count)
+
+    def rotate(self, count: int = 1) -> None:
+        """Move count items from the front to the back, as count enqueue(dequeue()) calls would."""
+        self._items.rotate(count)
+    
+    
@@ -0,0 +1,53 @@
+from typing import Any
+
+class RingBufferQueue:
+    """Queue implementation as a circular buffer.
+
+    Items live in a fixed-size Python list used as a ring: _front is the
+    slot of the front item and the rear wraps around to the start. The
+    buffer doubles when full and halves when it drops to a quarter full,
+    so a queue that hovers around one size does not keep resizing.
+
+    Operations: enqueue, dequeue, size, and is_empty.
+    """
+    MIN_CAPACITY = 8
+
+    def __init__(self) -> None:
+        """Initialize the queue with an empty buffer of the minimum capacity."""
+        self._items = [None] * self.MIN_CAPACITY
+        self._front = 0
+        self._count = 0
+
+    def is_empty(self) -> bool:
+        """Check if the queue is empty."""
+        return self._count == 0
+
+    def enqueue(self, item: Any) -> None:
+        """Add the given item to the back of the queue."""
+        if self._count == len(self._items):
+            self._resize(2 * len(self._items))
+        self._items[(self._front + self._count) % len(self._items)] = item
+        self._count += 1
+
+    def dequeue(self) -> Any:
+        """Remove and return the front element from the queue."""
+        if self._count == 0:
+            raise ValueError("Cannot dequeue from an empty queue.")
+        item = self._items[self._front]
+        self._items[self._front] = None  # Drop the reference so the item can be collected
+        self._front = (self._front + 1) % len(self._items)
+        self._count -= 1
+        if self._count <= len(self._items) // 4 and len(self._items) > self.MIN_CAPACITY:
+            self._resize(len(self._items) // 2)
+        return item
+
+    def size(self) -> int:
+        """Return the number of items in the queue."""
+        return self._count
+
+    def _resize(self, capacity: int) -> None:
+        """Copy the items in queue order into a new buffer of the given capacity."""
+        end = self._front + self._count
+        items = self._items[self._front:end] + self._items[:max(0, end - len(self._items))]
+        self._items = items + [None] * (capacity - self._count)
+        self._front = 0
@@ -0,0 +1,263 @@
+import multiprocessing
+import platform
+import struct
+import time
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from multiprocessing.context import BaseContext
+from queue import Empty, Full
+from typing import Iterator, Optional, Union
+
+# Header layout; the producer and consumer fields sit on separate cache lines
+HEAD_OFFSET = 0        # Bytes consumed so far, written only by consumers
+DEQUEUED_OFFSET = 8    # Records consumed so far, written only by consumers
+TAIL_OFFSET = 64       # Bytes produced so far, written only by producers
+ENQUEUED_OFFSET = 72   # Records produced so far, written only by producers
+DATA_OFFSET = 128
+
+COUNTER_SIZE = 8
+LENGTH = struct.Struct("<I")
+PADDING = 0xFFFFFFFF  # Length marking the unused end of the ring before a wrap
+
+# Machines whose stores become visible to other cores in program order
+ORDERED_STORE_MACHINES = ("x86_64", "amd64", "i386", "i686", "x86")
+
+class SharedMemoryQueue:
+    """A FIFO queue of byte records in shared memory, for passing data between processes.
+
+    Each record is a 4-byte length followed by its payload, written into a
+    ring buffer in a multiprocessing.shared_memory block. A record never
+    straddles the end of the ring, so it can be read in place through a
+    memoryview. The header holds monotonically increasing byte and record
+    counters: producers only write the tail ones and consumers the head ones.
+
+    In "spsc" mode there must be exactly one producer and one consumer
+    process, and no locks are taken. The payload is written before the tail
+    counter that publishes it, which relies on stores becoming visible in
+    order, as they do on x86. In "mpmc" mode producers share one lock and
+    consumers another. Locks are held only for a single attempt, so a
+    blocked caller never keeps a non-blocking one waiting.
+
+    On other machines, such as aarch64, a consumer could see the tail
+    before the payload, so in both modes producers and consumers share one
+    lock, whose acquire and release order the stores. A process must then
+    not enqueue while it holds a dequeue_view.
+
+    The queue is passed to child processes as a Process argument; the child
+    attaches to the same block by name. The creating process should call
+    unlink() once every process is done with the queue.
+
+    Operations: enqueue, dequeue, dequeue_view, size, is_empty, close, unlink
+    """
+
+    def __init__(self, capacity: int = 1 << 20, mode: str = "spsc",
+                 context: Optional[BaseContext] = None) -> None:
+        """Create the shared block with room for capacity bytes of records.
+
+        Args:
+            capacity (int): The size of the ring in bytes (default is 1 MiB).
+            mode (str): "spsc" for one producer and one consumer, or "mpmc".
+            context (BaseContext): The multiprocessing context the processes are
+                started from (default is multiprocessing's default context).
+        """
+        if mode not in ("spsc", "mpmc"):
+            raise ValueError(f"Unknown mode {mode!r}; choose from spsc, mpmc.")
+        self.capacity = capacity
+        self.mode = mode
+        self._shm = shared_memory.SharedMemory(create=True, size=DATA_OFFSET + capacity)
+        self._shm.buf[:DATA_OFFSET] = bytes(DATA_OFFSET)
+        self._buf = self._shm.buf
+        self._counters = self._buf[:DATA_OFFSET].cast("Q")
+        context = context or multiprocessing.get_context()
+        if platform.machine().lower() not in ORDERED_STORE_MACHINES:
+            self._producer_lock = self._consumer_lock = context.Lock()
+        elif mode == "mpmc":
+            self._producer_lock = context.Lock()
+            self._consumer_lock = context.Lock()
+        else:
+            self._producer_lock = self._consumer_lock = None
+
+    def __getstate__(self) -> dict:
+        """Describe the queue for a child process by the name of its block."""
+        return {"name": self._shm.name, "capacity": self.capacity, "mode": self.mode,
+                "producer_lock": self._producer_lock, "consumer_lock": self._consumer_lock}
+
+    def __setstate__(self, state: dict) -> None:
+        """Attach to the block created by the parent process."""
+        self.capacity = state["capacity"]
+        self.mode = state["mode"]
+        self._producer_lock = state["producer_lock"]
+        self._consumer_lock = state["consumer_lock"]
+        # Child processes share the parent's resource tracker, so attaching
+        # does not add a second registration that could unlink the block early
+        self._shm = shared_memory.SharedMemory(name=state["name"])
+        self._buf = self._shm.buf
+        self._counters = self._buf[:DATA_OFFSET].cast("Q")
+
+    def _load(self, offset: int) -> int:
+        """Read a header counter."""
+        return self._counters[offset // COUNTER_SIZE]
+
+    def _store(self, offset: int, value: int) -> None:
+        """Write a header counter.
+
+        The counters are read and written through a memoryview of native
+        unsigned 64-bit items, which copies each one with a single aligned
+        load or store. struct.pack_into would zero the field before writing
+        it, so another process could read a counter as 0.
+        """
+        self._counters[offset // COUNTER_SIZE] = value
+
+    def _try_write(self, data: memoryview) -> bool:
+        """Append one record, given as a memoryview of bytes, if it fits, and report whether it did."""
+        length = data.nbytes
+        record = LENGTH.size + length
+        tail = self._load(TAIL_OFFSET)
+        position = tail % self.capacity
+        padding = self.capacity - position if position + record > self.capacity else 0
+
+        if self.capacity - (tail - self._load(HEAD_OFFSET)) < padding + record:
+            return False
+
+        if padding:
+            if padding >= LENGTH.size:  # Shorter gaps are skipped by the reader unmarked
+                LENGTH.pack_into(self._buf, DATA_OFFSET + position, PADDING)
+            position = 0
+
+        start = DATA_OFFSET + position
+        LENGTH.pack_into(self._buf, start, length)
+        self._buf[start + LENGTH.size:start + record] = data
+        self._store(ENQUEUED_OFFSET, self._load(ENQUEUED_OFFSET) + 1)
+        self._store(TAIL_OFFSET, tail + padding + record)  # Publish the record last
+        return True
+
+    def _try_read(self) -> Optional[tuple]:
+        """Return the (new head, start, length) of the front record, or None if empty."""
+        head = self._load(HEAD_OFFSET)
+        if head == self._load(TAIL_OFFSET):
+            return None
+
+        position = head % self.capacity
+        if self.capacity - position < LENGTH.size:
+            head += self.capacity - position
+            position = 0
+        length = LENGTH.unpack_from(self._buf, DATA_OFFSET + position)[0]
+        if length == PADDING:
+            head += self.capacity - position
+            position = 0
+            length = LENGTH.unpack_from(self._buf, DATA_OFFSET + position)[0]
+
+        start = DATA_OFFSET + position + LENGTH.size
+        return head + LENGTH.size + length, start, length
+
+    def _commit_read(self, head: int) -> None:
+        """Release the front record's bytes to the producers."""
+        self._store(DEQUEUED_OFFSET, self._load(DEQUEUED_OFFSET) + 1)
+        self._store(HEAD_OFFSET, head)
+
+    def _wait(self, attempt, lock, block: bool, timeout: Optional[float]):
+        """Retry an attempt until it succeeds, backing off from yielding to short sleeps.
+
+        The lock, if there is one, is taken for each attempt and released
+        between attempts. It is still held when a successful result is
+        returned, and the caller must release it.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        delay = 0.0
+        while True:
+            if self._acquire(lock, block, deadline):
+                result = attempt()
+                if result:
+                    return result
+                if lock is not None:
+                    lock.release()
+            if not block or (deadline is not None and time.monotonic() >= deadline):
+                return None
+            time.sleep(delay)
+            delay = min(delay * 2 or 1e-6, 1e-3)
+
+    def _acquire(self, lock, block: bool, deadline: Optional[float]) -> bool:
+        """Take a lock, if there is one, giving up at the deadline; report whether it was taken."""
+        if lock is None:
+            return True
+        if not block:
+            return lock.acquire(False)
+        if deadline is None:
+            return lock.acquire()
+        return lock.acquire(True, max(deadline - time.monotonic(), 0))
+
+    def enqueue(self, data: Union[bytes, bytearray, memoryview],
+                block: bool = True, timeout: Optional[float] = None) -> None:
+        """Add a bytes-like record to the back of the queue.
+
+        A memoryview of a typed array is stored as its raw bytes.
+
+        Raises:
+            TypeError: If data is not bytes-like, or is a non-contiguous view.
+            ValueError: If the record can never fit in the ring.
+            Full: If there is no room, or the producer lock is not free, when
+                block is False or the timeout expires.
+        """
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            raise TypeError(f"Expected a bytes-like record, got {type(data).__name__}.")
+        data = memoryview(data).cast("B")
+        if LENGTH.size + data.nbytes > self.capacity:
+            raise ValueError("Record is larger than the queue capacity.")
+
+        if not self._wait(lambda: self._try_write(data), self._producer_lock, block, timeout):
+            raise Full
+        if self._producer_lock is not None:
+            self._producer_lock.release()
+
+    @contextmanager
+    def dequeue_view(self, block: bool = True, timeout: Optional[float] = None) -> Iterator[memoryview]:
+        """Lend the front record as a memoryview of the shared block, without copying.
+
+        The record is removed, and its bytes handed back to the producers,
+        when the with block exits; the view must not be used after that.
+
+        Raises:
+            Empty: If there is no record, or the consumer lock is not free,
+                when block is False or the timeout expires.
+        """
+        front = self._wait(self._try_read, self._consumer_lock, block, timeout)
+        if not front:
+            raise Empty
+        try:
+            head, start, length = front
+            view = self._buf[start:start + length]
+            try:
+                yield view
+            finally:
+                view.release()
+            self._commit_read(head)
+        finally:
+            if self._consumer_lock is not None:
+                self._consumer_lock.release()
+
+    def dequeue(self, block: bool = True, timeout: Optional[float] = None) -> bytes:
+        """Remove and return the front record as bytes.
+
+        Raises:
+            Empty: If there is no record when block is False or the timeout expires.
+        """
+        with self.dequeue_view(block, timeout) as view:
+            return bytes(view)
+
+    def size(self) -> int:
+        """Return the number of records in the queue."""
+        return self._load(ENQUEUED_OFFSET) - self._load(DEQUEUED_OFFSET)
+
+    def is_empty(self) -> bool:
+        """Check if the queue is empty."""
+        return self._load(HEAD_OFFSET) == self._load(TAIL_OFFSET)
+
+    def close(self) -> None:
+        """Detach this process from the shared block."""
+        self._counters.release()
+        self._buf = self._counters = None
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Free the shared block; call once, from the creating process."""
+        self._shm.unlink()
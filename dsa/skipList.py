@@ -0,0 +1,315 @@
+import random
+from typing import Any, Iterator, List, Tuple, Union
+
+MAX_LEVEL = 32
+P = 0.5  # Probability that a node is promoted to the next level
+
+class SkipNode:
+    """A node of a skip list with one forward link and one span per level."""
+    __slots__ = ("data", "next", "span")
+
+    def __init__(self, item: Any, level: int):
+        """
+        Initializes a new SkipNode.
+
+        Args:
+            item (Any): The data to store in the node.
+            level (int): The number of levels the node takes part in.
+        """
+        self.data = item
+        self.next: List['SkipNode'] = [None] * level
+        self.span: List[int] = [0] * level  # Level-0 steps to next[i]
+
+
+class SkipList:
+    """An ordered list backed by an indexable skip list.
+
+    Every forward link records how many items it skips, so the rank of an
+    item and the item at a rank are both found in O(log n) expected time.
+    Offers the same operations as OrderedList.
+
+    Operations: remove, search, is_empty, size, index, pop, add
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty skip list with a single level and a count of 0."""
+        self.head = SkipNode(None, MAX_LEVEL)
+        self.level: int = 1
+        self.count: int = 0
+
+
+    def is_empty(self) -> bool:
+        """Checks if the skip list is empty.
+
+        Returns:
+            bool: True if the list is empty, False otherwise.
+        """
+        return self.count == 0
+
+
+    def size(self) -> int:
+        """Returns the number of elements in the skip list.
+
+        Returns:
+            int: The number of elements in the list.
+        """
+        return self.count
+
+
+    def __len__(self) -> int:
+        """Returns the number of elements in the skip list.
+
+        Returns:
+            int: The number of elements in the list.
+        """
+        return self.size()
+
+
+    def _random_level(self) -> int:
+        """Return a level for a new node, with P chance of each extra level."""
+        level = 1
+        while level < MAX_LEVEL and random.random() < P:
+            level += 1
+        return level
+
+
+    def _find(self, item: Any) -> Tuple[List[SkipNode], int]:
+        """Return the last node before the item on every level and its rank.
+
+        The rank is the number of items smaller than the given item.
+        """
+        update = [self.head] * MAX_LEVEL
+        rank = 0
+        current = self.head
+        for i in reversed(range(self.level)):
+            while current.next[i] and current.next[i].data < item:
+                rank += current.span[i]
+                current = current.next[i]
+            update[i] = current
+        return update, rank
+
+
+    def _find_by_rank(self, index: int) -> List[SkipNode]:
+        """Return the last node before a valid, non-negative index on every level."""
+        update = [self.head] * MAX_LEVEL
+        traversed = 0
+        current = self.head
+        for i in reversed(range(self.level)):
+            while current.next[i] and traversed + current.span[i] <= index:
+                traversed += current.span[i]
+                current = current.next[i]
+            update[i] = current
+        return update
+
+
+    def add(self, item: Any) -> None:
+        """
+        Adds an item to the skip list while maintaining the sorted order.
+
+        Args:
+            item (Any): The item to insert into the list. It is assumed that the list
+                        supports comparison between elements to determine the order.
+        """
+        update = [self.head] * MAX_LEVEL
+        rank = [0] * MAX_LEVEL
+        current = self.head
+        for i in reversed(range(self.level)):
+            rank[i] = rank[i + 1] if i + 1 < self.level else 0
+            while current.next[i] and current.next[i].data < item:
+                rank[i] += current.span[i]
+                current = current.next[i]
+            update[i] = current
+
+        level = self._random_level()
+        if level > self.level:
+            for i in range(self.level, level):
+                self.head.span[i] = self.count  # A new level skips the whole list
+            self.level = level
+
+        new_node = SkipNode(item, level)
+        for i in range(level):
+            new_node.next[i] = update[i].next[i]
+            update[i].next[i] = new_node
+            new_node.span[i] = update[i].span[i] - (rank[0] - rank[i])
+            update[i].span[i] = rank[0] - rank[i] + 1
+
+        # Links above the new node now skip one more item
+        for i in range(level, self.level):
+            update[i].span[i] += 1
+
+        self.count += 1
+
+
+    def _delete(self, node: SkipNode, update: List[SkipNode]) -> Any:
+        """Unlink a node given the last node before it on every level."""
+        for i in range(self.level):
+            if update[i].next[i] is node:
+                update[i].span[i] += node.span[i] - 1
+                update[i].next[i] = node.next[i]
+            else:
+                update[i].span[i] -= 1
+
+        while self.level > 1 and self.head.next[self.level - 1] is None:
+            self.level -= 1
+
+        self.count -= 1
+        return node.data
+
+
+    def search(self, item: Any) -> bool:
+        """Searches for an item in the skip list.
+
+        Args:
+            item (Any): The item to search for in the list.
+
+        Returns:
+            bool: True if the item is found, False otherwise.
+        """
+        candidate = self._find(item)[0][0].next[0]
+        return candidate is not None and candidate.data == item
+
+
+    def __contains__(self, item: Any) -> bool:
+        """Checks if an item is in the skip list."""
+        return self.search(item)
+
+
+    def index(self, item: Any) -> int:
+        """Finds the index of the first occurrence of an item in the skip list.
+
+        Args:
+            item (Any): The item whose index to find.
+
+        Raises:
+            ValueError: If the item is not found in the list.
+
+        Returns:
+            int: The index of the item in the list.
+        """
+        update, rank = self._find(item)
+        candidate = update[0].next[0]
+        if candidate is None or candidate.data != item:
+            raise ValueError(f"{item} is not in list")
+        return rank
+
+
+    def remove(self, item: Any) -> None:
+        """Removes the first occurrence of an item from the skip list.
+
+        Args:
+            item (Any): The item to remove from the list.
+
+        Raises:
+            ValueError: If the item is not found in the list.
+        """
+        update, _ = self._find(item)
+        candidate = update[0].next[0]
+        if candidate is None or candidate.data != item:
+            raise ValueError(f"{item} not found!")
+        self._delete(candidate, update)
+
+
+    def pop(self, index: int = -1) -> Any:
+        """Removes and returns the element at the specified index in the skip list.
+
+        Args:
+            index (int): The index (default is -1) of the element to pop.
+
+        Raises:
+            IndexError: If the index is out of range or the list is empty.
+
+        Returns:
+            Any: The removed item.
+        """
+        if self.is_empty():
+            raise IndexError("Cannot pop from empty list.")
+
+        if not (0 <= index < self.size() or -self.size() <= index < 0):
+            raise IndexError(f"{index} is out of range.")
+
+        if index < 0:
+            index = self.size() + index
+
+        update = self._find_by_rank(index)
+        return self._delete(update[0].next[0], update)
+
+
+    def __iter__(self) -> Iterator[Any]:
+        """Yield the items in sorted order."""
+        current = self.head.next[0]
+        while current:
+            yield current.data
+            current = current.next[0]
+
+
+    def _stringify(self,
+                   items: Iterator[Any],
+                   start: str = "[",
+                   end: str = "]",
+                   separator: str = ", ") -> str:
+        """Return a string representation of the items with custom formatting."""
+        return f"{start}{separator.join(map(str, items))}{end}"
+
+
+    def __str__(self) -> str:
+        """Returns a string representation of the skip list with arrows."""
+        return self._stringify(iter(self), start="Head | ", end=" | Ground", separator=" -> ")
+
+
+    def __repr__(self) -> str:
+        """Returns a detailed representation of the skip list."""
+        return self._stringify(iter(self), start="[", end="]", separator=", ")
+
+
+    def __getitem__(self, index: Union[int, slice] = 0) -> Union[Any, List[Any]]:
+        """
+        Retrieve an item by its index, or a list of items by a slice.
+
+        An integer index is found through the spans in O(log n). Slices follow
+        the same rules as LinkedList.__getitem__.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if isinstance(index, int):
+            if not (0 <= index < self.size() or -self.size() <= index < 0):
+                raise IndexError(f"{index} is out of range.")
+
+            if index < 0:
+                index = self.size() + index
+
+            return self._find_by_rank(index)[0].next[0].data
+        else: # Handle slicing
+
+            if index.step:
+                raise NotImplementedError
+
+            start = index.start
+            stop = index.stop
+
+            # Edge case
+            if start > 0 and stop > 0 and start > stop:
+                return []
+
+            if start < 0:
+                start = self.size() + start
+
+            if stop < 0:
+                stop = self.size() + stop
+
+            starting_index = min(start, stop)
+            ending_index = max(start, stop)
+
+            # Nothing to return when the slice starts at or after the last item
+            position = max(starting_index, 0)
+            if position >= self.size() - 1:
+                return []
+
+            items = []
+            current = self._find_by_rank(position)[0].next[0]
+            while current and position <= ending_index:
+                items.append(current.data)
+                current = current.next[0]
+                position += 1
+
+            return items[:-1] if start < stop else items[::-1]
@@ -0,0 +1,70 @@
+from .blockDeque import BlockDeque
+from typing import Any, Callable, Iterable, Iterator
+import operator
+
+
+def _sliding_window_extreme(items: Iterable[Any], width: int,
+                            dominates: Callable[[Any, Any], bool]) -> Iterator[Any]:
+    """Check the width up front, then return the generator that scans the items."""
+    if width < 1:
+        raise ValueError("width must be at least 1.")
+    return _monotonic_scan(items, width, dominates)
+
+
+def _monotonic_scan(items: Iterable[Any], width: int,
+                    dominates: Callable[[Any, Any], bool]) -> Iterator[Any]:
+    """Yield the extreme of every full window using a monotonic deque.
+
+    The deque holds (position, item) pairs for the items that could still
+    become the extreme of a later window. An item drops every item at the
+    rear that it dominates, so the front is always the current extreme. It
+    expires off the front once it leaves the window. Each item enters and
+    leaves the deque once, so every step costs amortised O(1). BlockDeque
+    is used because its ends are O(1) to read and pop at any length.
+    """
+    window = BlockDeque()
+    for position, item in enumerate(items):
+        while not window.is_empty() and dominates(item, window[-1][1]):
+            window.pop_rear()
+        window.add_rear((position, item))
+
+        if window[0][0] <= position - width:
+            window.pop_front()
+        if position >= width - 1:
+            yield window[0][1]
+
+
+def sliding_window_min(items: Iterable[Any], width: int) -> Iterator[Any]:
+    """Yield the minimum of every window of width consecutive items.
+
+    Works on unbounded streams: the first minimum comes once width items
+    have been seen, then one per further item, with only the candidates
+    for later minimums kept in memory.
+
+    Args:
+        items: The items to scan, which must be mutually comparable.
+        width: The number of items in a window.
+
+    Raises:
+        ValueError: If width is less than 1.
+
+    Returns:
+        An iterator over the window minimums.
+    """
+    return _sliding_window_extreme(items, width, operator.le)
+
+
+def sliding_window_max(items: Iterable[Any], width: int) -> Iterator[Any]:
+    """Yield the maximum of every window of width consecutive items.
+
+    Args:
+        items: The items to scan, which must be mutually comparable.
+        width: The number of items in a window.
+
+    Raises:
+        ValueError: If width is less than 1.
+
+    Returns:
+        An iterator over the window maximums.
+    """
+    return _sliding_window_extreme(items, width, operator.ge)
@@ -0,0 +1,186 @@
+import os
+import pickle
+import shutil
+import tempfile
+import weakref
+from typing import Any, BinaryIO, Iterable, List, Optional
+from .ringBufferQueue import RingBufferQueue
+
+READ_BUFFER = 1 << 20  # Bytes per read from a segment file
+
+class Segment:
+    """An append-only file of pickled chunks of items that are waiting on disk."""
+    __slots__ = ("path", "chunks", "items")
+
+    def __init__(self, path: str):
+        """
+        Initializes a new, empty Segment.
+
+        Args:
+            path (str): The file the chunks are appended to.
+        """
+        self.path = path
+        self.chunks = 0  # Chunks written and not yet read back
+        self.items = 0   # Items in those chunks
+
+
+class SpillingQueue:
+    """A FIFO queue that keeps its front and back in memory and spills the middle to disk.
+
+    New items are kept in memory while the queue is short. Once the front
+    holds memory_items, new items collect in a tail buffer instead, and
+    every chunk_items of them are pickled as one chunk and appended to a
+    segment file. When the front runs dry, the oldest chunk is read back
+    into it. A segment is deleted once it has been read. When the reader
+    catches up with the writer, the queue goes back to keeping everything
+    in memory.
+
+    At most max(memory_items, chunk_items) + chunk_items items are
+    resident, no matter how long the backlog grows. Items must be picklable.
+
+    Operations: enqueue, dequeue, enqueue_many, dequeue_many, size, is_empty,
+                resident_size, spilled_size, close
+    """
+
+    def __init__(self, memory_items: int = 10_000, chunk_items: int = 10_000,
+                 segment_bytes: int = 64 << 20, directory: Optional[str] = None) -> None:
+        """Initialize an empty queue and a private directory for its segments.
+
+        Args:
+            memory_items (int): The number of items kept in memory before spilling starts.
+            chunk_items (int): The number of items written or read per disk access.
+            segment_bytes (int): The size at which a new segment file is started.
+            directory (str): Where to create the segment directory
+                (default is the system temporary directory).
+        """
+        if memory_items < 1 or chunk_items < 1:
+            raise ValueError("memory_items and chunk_items must be at least 1.")
+        self.memory_items = memory_items
+        self.chunk_items = chunk_items
+        self.segment_bytes = segment_bytes
+        self._head = RingBufferQueue()
+        self._tail: List[Any] = []
+        self._segments: List[Segment] = []
+        self._spilled = 0
+        self._writer: Optional[BinaryIO] = None
+        self._reader: Optional[BinaryIO] = None
+        self._next_segment = 0
+        self._directory = tempfile.mkdtemp(prefix="spill-", dir=directory)
+        # Remove the segments even if the queue is dropped without close()
+        self._finalizer = weakref.finalize(self, shutil.rmtree, self._directory, True)
+
+    def is_empty(self) -> bool:
+        """Check if the queue is empty."""
+        return self.size() == 0
+
+    def size(self) -> int:
+        """Return the number of items in the queue."""
+        return self._head.size() + len(self._tail) + self._spilled
+
+    def resident_size(self) -> int:
+        """Return the number of items held in memory."""
+        return self._head.size() + len(self._tail)
+
+    def spilled_size(self) -> int:
+        """Return the number of items waiting in segment files."""
+        return self._spilled
+
+    def enqueue(self, item: Any) -> None:
+        """Add the given item to the back of the queue.
+
+        If the item fills the tail buffer and the chunk cannot be pickled,
+        the item is taken back out and the error is raised, leaving the
+        queue as it was.
+        """
+        if not self._segments and not self._tail and self._head.size() < self.memory_items:
+            self._head.enqueue(item)
+            return
+        self._tail.append(item)
+        if len(self._tail) >= self.chunk_items:
+            try:
+                self._spill()
+            except Exception:
+                self._tail.pop()
+                raise
+
+    def enqueue_many(self, items: Iterable[Any]) -> None:
+        """Add every item of an iterable to the back of the queue."""
+        for item in items:
+            self.enqueue(item)
+
+    def dequeue(self) -> Any:
+        """Remove and return the front element from the queue."""
+        if self._head.is_empty():
+            if self.is_empty():
+                raise ValueError("Cannot dequeue from an empty queue.")
+            self._refill()
+        return self._head.dequeue()
+
+    def dequeue_many(self, count: int) -> List[Any]:
+        """Remove and return up to count items from the front, front first."""
+        items = []
+        while len(items) < count and not self.is_empty():
+            if self._head.is_empty():
+                self._refill()
+            for _ in range(min(count - len(items), self._head.size())):
+                items.append(self._head.dequeue())
+        return items
+
+    def _spill(self) -> None:
+        """Append the tail buffer to the newest segment as one chunk."""
+        # Pickle before touching the file, so a failure leaves no partial chunk
+        chunk = pickle.dumps(self._tail, pickle.HIGHEST_PROTOCOL)
+        if self._writer is None or self._writer.tell() >= self.segment_bytes:
+            if self._writer is not None:
+                self._writer.close()
+            path = os.path.join(self._directory, f"{self._next_segment:08d}.seg")
+            self._next_segment += 1
+            self._segments.append(Segment(path))
+            self._writer = open(path, "ab")
+
+        segment = self._segments[-1]
+        self._writer.write(chunk)
+        self._writer.flush()  # Make the chunk visible to the reader
+        segment.chunks += 1
+        segment.items += len(self._tail)
+        self._spilled += len(self._tail)
+        self._tail = []
+
+    def _refill(self) -> None:
+        """Move the oldest waiting items into the empty front of the queue."""
+        if not self._segments:
+            chunk, self._tail = self._tail, []
+        else:
+            segment = self._segments[0]
+            if self._reader is None:
+                self._reader = open(segment.path, "rb", buffering=READ_BUFFER)
+            chunk = pickle.load(self._reader)
+            segment.chunks -= 1
+            segment.items -= len(chunk)
+            self._spilled -= len(chunk)
+
+            if segment.chunks == 0:  # Every chunk written so far has been read
+                self._reader.close()
+                self._reader = None
+                if segment is self._segments[-1]:
+                    self._writer.close()
+                    self._writer = None
+                os.remove(segment.path)
+                self._segments.pop(0)
+
+        for item in chunk:
+            self._head.enqueue(item)
+
+    def close(self) -> None:
+        """Close the segment files and delete them with their directory."""
+        for handle in (self._reader, self._writer):
+            if handle is not None:
+                handle.close()
+        self._reader = self._writer = None
+        self._finalizer()
+
+    def __enter__(self) -> 'SpillingQueue':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
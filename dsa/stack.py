@@ -0,0 +1,42 @@
+from typing import Any
+from .storageBackends import create_storage
+
+class Stack:
+    """Stack implementation as a Doubly Linked List, or another storage backend.
+    
+    Operations: push, pop, peek, is_empty, size.
+    """
+    
+    def __init__(self, backend: str = "linked") -> None:
+        """Create a new stack.
+        
+        Args:
+            backend (str): The storage for the items, a key of STORAGE_BACKENDS.
+        """
+        self._items = create_storage(backend)
+        
+    def is_empty(self) -> bool:
+        """Check if the stack is empty."""
+        return len(self._items) == 0
+    
+    def push(self, item: Any) -> None:
+        """Add an item to the stack."""
+        self._items.append(item)
+        
+    def pop(self) -> Any:
+        """Remove and return the top item from the stack."""
+        if self.is_empty():
+            raise IndexError("Pop from empty stack.")
+        return self._items.pop()
+    
+    def peek(self) -> Any:
+        """Return the top item of the stack without removing it."""
+        if self.is_empty():
+            raise IndexError("Peek from empty stack.")
+        return self._items[-1]
+        
+    def size(self) -> int:
+        """Return the number of items in the stack."""
+        return len(self._items)
+    
+    
@@ -0,0 +1,68 @@
+from .arrayLinkedList import ArrayLinkedList
+from .unorderedList import UnorderedList
+from .unrolledUnorderedList import UnrolledUnorderedList
+from typing import Any, Iterable, List
+
+
+class ListStorage(list):
+    """A Python list with the bulk end operations of the linked backends."""
+    __slots__ = ()
+
+    def add_many(self, items: Iterable[Any]) -> None:
+        """Add every item to the beginning of the list, as repeated insert(0, item) would."""
+        self[:0] = list(items)[::-1]
+
+    def pop_front_many(self, count: int) -> List[Any]:
+        """Remove up to count items from the front and return them, front first."""
+        count = max(0, count)
+        items = self[:count]
+        del self[:count]
+        return items
+
+    def pop_rear_many(self, count: int) -> List[Any]:
+        """Remove up to count items from the rear and return them, rear first."""
+        start = len(self) - min(max(0, count), len(self))
+        items = self[start:][::-1]
+        del self[start:]
+        return items
+
+    def rotate(self, count: int = 1) -> None:
+        """Move the last count items to the front, like collections.deque.rotate.
+
+        Both slices are copied, so this is O(n), but at C speed.
+        """
+        if len(self) > 1:
+            count %= len(self)
+            self[:] = self[-count:] + self[:-count]
+
+
+# Sequence types that Stack, Queue and Deque can keep their items in. Each
+# supports append, insert, pop with an index, len and indexing, plus extend,
+# add_many, pop_front_many and pop_rear_many for moving items in batches and
+# rotate for moving items from one end to the other.
+STORAGE_BACKENDS = {
+    "list": ListStorage,
+    "linked": UnorderedList,
+    "array": ArrayLinkedList,
+    "unrolled": UnrolledUnorderedList,
+}
+
+
+def create_storage(backend: str) -> Any:
+    """Return a new, empty storage sequence for the named backend.
+
+    Args:
+        backend: One of the keys of STORAGE_BACKENDS.
+
+    Raises:
+        ValueError: If the backend is not known.
+
+    Returns:
+        An empty sequence of the backend's type.
+    """
+    try:
+        return STORAGE_BACKENDS[backend]()
+    except KeyError:
+        raise ValueError(
+            f"Unknown backend {backend!r}; choose from {', '.join(STORAGE_BACKENDS)}."
+        ) from None
@@ -0,0 +1,84 @@
+from dsa.arrayLinkedList import ArrayLinkedList
+
+
+def test_array_linked_list() -> None:
+    # Create the list object
+    ll = ArrayLinkedList()
+
+    # Add elements to the list
+    for i in range(1, 11):
+        ll.append(i)
+
+    # Test single index access
+    assert ll[0] == 1, "Test failed: Expected 1 at index 0"
+    assert ll[5] == 6, "Test failed: Expected 6 at index 5"
+    assert ll[-1] == 10, "Test failed: Expected 10 at index -1"
+    assert ll[-2] == 9, "Test failed: Expected 9 at index -2"
+
+    # Test out-of-range indices
+    try:
+        ll[11]
+    except IndexError:
+        pass  # Expected to raise IndexError
+
+    try:
+        ll[-11]
+    except IndexError:
+        pass  # Expected to raise IndexError
+
+    # Test slicing (start:stop)
+    assert ll[2:5] == [3, 4, 5], "Test failed: Expected [3, 4, 5] for slice 2:5"
+    assert ll[0:3] == [1, 2, 3], "Test failed: Expected [1, 2, 3] for slice 0:3"
+
+    # Test slicing with negative indices
+    assert ll[-5:-2] == [6, 7, 8], "Test failed: Expected [6, 7, 8] for slice -5:-2"
+
+    # The below is a very important corner case.
+    assert ll[-2:-5] == [9, 8, 7, 6], "Test failed: Expected [9, 8, 7, 6] for slice -2:-5"
+
+    # Test empty list
+    empty_ll = ArrayLinkedList()
+    assert empty_ll[0:2] == [], "Test failed: Expected empty list for slice 0:2 on empty list"
+
+    # Test that freed slots are reused instead of growing the arrays
+    for _ in range(100):
+        ll.append(ll.pop(0))
+    assert len(ll._data) == 10, "Test failed: Expected churn to reuse freed slots"
+    assert repr(ll) == "[1, 2, 3, 4, 5, 6, 7, 8, 9, 10]", "Test failed: Expected order to survive churn"
+
+    # Test remove, insert and search
+    ll.remove(5)
+    ll.insert(2, 42)
+    assert repr(ll) == "[1, 2, 42, 3, 4, 6, 7, 8, 9, 10]", "Test failed: Expected 42 at index 2"
+    assert ll.search(42) and not ll.search(5), "Test failed: Expected search to follow remove/insert"
+    assert ll.index(10) == 9, "Test failed: Expected 10 at index 9"
+
+    # Test the bulk operations at both ends
+    ll.extend([11, 12])
+    ll.add_many([0, -1])
+    assert ll.pop_front_many(3) == [-1, 0, 1], "Test failed: Expected the first three items front first"
+    assert ll.pop_rear_many(2) == [12, 11], "Test failed: Expected the last two items rear first"
+    assert repr(ll) == "[2, 42, 3, 4, 6, 7, 8, 9, 10]", "Test failed: Expected the middle to remain"
+    assert ll.pop_rear_many(20) == [10, 9, 8, 7, 6, 4, 3, 42, 2] and ll.is_empty(), "Test failed: Expected the list drained"
+    ll.extend(range(3))
+    assert repr(ll) == "[0, 1, 2]" and len(ll._data) == 14, "Test failed: Expected freed slots to be reused"
+
+    # Test rotating by relinking, then reusing the freed slots
+    ll = ArrayLinkedList()
+    ll.extend(range(5))
+    ll.rotate(2)
+    assert ll._get_list_items() == [3, 4, 0, 1, 2], "Test failed: Expected the last two items moved to the front"
+    ll.rotate(-4)
+    assert ll._get_list_items() == [2, 3, 4, 0, 1], "Test failed: Expected a left rotation for a negative count"
+    assert ll.pop() == 1 and ll.pop(0) == 2, "Test failed: Expected both ends relinked"
+    ll.rotate(1)
+    ll.append(9)
+    assert ll._get_list_items() == [0, 3, 4, 9], "Test failed: Expected append after the rotated tail"
+
+    # Test inserting past the end of an empty list
+    ll = ArrayLinkedList()
+    ll.insert(3, "x")
+    assert ll._get_list_items() == ["x"] and ll.head == ll.tail != -1, "Test failed: Expected the item to become head and tail"
+    ll.add_many(["b", "a"])
+    ll.extend(["y"])
+    assert ll._get_list_items() == ["a", "b", "x", "y"] and ll.size() == 4, "Test failed: Expected later batches to link correctly"
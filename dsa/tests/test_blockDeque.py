@@ -0,0 +1,44 @@
+from dsa.blockDeque import BlockDeque
+
+
+def test_block_deque() -> None:
+    # Create a deque instance
+    deque = BlockDeque()
+
+    # Test is_empty and size on a new deque
+    assert deque.is_empty() == True, "Deque should be empty initially."
+    assert deque.size() == 0, "Size of the deque should be 0 initially."
+
+    # Test add_front and add_rear together
+    deque.add_front(30)
+    deque.add_rear(40)
+    assert deque.size() == 2, "Size of the deque should be 2 after adding items to front and rear."
+    assert deque.pop_front() == 30, "pop_front should return the item added to the front."
+    assert deque.pop_rear() == 40, "pop_rear should return the item added to the rear."
+
+    # Test growing across several blocks at both ends
+    for i in range(200):
+        deque.add_rear(i)
+        deque.add_front(-i - 1)
+    assert deque.size() == 400, "Size of the deque should be 400 after 400 additions."
+    assert deque[0] == -200 and deque[-1] == 199, "Indexing should reach both ends."
+    assert deque[200] == 0 and deque[150] == -50, "Indexing should cross block boundaries."
+    assert list(deque) == list(range(-200, 200)), "Iteration should run from front to rear."
+
+    # Test draining from both ends
+    assert [deque.pop_front() for _ in range(200)] == list(range(-200, 0)), "pop_front should drain in order."
+    assert [deque.pop_rear() for _ in range(200)] == list(range(199, -1, -1)), "pop_rear should drain in order."
+    assert deque.is_empty() == True, "Deque should be empty after popping all items."
+
+    # Test pop on an empty deque
+    try:
+        deque.pop_front()
+        assert False, "pop_front on an empty deque should raise IndexError."
+    except IndexError:
+        pass
+
+    try:
+        deque.pop_rear()
+        assert False, "pop_rear on an empty deque should raise IndexError."
+    except IndexError:
+        pass
@@ -0,0 +1,85 @@
+import asyncio
+import threading
+from queue import Empty, Full
+from dsa.blockingQueue import AsyncQueue, BlockingQueue
+
+
+def test_blocking_queue() -> None:
+    # Test the blocking queue with producer and consumer threads
+    queue = BlockingQueue(maxsize=2)
+    received = []
+
+    def consume() -> None:
+        for _ in range(100):
+            received.append(queue.get())
+            queue.task_done()
+
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+    for i in range(100):
+        queue.put(i)
+    queue.join()
+    consumer.join()
+    assert received == list(range(100)), "Consumer should receive every item in FIFO order."
+
+    # Test non-blocking and timed operations on a full and an empty queue
+    queue.put(1)
+    queue.put(2)
+    try:
+        queue.put(3, block=False)
+        assert False, "put on a full queue should raise Full."
+    except Full:
+        pass
+    assert queue.get() == 1 and queue.get(timeout=0.01) == 2, "get should return items in FIFO order."
+    try:
+        queue.get(timeout=0.01)
+        assert False, "get on an empty queue should raise Empty after the timeout."
+    except Empty:
+        pass
+
+    # Test the asyncio front end
+    async def exercise_async_queue() -> list:
+        async_queue = AsyncQueue(maxsize=2)
+        results = []
+
+        async def consume_async() -> None:
+            for _ in range(10):
+                results.append(await async_queue.get())
+                async_queue.task_done()
+
+        consumer_task = asyncio.ensure_future(consume_async())
+        for i in range(10):
+            await async_queue.put(i)
+        await async_queue.join()
+        await consumer_task
+        try:
+            await async_queue.get(timeout=0.01)
+            assert False, "get on an empty queue should raise Empty after the timeout."
+        except Empty:
+            pass
+        return results
+
+    assert asyncio.run(exercise_async_queue()) == list(range(10)), "Async consumer should receive every item in order."
+
+    # Test that waiters woken together each wait out their own timeout
+    async def exercise_timed_waiters() -> tuple:
+        async_queue = AsyncQueue(maxsize=1)
+        getters = [asyncio.ensure_future(async_queue.get(timeout=2)) for _ in range(2)]
+        await asyncio.sleep(0)
+        async_queue.put_nowait(1)
+        await asyncio.sleep(0.1)
+        async_queue.put_nowait(2)
+        received = sorted([await getter for getter in getters])
+
+        async_queue.put_nowait(3)
+        putters = [asyncio.ensure_future(async_queue.put(item, timeout=2)) for item in (4, 5)]
+        await asyncio.sleep(0)
+        first = async_queue.get_nowait()
+        await asyncio.sleep(0.1)
+        second = async_queue.get_nowait()
+        await asyncio.gather(*putters)
+        return received, [first, second, async_queue.get_nowait()]
+
+    received, drained = asyncio.run(exercise_timed_waiters())
+    assert received == [1, 2], "Two timed getters should both receive an item."
+    assert drained == [3, 4, 5], "Two timed putters should both add their item."
@@ -0,0 +1,74 @@
+from dsa.deque import Deque
+
+
+def test_deque() -> None:
+    # Create a deque instance
+    deque = Deque()
+
+    # Test is_empty on a new deque
+    assert deque.is_empty() == True, "Deque should be empty initially."
+
+    # Test size on a new deque
+    assert deque.size() == 0, "Size of the deque should be 0 initially."
+
+    # Test add_front operation
+    deque.add_front(10)
+    assert deque.is_empty() == False, "Deque should not be empty after adding an item."
+    assert deque.size() == 1, "Size of the deque should be 1 after adding an item to the front."
+    assert deque.pop_front() == 10, "pop_front should return the item added to the front."
+
+    # Test add_rear operation
+    deque.add_rear(20)
+    assert deque.size() == 1, "Size of the deque should be 1 after adding an item to the rear."
+    assert deque.pop_rear() == 20, "pop_rear should return the item added to the rear."
+
+    # Test add_front and add_rear together
+    deque.add_front(30)
+    deque.add_rear(40)
+    assert deque.size() == 2, "Size of the deque should be 2 after adding items to front and rear."
+    assert deque.pop_front() == 30, "pop_front should return the item added to the front."
+    assert deque.pop_rear() == 40, "pop_rear should return the item added to the rear."
+
+    # Test multiple operations
+    deque.add_rear(50)
+    deque.add_rear(60)
+    deque.add_front(40)
+    deque.add_front(30)
+    assert deque.size() == 4, "Size of the deque should be 4 after multiple additions."
+    assert deque.pop_front() == 30, "pop_front should return the first front item added (30)."
+    assert deque.pop_rear() == 60, "pop_rear should return the last rear item added (60)."
+    assert deque.size() == 2, "Size of the deque should be 2 after two pops."
+    assert deque.pop_front() == 40, "pop_front should return the next front item (40)."
+    assert deque.pop_rear() == 50, "pop_rear should return the next rear item (50)."
+    assert deque.is_empty() == True, "Deque should be empty after popping all items."
+
+    # Test pop on an empty deque
+    try:
+        deque.pop_front()
+        assert False, "pop_front on an empty deque should raise IndexError."
+    except IndexError:
+        pass
+
+    try:
+        deque.pop_rear()
+        assert False, "pop_rear on an empty deque should raise IndexError."
+    except IndexError:
+        pass
+
+    # Test batched operations at both ends
+    deque.add_rear_many([3, 4, 5])
+    deque.add_front_many([2, 1])
+    assert deque.size() == 5, "Size of the deque should be 5 after adding two batches."
+    assert deque.pop_front_many(2) == [1, 2], "pop_front_many should return the front items front first."
+    assert deque.pop_rear_many(2) == [5, 4], "pop_rear_many should return the rear items rear first."
+    assert deque.pop_rear_many(5) == [3] and deque.is_empty() == True, "Deque should be empty after the batches."
+
+    # Test rotating both ways on every backend
+    for backend in ("list", "linked", "array", "unrolled"):
+        deque = Deque(backend)
+        deque.add_rear_many(range(5))
+        deque.rotate(2)
+        assert deque.pop_front_many(5) == [3, 4, 0, 1, 2], f"rotate should move rear items to the front on {backend}."
+        deque.add_rear_many(range(5))
+        deque.rotate(-7)
+        assert deque.pop_front_many(5) == [2, 3, 4, 0, 1], f"A negative rotate should move front items to the rear on {backend}."
@@ -0,0 +1,34 @@
+from dsa.hotPotato import hot_potato, hot_potato_order
+
+
+def test_hot_potato() -> None:
+    # Case 1: Basic test with 6 players, elimination count 7
+    assert hot_potato(["Bill", "David", "Susan", "Jane", "Kent", "Brad"], 7) == "Susan"
+
+    # Case 2: Only 1 person, should return that person
+    assert hot_potato(["Bill"], 7) == "Bill"
+
+    # Case 3: Case with fewer players than the elimination number (elimination count 5)
+    assert hot_potato(["Bill", "David", "Susan", "Jane"], 5) == "Susan"
+
+    # Case 4: Small number of players, simple elimination
+    assert hot_potato(["Alice", "Bob", "Charlie"], 2) == "Bob"
+
+    # Case 5: Larger number of players, elimination count 3
+    assert hot_potato(["John", "Paul", "George", "Ringo", "Mick", "Keith", "Charlie"], 3) == "Paul"
+
+    # Case 6: Edge case where the elimination number equals number of players
+    assert hot_potato(["Anna", "Elsa", "Olaf"], 3) == "Elsa"
+
+    # Case 7: Test with elimination number being 1 (rotate and eliminate each one sequentially)
+    assert hot_potato(["A", "B", "C", "D"], 1) == "A"
+
+    # Case 8: The elimination order ends with the survivor
+    assert hot_potato_order(["Bill", "David", "Susan", "Jane", "Kent", "Brad"], 7) == ["David", "Kent", "Jane", "Bill", "Brad", "Susan"]
+
+    # Case 9: No players
+    try:
+        hot_potato([], 7)
+        assert False, "hot_potato with no players should raise ValueError."
+    except ValueError:
+        pass
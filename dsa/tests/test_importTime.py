@@ -0,0 +1,76 @@
+import importlib
+import os
+import subprocess
+import sys
+import types
+from typing import Dict
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Milliseconds an import statement may add to interpreter startup, best of RUNS
+IMPORT_BUDGETS_MS = {
+    "import dsa": 5,
+    "from dsa import Deque, Queue, Stack": 40,
+}
+RUNS = 3
+
+# Wall-clock budgets depend on the machine, so they are only checked when
+# this variable is set; the module-set checks always run
+BUDGETS_ENV = "DSA_IMPORT_BUDGETS"
+
+# Modules that only the concurrent and spilling structures need
+HEAVY_MODULES = ("asyncio", "concurrent.futures", "multiprocessing", "pickle", "tempfile", "threading")
+
+
+def import_times(statement: str) -> Dict[str, int]:
+    """Run a statement under python -X importtime and return each module's self time in microseconds."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                            cwd=ROOT, capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "[us]" not in line:
+            self_us, _, module = line[len("import time:"):].split("|")
+            times[module.strip()] = int(self_us)
+    return times
+
+
+def added_ms(statement: str) -> float:
+    """Return the best time over RUNS that a statement adds on top of a bare interpreter."""
+    startup = set(import_times("pass"))
+    return min(sum(us for module, us in import_times(statement).items() if module not in startup)
+               for _ in range(RUNS)) / 1000
+
+
+def test_import_dsa_loads_no_modules() -> None:
+    modules = import_times("import dsa")
+    assert "dsa" in modules, "importtime should report the package."
+    assert not [module for module in modules if module.startswith("dsa.")], "import dsa should load no submodule."
+
+
+def test_light_structures_skip_heavy_modules() -> None:
+    modules = import_times("from dsa import Deque, Queue, Stack")
+    assert not [module for module in HEAVY_MODULES if module in modules], \
+        "The basic structures should not import the concurrency or spilling dependencies."
+
+
+@pytest.mark.skipif(not os.environ.get(BUDGETS_ENV), reason=f"set {BUDGETS_ENV}=1 to check import-time budgets")
+def test_import_budgets() -> None:
+    for statement, budget in IMPORT_BUDGETS_MS.items():
+        spent = added_ms(statement)
+        assert spent <= budget, f"{statement!r} took {spent:.1f} ms, over its {budget} ms budget."
+
+
+def test_modules_and_exports_keep_their_names() -> None:
+    import dsa
+    import dsa.queue as queue_module
+    from unittest import mock
+    assert isinstance(queue_module, types.ModuleType) and dsa.Queue is queue_module.Queue, \
+        "import dsa.queue should give the module and dsa.Queue the class."
+    for name, module in dsa._EXPORTS.items():
+        assert name not in dsa._EXPORTS.values(), f"{name!r} should not also name a module."
+        assert getattr(importlib.import_module(f"dsa.{module}"), name) is getattr(dsa, name), \
+            f"dsa.{name} should be the object its module defines."
+    expected = list(dsa.josephus_order(50, 3))
+    with mock.patch("dsa.josephusProblem.LAP_LIMIT", 0):
+        assert list(dsa.josephus_order(50, 3)) == expected, "Patching a module constant should reach the module."
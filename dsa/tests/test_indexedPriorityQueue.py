@@ -0,0 +1,49 @@
+from dsa.indexedPriorityQueue import IndexedPriorityQueue
+
+
+def test_indexed_priority_queue() -> None:
+    # Test push, pop and peek with separate priorities
+    pq = IndexedPriorityQueue()
+    handles = {name: pq.push(name, priority) for name, priority in [("a", 5), ("b", 3), ("c", 8), ("d", 1)]}
+    assert pq.size() == 4 and pq.peek() == "d", "peek should return the item with the smallest priority."
+
+    # Test decrease_key and remove by handle
+    pq.decrease_key(handles["c"], 0)
+    assert pq.peek() == "c", "decrease_key should move the item to the front."
+    assert pq.remove(handles["b"]) == "b" and handles["b"] not in pq, "remove should take the item out by handle."
+    assert [pq.pop() for _ in range(3)] == ["c", "d", "a"], "pop should follow the updated priorities."
+
+    # Test heapify against sorting, with positions kept in step
+    for arity in (2, 4):
+        pq = IndexedPriorityQueue(arity=arity)
+        entries = pq.heapify((i, (i * 7919) % 1000) for i in range(1000))
+        for entry in entries[::3]:
+            pq.decrease_key(entry, entry.priority - 500)
+        for entry in entries[1::7]:
+            pq.remove(entry)
+        assert all(pq._heap[entry.position] is entry for entry in pq._heap), "Every handle should know its slot."
+        expected = sorted(entry.priority for entry in pq._heap)
+        assert [pq._remove_at(0).priority for _ in range(pq.size())] == expected, "Entries should pop in order."
+
+    # Test that initial items are refused, since their handles would be lost
+    try:
+        IndexedPriorityQueue(items=[("a", 1)])
+        assert False, "Initial items should raise TypeError; heapify returns their handles."
+    except TypeError:
+        pass
+
+    # Test invalid handles and priorities
+    stale = pq.push("x", 1)
+    pq.pop()
+    for operation in (lambda: pq.remove(stale), lambda: pq.decrease_key(stale, 0)):
+        try:
+            operation()
+            assert False, "A removed handle should raise ValueError."
+        except ValueError:
+            pass
+    live = pq.push("y", 1)
+    try:
+        pq.decrease_key(live, 2)
+        assert False, "decrease_key to a larger priority should raise ValueError."
+    except ValueError:
+        pass
@@ -0,0 +1,30 @@
+from typing import List
+from dsa.josephusProblem import josephus, josephus_order
+
+
+def test_josephus() -> None:
+    # Test against a direct simulation of the circle
+    def simulate(n: int, k: int) -> List[int]:
+        circle, position, order = list(range(n)), 0, []
+        while circle:
+            position = (position + k - 1) % len(circle)
+            order.append(circle.pop(position))
+        return order
+
+    for n in range(1, 40):
+        for k in (1, 2, 3, 5, 8, 40, 100):
+            expected = simulate(n, k)
+            assert list(josephus_order(n, k)) == expected, f"Elimination order for n={n}, k={k}."
+            assert josephus(n, k) == expected[-1], f"Survivor for n={n}, k={k}."
+
+    # Test a circle large enough to lap many times before switching to the tree
+    assert list(josephus_order(5000, 7)) == simulate(5000, 7), "Long elimination orders should match."
+    assert josephus(41, 3) == 30, "Josephus himself stood at position 30 of 41."
+
+    # Test invalid sizes and counts
+    for n, k in [(0, 3), (5, 0)]:
+        try:
+            josephus_order(n, k)
+            assert False, "josephus_order should raise ValueError for an empty circle or a zero count."
+        except ValueError:
+            pass
@@ -0,0 +1,25 @@
+from dsa.minMaxStack import MinMaxStack
+
+
+def test_min_max_stack() -> None:
+    # Create a stack instance
+    stack = MinMaxStack()
+
+    # Test the extremes while pushing, including duplicates
+    for item, low, high in [(5, 5, 5), (3, 3, 5), (7, 3, 7), (3, 3, 7), (9, 3, 9)]:
+        stack.push(item)
+        assert stack.get_min() == low and stack.get_max() == high, f"Extremes should be {low} and {high} after pushing {item}."
+
+    # Test the extremes while popping back down
+    for item, low, high in [(9, 3, 7), (3, 3, 7), (7, 3, 5), (3, 5, 5)]:
+        assert stack.pop() == item, f"pop should return {item}."
+        assert stack.get_min() == low and stack.get_max() == high, f"Extremes should be {low} and {high} after popping {item}."
+
+    # Test an emptied stack
+    assert stack.pop() == 5 and stack.is_empty() == True, "Stack should be empty after popping all items."
+    for operation in (stack.get_min, stack.get_max, stack.pop):
+        try:
+            operation()
+            assert False, "get_min, get_max and pop on an empty stack should raise IndexError."
+        except IndexError:
+            pass
@@ -0,0 +1,30 @@
+from dsa.orderedList import OrderedList
+
+
+def test_ordered_list() -> None:
+    # Create an ordered list instance
+    ol = OrderedList()
+
+    for item in [31, 77, 17, 93, 26, 54]:
+        ol.add(item)
+
+    assert repr(ol) == "[17, 26, 31, 54, 77, 93]", "Test failed: Expected sorted items"
+    assert ol.size() == 6, "Test failed: Expected size 6 after 6 adds"
+    assert ol[-1] == 93, "Test failed: Expected 93 at index -1"
+    assert ol.pop(0) == 17 and ol.size() == 5, "Test failed: Expected pop to keep the size right"
+
+    # Test bulk adds and merging
+    ol.add_many([60, 10, 95, 31])
+    assert repr(ol) == "[10, 26, 31, 31, 54, 60, 77, 93, 95]", "Test failed: Expected the batch merged in order"
+    assert ol.size() == 9 and ol.tail.data == 95, "Test failed: Expected size and tail to follow add_many"
+
+    other = OrderedList()
+    other.add_many([1, 50, 100])
+    ol.merge(other)
+    assert repr(ol) == "[1, 10, 26, 31, 31, 50, 54, 60, 77, 93, 95, 100]", "Test failed: Expected merged order"
+    assert ol.size() == 12 and ol.tail.data == 100, "Test failed: Expected size and tail to follow merge"
+    assert other.is_empty() and other.size() == 0, "Test failed: Expected merge to empty the other list"
+
+    # Test that operations that would break the order are not inherited
+    assert not hasattr(ol, "rotate"), "Test failed: Expected no rotate on an ordered list"
+    assert not hasattr(ol, "sort"), "Test failed: Expected no sort with key or reverse on an ordered list"
@@ -0,0 +1,28 @@
+from dsa.persistentList import PersistentList
+
+
+def test_persistent_list() -> None:
+    # Test that cons builds new versions without touching old ones
+    empty = PersistentList()
+    assert empty.is_empty() == True and len(empty) == 0, "A new list should be empty."
+
+    one = empty.cons(1)
+    two = one.cons(2)
+    branch = one.cons(3)
+    assert list(two) == [2, 1] and list(branch) == [3, 1], "cons should add to the front of its own version."
+    assert list(one) == [1] and empty.is_empty(), "Older versions should be unchanged."
+    assert two.rest() is one and branch.rest() is one, "Versions should share their tails."
+    assert two.first() == 2 and two.size() == 2, "first and size should describe the version."
+
+    # Test building from an iterable, equality and representation
+    assert PersistentList([2, 1]) == two, "A list built from items should equal one built by cons."
+    assert PersistentList("ab") != PersistentList("ba"), "Order should matter for equality."
+    assert repr(two) == "PersistentList([2, 1])", "repr should list the items front to back."
+
+    # Test first and rest on an empty list
+    for operation in (empty.first, empty.rest):
+        try:
+            operation()
+            assert False, "first and rest of an empty list should raise IndexError."
+        except IndexError:
+            pass
@@ -0,0 +1,30 @@
+from dsa.persistentStack import PersistentStack
+
+
+def test_persistent_stack() -> None:
+    # Create a stack instance
+    stack = PersistentStack()
+
+    # Test is_empty and size on a new stack
+    assert stack.is_empty() == True, "Stack should be empty initially."
+    assert stack.size() == 0, "Size of the stack should be 0 initially."
+
+    # Test push, which leaves the old version alone
+    pushed = stack.push(10).push(20)
+    assert isinstance(pushed, PersistentStack), "push should return a PersistentStack."
+    assert pushed.peek() == 20 and pushed.size() == 2, "Peek should return the last pushed item (20)."
+    assert stack.is_empty() == True, "The original stack should still be empty."
+
+    # Test pop, which returns the version below the top
+    popped = pushed.pop()
+    assert popped.peek() == 10 and popped.size() == 1, "pop should expose the item below the top (10)."
+    assert pushed.peek() == 20, "The version before the pop should keep its top."
+    assert popped.push(30).pop() is popped, "Versions should share the items below the top."
+
+    # Test pop and peek on an empty stack
+    for operation in (stack.pop, stack.peek):
+        try:
+            operation()
+            assert False, "pop and peek on an empty stack should raise IndexError."
+        except IndexError:
+            pass
@@ -0,0 +1,27 @@
+from dsa.priorityQueue import PriorityQueue
+
+
+def test_priority_queue() -> None:
+    # Test push and pop order for binary and 4-ary heaps
+    for arity in (2, 3, 4):
+        pq = PriorityQueue(arity=arity)
+        assert pq.is_empty() == True, "Priority queue should be empty initially."
+        for item in [31, 77, 17, 93, 26, 54, 5, 62, 44, 17]:
+            pq.push(item)
+        assert pq.size() == 10 and pq.peek() == 5, "peek should return the smallest item."
+        assert [pq.pop() for _ in range(10)] == [5, 17, 17, 26, 31, 44, 54, 62, 77, 93], \
+            f"A {arity}-ary heap should pop items in sorted order."
+
+        # Test heapify against sorting
+        items = [(i * 7919) % 1000 for i in range(1000)]
+        pq = PriorityQueue(items, arity=arity)
+        pq.heapify([-1, 2000])
+        assert [pq.pop() for _ in range(1002)] == sorted(items + [-1, 2000]), "heapify should build a valid heap."
+
+    # Test pop and peek on an empty priority queue
+    for operation in (pq.pop, pq.peek):
+        try:
+            operation()
+            assert False, "pop and peek on an empty priority queue should raise IndexError."
+        except IndexError:
+            pass
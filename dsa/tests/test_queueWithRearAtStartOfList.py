@@ -0,0 +1,69 @@
+from dsa.queueWithRearAtStartOfList import QueueWithRearAtStartOfList
+
+
+def test_queue_with_rear_at_start_of_list() -> None:
+    # Create a queue instance
+    queue = QueueWithRearAtStartOfList()
+
+    # Test is_empty on a new queue
+    assert queue.is_empty() == True, "Queue should be empty initially."
+
+    # Test size on a new queue
+    assert queue.size() == 0, "Size of the queue should be 0 initially."
+
+    # Test enqueue operation
+    queue.enqueue(10)
+    assert queue.is_empty() == False, "Queue should not be empty after enqueuing an item."
+    assert queue.size() == 1, "Size of the queue should be 1 after one enqueue."
+
+    queue.enqueue(20)
+    queue.enqueue(30)
+    assert queue.size() == 3, "Size of the queue should be 3 after three enqueues."
+
+    # Test dequeue operation
+    assert queue.dequeue() == 10, "Dequeue should return the first enqueued item (10)."
+    assert queue.size() == 2, "Size of the queue should be 2 after one dequeue."
+
+    assert queue.dequeue() == 20, "Dequeue should return the next enqueued item (20)."
+    assert queue.size() == 1, "Size of the queue should be 1 after another dequeue."
+
+    assert queue.dequeue() == 30, "Dequeue should return the last enqueued item (30)."
+    assert queue.is_empty() == True, "Queue should be empty after dequeuing all items."
+
+    # Test dequeue on an empty queue
+    try:
+        queue.dequeue()
+        assert False, "Dequeue on an empty queue should raise ValueError."
+    except ValueError:
+        pass
+
+    # Test enqueue and dequeue with multiple types
+    queue.enqueue("string")
+    queue.enqueue(42)
+    queue.enqueue(3.14)
+    queue.enqueue({"key": "value"})
+
+    assert queue.size() == 4, "Size of the queue should be 4 after enqueuing multiple items."
+    assert queue.dequeue() == "string", "Dequeue should return the first enqueued item ('string')."
+    assert queue.dequeue() == 42, "Dequeue should return the next enqueued item (42)."
+    assert queue.dequeue() == 3.14, "Dequeue should return the next enqueued item (3.14)."
+    assert queue.dequeue() == {"key": "value"}, "Dequeue should return the last enqueued item (dictionary)."
+    assert queue.is_empty() == True, "Queue should be empty after dequeuing all items."
+
+    # Test enqueue after emptying the queue
+    queue.enqueue(100)
+    queue.enqueue(200)
+    assert queue.size() == 2, "Size of the queue should be 2 after enqueuing items again."
+    assert queue.dequeue() == 100, "Dequeue should return the first item enqueued after resetting (100)."
+    assert queue.dequeue() == 200, "Dequeue should return the second item enqueued after resetting (200)."
+    assert queue.is_empty() == True, "Queue should be empty again after dequeuing all items."
+
+    # Test batched enqueue and dequeue
+    queue.enqueue_many(range(5))
+    assert queue.dequeue_many(3) == [0, 1, 2], "dequeue_many should return the front items in order."
+    assert queue.dequeue_many(3) == [3, 4], "dequeue_many should return the remaining items when fewer are left."
+
+    # Test rotating the front to the back
+    queue.enqueue_many(["Bill", "David", "Susan", "Jane"])
+    queue.rotate(6)
+    assert queue.dequeue_many(4) == ["Susan", "Jane", "Bill", "David"], "rotate should match repeated enqueue(dequeue())."
@@ -0,0 +1,30 @@
+from dsa.ringBufferQueue import RingBufferQueue
+
+
+def test_ring_buffer_queue() -> None:
+    # Create a queue instance
+    queue = RingBufferQueue()
+
+    # Test is_empty on a new queue
+    assert queue.is_empty() == True, "Queue should be empty initially."
+
+    # Test size on a new queue
+    assert queue.size() == 0, "Size of the queue should be 0 initially."
+
+    # Test enqueue and dequeue across a wrap-around and a resize
+    for i in range(6):
+        queue.enqueue(i)
+    assert queue.dequeue() == 0 and queue.dequeue() == 1, "Dequeue should return items in FIFO order."
+    for i in range(6, 20):
+        queue.enqueue(i)
+    assert queue.size() == 18, "Size of the queue should be 18 after growing."
+    assert [queue.dequeue() for _ in range(18)] == list(range(2, 20)), "Growing should keep FIFO order."
+    assert len(queue._items) == RingBufferQueue.MIN_CAPACITY, "Buffer should shrink back after draining."
+    assert queue.is_empty() == True, "Queue should be empty after dequeuing all items."
+
+    # Test dequeue on an empty queue
+    try:
+        queue.dequeue()
+        assert False, "Dequeue on an empty queue should raise ValueError."
+    except ValueError:
+        pass
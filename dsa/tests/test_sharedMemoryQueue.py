@@ -0,0 +1,138 @@
+from array import array
+from queue import Empty, Full
+from unittest import mock
+import multiprocessing
+import threading
+import time
+from dsa.sharedMemoryQueue import SharedMemoryQueue
+
+PRODUCERS, CONSUMERS, RECORDS = 2, 2, 500
+
+
+def produce(queue: SharedMemoryQueue, producer: int) -> None:
+    for i in range(RECORDS):
+        queue.enqueue(b"%d:%d" % (producer, i))
+
+
+def consume(queue: SharedMemoryQueue, results: multiprocessing.Queue) -> None:
+    received = []
+    while True:
+        record = queue.dequeue()
+        if not record:  # An empty record tells the consumer to stop
+            break
+        received.append(record)
+    results.put(received)
+
+
+def test_shared_memory_queue() -> None:
+    # Test FIFO order, wrap-around and the zero-copy read path in one process
+    queue = SharedMemoryQueue(capacity=64)
+
+    assert queue.is_empty() == True, "Queue should be empty initially."
+    for i in range(20):
+        queue.enqueue(b"x" * i)
+        queue.enqueue(bytearray(b"record %d" % i))
+        assert queue.size() == 2, "Size of the queue should be 2 after two enqueues."
+        assert queue.dequeue() == b"x" * i, "Dequeue should return the first record."
+        with queue.dequeue_view() as view:
+            assert view == b"record %d" % i, "The view should hold the second record."
+    assert queue.is_empty() == True, "Queue should be empty after dequeuing all records."
+    queue.close()
+    queue.unlink()
+
+    # Test a full and an empty queue without blocking
+    queue = SharedMemoryQueue(capacity=64)
+    while True:
+        try:
+            queue.enqueue(b"0123456789", block=False)
+        except Full:
+            break
+    assert queue.size() == 4, "Four 14-byte records should fit in 64 bytes."
+    for _ in range(4):
+        queue.dequeue(block=False)
+    try:
+        queue.dequeue(timeout=0.001)
+        assert False, "Dequeue on an empty queue should raise Empty after the timeout."
+    except Empty:
+        pass
+
+    queue.close()
+    queue.unlink()
+
+    # Test records holding typed arrays, which are stored as their raw bytes
+    queue = SharedMemoryQueue(capacity=64)
+    queue.enqueue(memoryview(array("q", [1, -2, 3])))
+    assert queue.dequeue() == array("q", [1, -2, 3]).tobytes(), "A typed view should be stored byte for byte."
+    queue.close()
+    queue.unlink()
+
+    # Test that machines without ordered stores share one lock in spsc mode
+    with mock.patch("dsa.sharedMemoryQueue.platform.machine", return_value="aarch64"):
+        queue = SharedMemoryQueue(capacity=64)
+    assert queue._producer_lock is not None and queue._producer_lock is queue._consumer_lock, \
+        "Producers and consumers should share a lock."
+    queue.enqueue(b"locked")
+    assert queue.dequeue(block=False) == b"locked", "The locked queue should still pass records."
+    queue.close()
+    queue.unlink()
+
+
+def test_shared_memory_queue_mpmc() -> None:
+    # Test several producer and consumer processes; every record arrives exactly once
+    queue = SharedMemoryQueue(capacity=256, mode="mpmc")
+    results = multiprocessing.Queue()
+    consumers = [multiprocessing.Process(target=consume, args=(queue, results)) for _ in range(CONSUMERS)]
+    producers = [multiprocessing.Process(target=produce, args=(queue, producer)) for producer in range(PRODUCERS)]
+    for process in consumers + producers:
+        process.start()
+    for process in producers:
+        process.join(30)
+    for _ in consumers:
+        queue.enqueue(b"")
+    received = [record for _ in consumers for record in results.get(timeout=30)]
+    for process in consumers:
+        process.join(30)
+
+    expected = [b"%d:%d" % (producer, i) for producer in range(PRODUCERS) for i in range(RECORDS)]
+    assert len(received) == len(expected), "Every record should be dequeued once."
+    assert sorted(received) == sorted(expected), "No record should be lost or duplicated."
+    assert queue.is_empty() and queue.size() == 0, "Queue should be empty after the consumers stop."
+
+    # Test that non-blocking calls return while another caller blocks
+    dequeued = []
+    waiter = threading.Thread(target=lambda: dequeued.append(queue.dequeue()))
+    waiter.start()
+    start = time.monotonic()
+    for operation in (lambda: queue.dequeue(block=False), lambda: queue.dequeue(timeout=0.01)):
+        try:
+            operation()
+            assert False, "Dequeue on an empty queue should raise Empty."
+        except Empty:
+            pass
+    assert time.monotonic() - start < 1, "A blocked consumer should not hold up a non-blocking one."
+    queue.enqueue(b"wake")
+    waiter.join(5)
+    assert dequeued == [b"wake"], "The blocked consumer should receive the record."
+
+    while True:
+        try:
+            queue.enqueue(b"0123456789", block=False)
+        except Full:
+            break
+    waiter = threading.Thread(target=queue.enqueue, args=(b"0123456789",))
+    waiter.start()
+    start = time.monotonic()
+    for operation in (lambda: queue.enqueue(b"0123456789", block=False),
+                      lambda: queue.enqueue(b"0123456789", timeout=0.01)):
+        try:
+            operation()
+            assert False, "Enqueue on a full queue should raise Full."
+        except Full:
+            pass
+    assert time.monotonic() - start < 1, "A blocked producer should not hold up a non-blocking one."
+    queue.dequeue()
+    waiter.join(5)
+    assert not waiter.is_alive(), "The blocked producer should finish once there is room."
+
+    queue.close()
+    queue.unlink()
@@ -0,0 +1,28 @@
+from dsa.skipList import SkipList
+
+
+def test_skip_list() -> None:
+    # Create a skip list instance
+    sl = SkipList()
+
+    for item in [31, 77, 17, 93, 26, 54, 5, 62, 44, 17]:
+        sl.add(item)
+
+    assert repr(sl) == "[5, 17, 17, 26, 31, 44, 54, 62, 77, 93]", "Test failed: Expected sorted items"
+    assert sl.size() == 10, "Test failed: Expected size 10 after 10 adds"
+    assert sl[0] == 5 and sl[4] == 31 and sl[-1] == 93, "Test failed: Expected rank lookups to match"
+    assert sl[2:5] == [17, 26, 31], "Test failed: Expected [17, 26, 31] for slice 2:5"
+    assert sl.index(17) == 1, "Test failed: Expected the first 17 at index 1"
+    assert sl.search(44) and not sl.search(45), "Test failed: Expected search to find 44 only"
+
+    sl.remove(17)
+    assert sl.index(17) == 1, "Test failed: Expected the remaining 17 at index 1"
+    assert sl.pop(0) == 5, "Test failed: Expected pop(0) to return the smallest item"
+    assert sl.pop() == 93, "Test failed: Expected pop() to return the largest item"
+    assert sl.size() == 7, "Test failed: Expected size 7 after remove and two pops"
+
+    try:
+        sl.remove(100)
+        assert False, "Removing a missing item should raise ValueError."
+    except ValueError:
+        pass
@@ -0,0 +1,22 @@
+from dsa.slidingWindow import sliding_window_max, sliding_window_min
+
+
+def test_sliding_window() -> None:
+    # Test against rescanning every window
+    readings = [(i * 7919) % 101 for i in range(500)]
+    for width in (1, 2, 7, 50, 500):
+        windows = [readings[i:i + width] for i in range(len(readings) - width + 1)]
+        assert list(sliding_window_min(readings, width)) == [min(w) for w in windows], f"Minimums for width {width}."
+        assert list(sliding_window_max(readings, width)) == [max(w) for w in windows], f"Maximums for width {width}."
+
+    # Test a stream that is shorter than the window and one that never ends
+    assert list(sliding_window_min([3, 1], 3)) == [], "A short stream should yield no full window."
+    stream = sliding_window_max(iter(int, 1), 4)  # An endless stream of zeros
+    assert [next(stream) for _ in range(3)] == [0, 0, 0], "An unbounded stream should yield lazily."
+
+    # Test an invalid width
+    try:
+        sliding_window_min(readings, 0)
+        assert False, "A width of 0 should raise ValueError."
+    except ValueError:
+        pass
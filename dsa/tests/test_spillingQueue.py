@@ -0,0 +1,50 @@
+import os
+import pickle
+from dsa.spillingQueue import SpillingQueue
+
+
+def test_spilling_queue() -> None:
+    # Test FIFO order across memory, several segments and the tail buffer
+    queue = SpillingQueue(memory_items=4, chunk_items=3, segment_bytes=32)
+
+    assert queue.is_empty() == True, "Queue should be empty initially."
+    for i in range(20):
+        queue.enqueue(i)
+    assert queue.size() == 20, "Size of the queue should be 20 after 20 enqueues."
+    assert queue.spilled_size() == 15, "Five chunks of three items should be on disk."
+    assert queue.resident_size() == 5, "The front and the tail buffer should stay in memory."
+    assert len(os.listdir(queue._directory)) > 1, "Small segments should roll over into new files."
+
+    assert [queue.dequeue() for _ in range(10)] == list(range(10)), "Dequeue should return items in FIFO order."
+    queue.enqueue_many(range(20, 30))
+    assert queue.dequeue_many(100) == list(range(10, 30)), "dequeue_many should drain the rest in order."
+    assert queue.is_empty() == True, "Queue should be empty after dequeuing all items."
+    assert os.listdir(queue._directory) == [], "Read segments should be deleted."
+
+    # Test that a drained queue returns to memory and that close removes the directory
+    queue.enqueue("x")
+    assert queue.spilled_size() == 0 and queue.dequeue() == "x", "A short queue should stay in memory."
+    directory = queue._directory
+    queue.close()
+    assert not os.path.exists(directory), "close should delete the segment directory."
+
+    # Test dequeue on an empty queue
+    with SpillingQueue() as queue:
+        try:
+            queue.dequeue()
+            assert False, "Dequeue on an empty queue should raise ValueError."
+        except ValueError:
+            pass
+
+    # Test that an item that cannot be pickled leaves the queue usable
+    with SpillingQueue(memory_items=2, chunk_items=2) as queue:
+        queue.enqueue_many(range(3))
+        try:
+            queue.enqueue(lambda: None)
+            assert False, "Enqueueing an unpicklable item should raise."
+        except (pickle.PicklingError, AttributeError, TypeError):
+            pass
+        assert queue.size() == 3 and queue.spilled_size() == 0, "The failed enqueue should have no effect."
+        queue.enqueue_many(range(3, 10))
+        assert queue.spilled_size() == 8, "Later chunks should still spill."
+        assert queue.dequeue_many(100) == list(range(10)), "Every other item should come back in order."
@@ -0,0 +1,40 @@
+from collections import deque
+from dsa.storageBackends import STORAGE_BACKENDS, create_storage
+
+
+def test_storage_backends() -> None:
+    # Test that every backend creates an empty sequence of its type
+    for name, backend in STORAGE_BACKENDS.items():
+        storage = create_storage(name)
+        assert type(storage) is backend and len(storage) == 0, f"{name} should create an empty {backend.__name__}."
+
+    # Test that every backend moves batches in the same order as single operations
+    for name in STORAGE_BACKENDS:
+        storage = create_storage(name)
+        storage.extend([3, 4, 5])
+        storage.add_many([2, 1])
+        assert [storage[i] for i in range(5)] == [1, 2, 3, 4, 5], f"{name} should add batches at both ends."
+        assert storage.pop_front_many(2) == [1, 2], f"{name} should pop a batch front first."
+        assert storage.pop_rear_many(2) == [5, 4], f"{name} should pop a batch rear first."
+        assert storage.pop_front_many(0) == [] and storage.pop_rear_many(9) == [3], f"{name} should clamp batch sizes."
+        assert len(storage) == 0, f"{name} should be empty after draining."
+
+    # Test that every backend rotates like collections.deque
+    for name in STORAGE_BACKENDS:
+        for count in (0, 1, 3, -2, 11):
+            storage = create_storage(name)
+            storage.extend(range(7))
+            storage.rotate(count)
+            expected = deque(range(7))
+            expected.rotate(count)
+            assert [storage[i] for i in range(7)] == list(expected), f"{name} should rotate by {count}."
+        storage = create_storage(name)
+        storage.rotate(5)
+        assert len(storage) == 0, f"{name} should rotate an empty sequence without error."
+
+    # Test an unknown backend
+    try:
+        create_storage("tree")
+        assert False, "An unknown backend should raise ValueError."
+    except ValueError:
+        pass
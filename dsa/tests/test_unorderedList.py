@@ -0,0 +1,162 @@
+from dsa.linkedList import LinkedList
+from dsa.unorderedList import UnorderedList
+
+
+def test_unordered_list() -> None:
+    # Create the LinkedList object
+    ll = UnorderedList()
+
+    # Add elements to the linked list
+    for i in range(1, 11):
+        ll.append(i)
+
+    # Test single index access
+    assert ll[0] == 1, "Test failed: Expected 1 at index 0"
+    assert ll[5] == 6, "Test failed: Expected 6 at index 5"
+    assert ll[-1] == 10, "Test failed: Expected 10 at index -1"
+    assert ll[-2] == 9, "Test failed: Expected 9 at index -2"
+
+    # Test out-of-range indices
+    try:
+        ll[11]
+    except IndexError:
+        pass  # Expected to raise IndexError
+
+    try:
+        ll[-11]
+    except IndexError:
+        pass  # Expected to raise IndexError
+
+    # Test slicing (start:stop)
+    assert ll[2:5] == [3, 4, 5], "Test failed: Expected [3, 4, 5] for slice 2:5"
+    assert ll[0:3] == [1, 2, 3], "Test failed: Expected [1, 2, 3] for slice 0:3"
+
+    # Test slicing with reverse order (start > stop)
+    # assert ll[5:2] == [6, 5, 4], "Test failed: Expected [6, 5, 4] for slice 5:2"
+
+    # Test slicing with negative indices
+    assert ll[-5:-2] == [6, 7, 8], "Test failed: Expected [6, 7, 8] for slice -5:-2"
+
+    # The below is a very important corner case.
+    assert ll[-2:-5] == [9, 8, 7, 6], "Test failed: Expected [9, 8, 7, 6] for slice -2:-5"
+
+    # Test empty list
+    empty_ll = LinkedList()
+    assert empty_ll[0:2] == [], "Test failed: Expected empty list for slice 0:2 on empty list"
+
+    # Test iteration in both directions and membership
+    assert list(ll) == list(range(1, 11)), "Test failed: Expected iteration from head to tail"
+    assert list(reversed(ll)) == list(range(10, 0, -1)), "Test failed: Expected iteration from tail to head"
+    assert 7 in ll and 11 not in ll, "Test failed: Expected 7 in list and 11 not in list"
+
+    # Test that mutating the list while iterating is detected
+    try:
+        for item in ll:
+            ll.append(item)
+        assert False, "Mutation during iteration should raise RuntimeError."
+    except RuntimeError:
+        pass
+
+    # Test the optional hash index with duplicate values
+    indexed_ll = UnorderedList(indexed=True)
+    for item in [5, 3, 5, 8, 3]:
+        indexed_ll.append(item)
+    assert indexed_ll.search(8) and not indexed_ll.search(4), "Test failed: Expected search to use the index"
+    assert indexed_ll.index(3) == 1, "Test failed: Expected the first 3 at index 1"
+    indexed_ll.remove(5)
+    assert repr(indexed_ll) == "[3, 5, 8, 3]", "Test failed: Expected remove to drop the first 5"
+    assert indexed_ll.index(5) == 1, "Test failed: Expected the remaining 5 at index 1"
+    indexed_ll.pop(1)
+    assert not indexed_ll.search(5), "Test failed: Expected pop to update the index"
+
+    # Test the single-traversal bulk operations
+    bulk_ll = UnorderedList()
+    bulk_ll.extend(range(10))
+    del bulk_ll[2:8:2]
+    assert repr(bulk_ll) == "[0, 1, 3, 5, 7, 8, 9]", "Test failed: Expected del [2:8:2] to drop 2, 4 and 6"
+    del bulk_ll[-1]
+    assert bulk_ll.remove_all(lambda item: item % 2 == 1) == 4, "Test failed: Expected 4 odd items removed"
+    assert repr(bulk_ll) == "[0, 8]", "Test failed: Expected [0, 8] after remove_all"
+
+    other_ll = UnorderedList()
+    other_ll.extend([4, 4])
+    bulk_ll.splice(1, other_ll)
+    assert repr(bulk_ll) == "[0, 4, 4, 8]" and other_ll.is_empty(), "Test failed: Expected splice to move the nodes"
+    other_ll.extend([9])
+    bulk_ll.concat(other_ll)
+    assert bulk_ll.tail.data == 9 and bulk_ll.size() == 5, "Test failed: Expected concat to move the tail"
+    assert bulk_ll.remove_all(4) == 2 and repr(bulk_ll) == "[0, 8, 9]", "Test failed: Expected both 4s removed"
+
+    # Test adding and removing whole chains at either end
+    bulk_ll.add_many([1, 2])
+    assert repr(bulk_ll) == "[2, 1, 0, 8, 9]", "Test failed: Expected add_many to match repeated add"
+    assert bulk_ll.pop_front_many(2) == [2, 1], "Test failed: Expected the first two items front first"
+    assert bulk_ll.pop_rear_many(2) == [9, 8], "Test failed: Expected the last two items rear first"
+    assert bulk_ll.pop_front_many(5) == [0] and bulk_ll.is_empty(), "Test failed: Expected the list drained"
+    assert bulk_ll.head is None and bulk_ll.tail is None, "Test failed: Expected no head or tail after draining"
+
+    indexed_ll.extend([5, 6, 7])
+    assert indexed_ll.pop_rear_many(2) == [7, 6] and not indexed_ll.search(7), "Test failed: Expected the index updated"
+
+    # Test rotating in both directions, including counts larger than the list
+    rotated_ll = UnorderedList()
+    rotated_ll.extend(range(6))
+    for count, expected in [(2, "[4, 5, 0, 1, 2, 3]"), (-3, "[1, 2, 3, 4, 5, 0]"), (13, "[0, 1, 2, 3, 4, 5]"), (6, "[0, 1, 2, 3, 4, 5]")]:
+        rotated_ll.rotate(count)
+        assert repr(rotated_ll) == expected, f"Test failed: Expected {expected} after rotate({count})"
+    rotated_ll.rotate(-1)
+    assert rotated_ll.head.prev is None and rotated_ll.tail.next is None, "Test failed: Expected the ring cut at the ends"
+    assert rotated_ll.tail.data == 0 and rotated_ll.tail.prev.data == 5, "Test failed: Expected the tail linked back"
+    assert rotated_ll[4] == 5 and rotated_ll.pop(0) == 1, "Test failed: Expected indexing to follow the rotation"
+
+    # Test the self-organizing modes
+    for mode, after_search, after_index in [("move_to_front", "[4, 1, 2, 3, 5]", "[3, 4, 1, 2, 5]"),
+                                            ("transpose", "[1, 2, 4, 3, 5]", "[1, 2, 3, 4, 5]"),
+                                            ("count", "[4, 1, 2, 3, 5]", "[4, 3, 1, 2, 5]")]:
+        organized_ll = UnorderedList(organize=mode)
+        organized_ll.extend([1, 2, 3, 4, 5])
+        assert organized_ll.search(4) and not organized_ll.search(6), f"Test failed: Expected search to work in {mode} mode"
+        assert repr(organized_ll) == after_search, f"Test failed: Expected {after_search} after searching in {mode} mode"
+        assert organized_ll.index(3) == 3, f"Test failed: Expected index before reorganizing in {mode} mode"
+        assert repr(organized_ll) == after_index, f"Test failed: Expected {after_index} after index in {mode} mode"
+        assert organized_ll.tail.data == 5 and organized_ll.head.prev is None, f"Test failed: Expected ends kept in {mode} mode"
+
+    organized_ll = UnorderedList(organize="move_to_front")
+    organized_ll.extend([1, 2])
+    organized_ll.search(2)
+    assert list(reversed(organized_ll)) == [1, 2] and organized_ll.tail.data == 1, "Test failed: Expected the tail to move"
+
+    # Test that plain nodes moved into a counting list can count hits
+    counted_ll = UnorderedList(indexed=True, organize="count")
+    counted_ll.extend([1, 2])
+    plain_ll = UnorderedList()
+    plain_ll.extend([3, 4])
+    counted_ll.concat(plain_ll)
+    assert counted_ll.search(4) and counted_ll.search(4), "Test failed: Expected search to find a concatenated item"
+    assert repr(counted_ll) == "[4, 1, 2, 3]" and plain_ll.is_empty(), "Test failed: Expected 4 moved to the front"
+    assert counted_ll.tail.data == 3 and counted_ll.size() == 4, "Test failed: Expected tail and count kept"
+    assert counted_ll.index(3) == 3 and counted_ll.index(2) == 3, "Test failed: Expected the copied nodes indexed"
+
+    try:
+        UnorderedList(organize="random")
+        assert False, "An unknown organize mode should raise ValueError."
+    except ValueError:
+        pass
+
+    # Test the in-place merge sort against list.sort, including stability
+    records = [((i * 7) % 5, i) for i in range(40)]
+    for key, reverse in [(None, False), (None, True), (lambda r: r[0], False), (lambda r: r[0], True)]:
+        sorted_ll = UnorderedList()
+        sorted_ll.extend(records)
+        sorted_ll.sort(key=key, reverse=reverse)
+        expected = sorted(records, key=key, reverse=reverse)
+        assert list(sorted_ll) == expected, "Test failed: Expected the same order as sorted()"
+        assert list(reversed(sorted_ll)) == expected[::-1], "Test failed: Expected prev pointers rebuilt"
+        assert sorted_ll.tail.data == expected[-1] and sorted_ll.size() == 40, "Test failed: Expected tail and count kept"
+
+    sorted_ll = UnorderedList()
+    sorted_ll.extend([3, 2, 1, 1, 2, 3])
+    head_node = sorted_ll.head
+    sorted_ll.sort()
+    assert repr(sorted_ll) == "[1, 1, 2, 2, 3, 3]" and head_node in (sorted_ll.tail, sorted_ll.tail.prev), \
+        "Test failed: Expected the nodes relinked rather than copied"
@@ -0,0 +1,20 @@
+from dsa.unrolledOrderedList import UnrolledOrderedList
+
+
+def test_unrolled_ordered_list() -> None:
+    # Create the list object with small blocks so splits and merges happen
+    ol = UnrolledOrderedList(block_size=4)
+
+    for item in [31, 77, 17, 93, 26, 54, 5, 62, 44, 17]:
+        ol.add(item)
+
+    assert repr(ol) == "[5, 17, 17, 26, 31, 44, 54, 62, 77, 93]", "Test failed: Expected sorted items"
+    assert ol.size() == 10, "Test failed: Expected size 10 after 10 adds"
+    assert ol.index(17) == 1, "Test failed: Expected the first 17 at index 1"
+    assert ol.index(93) == 9, "Test failed: Expected 93 at index 9"
+    assert ol.search(44) and not ol.search(45), "Test failed: Expected search to find 44 only"
+
+    ol.remove(17)
+    assert ol.pop(0) == 5, "Test failed: Expected pop(0) to return the smallest item"
+    assert ol[0:3] == [17, 26, 31], "Test failed: Expected [17, 26, 31] for slice 0:3"
+    assert ol.size() == 8, "Test failed: Expected size 8 after remove and pop"
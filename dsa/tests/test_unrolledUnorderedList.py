@@ -0,0 +1,67 @@
+from dsa.unrolledUnorderedList import UnrolledUnorderedList
+
+
+def test_unrolled_unordered_list() -> None:
+    # Create the list object with small blocks so splits and merges happen
+    ll = UnrolledUnorderedList(block_size=4)
+
+    # Add elements to the list
+    for i in range(1, 11):
+        ll.append(i)
+
+    # Test single index access
+    assert ll[0] == 1, "Test failed: Expected 1 at index 0"
+    assert ll[5] == 6, "Test failed: Expected 6 at index 5"
+    assert ll[-1] == 10, "Test failed: Expected 10 at index -1"
+    assert ll[-2] == 9, "Test failed: Expected 9 at index -2"
+
+    # Test out-of-range indices
+    try:
+        ll[11]
+    except IndexError:
+        pass  # Expected to raise IndexError
+
+    try:
+        ll[-11]
+    except IndexError:
+        pass  # Expected to raise IndexError
+
+    # Test slicing (start:stop)
+    assert ll[2:5] == [3, 4, 5], "Test failed: Expected [3, 4, 5] for slice 2:5"
+    assert ll[0:3] == [1, 2, 3], "Test failed: Expected [1, 2, 3] for slice 0:3"
+
+    # Test slicing with negative indices
+    assert ll[-5:-2] == [6, 7, 8], "Test failed: Expected [6, 7, 8] for slice -5:-2"
+
+    # The below is a very important corner case.
+    assert ll[-2:-5] == [9, 8, 7, 6], "Test failed: Expected [9, 8, 7, 6] for slice -2:-5"
+
+    # Test empty list
+    empty_ll = UnrolledUnorderedList()
+    assert empty_ll[0:2] == [], "Test failed: Expected empty list for slice 0:2 on empty list"
+
+    # Test that pops merge blocks back together
+    for _ in range(8):
+        ll.pop(1)
+    assert repr(ll) == "[1, 10]", "Test failed: Expected [1, 10] after popping the middle"
+    assert ll.head is ll.tail, "Test failed: Expected the remaining items to share one block"
+
+    # Test the bulk operations, which move whole blocks
+    ll = UnrolledUnorderedList(block_size=4)
+    ll.extend(range(10))
+    ll.add_many([-1, -2, -3, -4, -5])
+    assert repr(ll) == repr(list(range(-5, 10))), "Test failed: Expected add_many to match repeated add"
+    assert ll.pop_front_many(6) == [-5, -4, -3, -2, -1, 0], "Test failed: Expected six items front first"
+    assert ll.pop_rear_many(3) == [9, 8, 7], "Test failed: Expected three items rear first"
+    assert repr(ll) == "[1, 2, 3, 4, 5, 6]" and ll.size() == 6, "Test failed: Expected the middle to remain"
+    assert all(len(block.items) <= 4 for block in (ll.head, ll.tail)), "Test failed: Expected blocks within block_size"
+    assert ll.pop_front_many(10) == [1, 2, 3, 4, 5, 6] and ll.is_empty(), "Test failed: Expected the list drained"
+
+    # Test rotating by the shorter side in both directions
+    ll.extend(range(10))
+    ll.rotate(3)
+    assert repr(ll) == "[7, 8, 9, 0, 1, 2, 3, 4, 5, 6]", "Test failed: Expected the last three items moved to the front"
+    ll.rotate(-8)
+    assert repr(ll) == "[5, 6, 7, 8, 9, 0, 1, 2, 3, 4]", "Test failed: Expected a left rotation for a negative count"
+    ll.rotate(25)
+    assert repr(ll) == "[0, 1, 2, 3, 4, 5, 6, 7, 8, 9]" and ll.size() == 10, "Test failed: Expected the count reduced modulo the size"
@@ -0,0 +1,35 @@
+import threading
+from dsa.workStealingDeque import WorkStealingDeque
+
+
+def test_work_stealing_deque() -> None:
+    # Test that an owner and thieves together see every item exactly once
+    deque = WorkStealingDeque()
+    done = threading.Event()
+    stolen = [[] for _ in range(3)]
+
+    def steal(record: list) -> None:
+        while True:
+            try:
+                record.append(deque.pop_front())
+            except IndexError:
+                if done.is_set():
+                    return
+
+    thieves = [threading.Thread(target=steal, args=(record,)) for record in stolen]
+    for thief in thieves:
+        thief.start()
+    owned = []
+    for i in range(10_000):
+        deque.add_rear(i)
+        if i % 3 == 0:
+            try:
+                owned.append(deque.pop_rear())
+            except IndexError:
+                pass
+    done.set()
+    for thief in thieves:
+        thief.join()
+    while not deque.is_empty():
+        owned.append(deque.pop_front())
+    assert sorted(owned + sum(stolen, [])) == list(range(10_000)), "Every item should be taken exactly once."
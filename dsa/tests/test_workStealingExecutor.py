@@ -0,0 +1,55 @@
+import threading
+from dsa.workStealingExecutor import WorkStealingExecutor
+
+
+def test_work_stealing_executor() -> None:
+    # Test a recursive fork-join job deeper than the number of workers
+    def fib(n: int) -> int:
+        if n < 2:
+            return n
+        left = executor.submit(fib, n - 1)
+        return fib(n - 2) + executor.join(left)
+
+    with WorkStealingExecutor(max_workers=2) as executor:
+        assert executor.join(executor.submit(fib, 15)) == 610, "Recursive tasks should complete without deadlock."
+        assert executor.submit(sum, [1, 2, 3]).result() == 6, "Tasks submitted from outside should run."
+
+        # Test that exceptions reach the caller
+        failed = executor.submit(int, "not a number")
+        try:
+            failed.result()
+            assert False, "A failing task should raise from result()."
+        except ValueError:
+            pass
+
+    # Test that a shut-down executor refuses new work
+    try:
+        executor.submit(sum, [])
+        assert False, "submit after shutdown should raise RuntimeError."
+    except RuntimeError:
+        pass
+
+    # Test that zero workers is refused rather than replaced by the default
+    try:
+        WorkStealingExecutor(max_workers=0)
+        assert False, "max_workers=0 should raise ValueError."
+    except ValueError:
+        pass
+
+    # Test that every task accepted while shutdown runs is completed
+    for _ in range(50):
+        executor = WorkStealingExecutor(max_workers=2)
+        accepted = []
+
+        def submit_until_shut_down() -> None:
+            while True:
+                try:
+                    accepted.append(executor.submit(abs, -1))
+                except RuntimeError:
+                    return
+
+        submitter = threading.Thread(target=submit_until_shut_down)
+        submitter.start()
+        executor.shutdown()
+        submitter.join()
+        assert all(future.done() for future in accepted), "Accepted tasks should finish before shutdown returns."
@@ -0,0 +1,49 @@
+from .deque import Deque
+from .queue import Queue
+from .storageBackends import STORAGE_BACKENDS
+from timeit import Timer
+
+BATCH = 256
+NUMBER_OF_REPETITION = 400
+
+single = Timer(f"for item in batch: q.enqueue(item)\nfor _ in range({BATCH}): q.dequeue()",
+               "from __main__ import q, batch")
+batched = Timer(f"q.enqueue_many(batch); q.dequeue_many({BATCH})", "from __main__ import q, batch")
+deque_single = Timer(f"for item in batch: d.add_front(item)\nfor _ in range({BATCH}): d.pop_rear()",
+                     "from __main__ import d, batch")
+deque_batched = Timer(f"d.add_front_many(batch); d.pop_rear_many({BATCH})", "from __main__ import d, batch")
+
+batch = list(range(BATCH))
+print(f"{'container':20s}{'single items/sec':>18s}{'batched items/sec':>19s}{'speedup':>9s}")
+
+for backend in STORAGE_BACKENDS:
+    for container, one, many in ((Queue, single, batched), (Deque, deque_single, deque_batched)):
+        q = d = container(backend)
+        for _ in range(1_000):  # Start from a non-empty container
+            (d.add_rear if container is Deque else q.enqueue)(0)
+        single_time = one.timeit(number=NUMBER_OF_REPETITION)
+        batched_time = many.timeit(number=NUMBER_OF_REPETITION)
+        items = 2 * BATCH * NUMBER_OF_REPETITION
+        print(f"{container.__name__ + ' ' + backend:20s}{items / single_time:>18,.0f}{items / batched_time:>19,.0f}"
+              f"{single_time / batched_time:>8.1f}x")
+
+
+output = """
+container             single items/sec  batched items/sec  speedup
+Queue list                   4,464,289        175,827,346    39.4x
+Deque list                   1,792,808         77,936,450    43.5x
+Queue linked                   707,336          3,182,336     4.5x
+Deque linked                   816,988          3,124,113     3.8x
+Queue array                    831,592          2,364,371     2.8x
+Deque array                    560,095          2,714,699     4.8x
+Queue unrolled                 953,725         52,077,731    54.6x
+Deque unrolled                 616,458         20,045,143    32.5x
+
+Each round moves a batch of 256 items through a container that already
+holds 1,000, either one at a time or with one call per batch. The linked
+backend still makes a node per item and walks the batch once to detach
+it, but it skips the per-call dispatch, checks and relinking, which makes
+it about 4x faster. The array backend frees each slot one at a time, so
+it gains the least. The list and unrolled backends move whole slices, so
+a batch costs a few C-level copies and they gain 30-55x.
+"""
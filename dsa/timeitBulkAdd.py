@@ -0,0 +1,45 @@
+from .orderedList import OrderedList
+from timeit import Timer
+import random
+
+LIST_SIZE = 10_000
+
+random.seed(3)
+
+existing = [random.random() for _ in range(LIST_SIZE)]
+
+
+def build() -> OrderedList:
+    """Return an ordered list holding the existing items."""
+    ol = OrderedList()
+    ol.add_many(existing)
+    return ol
+
+
+repeated_add = Timer("for item in batch: ol.add(item)", "from __main__ import build, batch; ol = build()")
+add_many = Timer("ol.add_many(batch)", "from __main__ import build, batch; ol = build()")
+merge = Timer("ol.merge(other)",
+              "from __main__ import build, batch, OrderedList; ol = build(); "
+              "other = OrderedList(); other.add_many(batch)")
+print(f"{'k':10s}{'add x k':>12s}{'add_many':>12s}{'merge':>12s}")
+
+for k in (10, 100, 1_000, 10_000):
+    batch = [random.random() for _ in range(k)]
+    repeated_add_time = repeated_add.timeit(number=1)
+    add_many_time = add_many.timeit(number=1)
+    merge_time = merge.timeit(number=1)
+    print(f"{k:<10,d}{repeated_add_time:>12.5f}{add_many_time:>12.5f}{merge_time:>12.5f}")
+
+
+output = """
+k              add x k    add_many       merge
+10             0.00225     0.00224     0.00075
+100            0.01873     0.00088     0.00082
+1,000          0.22800     0.00204     0.00123
+10,000         3.63984     0.00921     0.00237
+
+Each row adds a batch of k items to a 10,000 item ordered list. k separate
+add calls cost O(n * k). add_many costs O(n + k log k), and merge, which
+only relinks nodes that are already sorted, costs O(n + k). The k=10
+add_many time is inflated by the first timing warming up.
+"""
@@ -0,0 +1,69 @@
+from .blockDeque import BlockDeque
+from .deque import Deque
+from timeit import Timer
+import collections
+import tracemalloc
+
+NUMBER_OF_REPETITION = 200_000
+LIST_SIZE = 100_000
+
+
+class CollectionsDeque(collections.deque):
+    """collections.deque under the Deque method names, for reference."""
+    add_front = collections.deque.appendleft
+    add_rear = collections.deque.append
+    pop_front = collections.deque.popleft
+    pop_rear = collections.deque.pop
+
+
+def bytes_per_element(container) -> float:
+    """Return the traced bytes allocated per element added to the deque."""
+    tracemalloc.start()
+    instance = container()
+    for _ in range(LIST_SIZE):
+        instance.add_rear(None)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size / LIST_SIZE
+
+
+operations = [
+    ("rear", "d.add_rear(0); d.pop_rear()"),
+    ("front", "d.add_front(0); d.pop_front()"),
+    ("fifo", "d.add_rear(0); d.pop_front()"),
+    ("d[i]", "d[quarter]; d[middle]"),
+]
+
+print(f"{'deque':18s}" + "".join(f"{name + ' ops/s':>16s}" for name, _ in operations) + f"{'bytes/elem':>12s}")
+
+for container in (Deque, BlockDeque, CollectionsDeque):
+    d = container()
+    for _ in range(LIST_SIZE):
+        d.add_rear(0)
+    quarter, middle = LIST_SIZE // 4, LIST_SIZE // 2
+
+    rates = []
+    for name, statement in operations:
+        number = NUMBER_OF_REPETITION
+        if name == "d[i]" and container is Deque:
+            # Deque has no indexing; time its list walk, with a short run
+            statement, number = "d._items[quarter]; d._items[middle]", 1_000
+        t = Timer(statement, "from __main__ import d, quarter, middle")
+        rates.append(number * (2 if name == "d[i]" else 1) / t.timeit(number=number))
+    print(f"{container.__name__:18s}" + "".join(f"{rate:>16,.0f}" for rate in rates)
+          + f"{bytes_per_element(container):>12.1f}")
+
+
+output = """
+deque                   rear ops/s     front ops/s      fifo ops/s      d[i] ops/s  bytes/elem
+Deque                      338,927         432,289         351,380           1,216        56.0
+BlockDeque               1,023,146       3,007,632       2,233,152          34,393         9.8
+CollectionsDeque        10,383,022      10,452,159      10,886,796         446,678         8.3
+
+All runs use a 100,000 item deque. rear, front and fifo each pair an add
+with a pop. d[i] alternates between n/4 and n/2, so the finger cannot
+help. BlockDeque is 3-7x faster than the node-per-item Deque at the ends
+and about 30x faster at indexing. It stores an element in about 10 bytes,
+one slot pointer plus a share of its block. collections.deque, the same
+design in C, is shown for reference.
+"""
@@ -0,0 +1,61 @@
+from .unorderedList import UnorderedList
+from timeit import Timer
+import random
+import tracemalloc
+
+NUMBER_OF_REPETITION = 1_000
+LIST_SIZE = 10_000
+
+random.seed(3)
+
+values = random.sample(range(LIST_SIZE), NUMBER_OF_REPETITION)
+
+
+def build(indexed: bool) -> UnorderedList:
+    """Return a list of LIST_SIZE distinct ints, with or without the hash index."""
+    ll = UnorderedList(indexed=indexed)
+    for i in range(LIST_SIZE):
+        ll.append(i)
+    return ll
+
+
+def bytes_per_element(indexed: bool) -> float:
+    """Return the traced bytes per element of a built list, int payloads included."""
+    tracemalloc.start()
+    ll = build(indexed)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size / LIST_SIZE
+
+
+operations = [
+    ("append", "build(indexed)", 1),
+    ("search", "for v in values: ll.search(v)", 1),
+    ("index", "for v in values: ll.index(v)", 1),
+    ("remove+append", "for v in values: ll.remove(v); ll.append(v)", 1),
+]
+
+print(f"{'indexed':10s}{'bytes/elem':>12s}" + "".join(f"{name:>15s}" for name, _, _ in operations))
+
+for indexed in (False, True):
+    ll = build(indexed)
+    times = []
+    for _, statement, number in operations:
+        t = Timer(statement, "from __main__ import ll, values, build, indexed")
+        times.append(t.timeit(number=number))
+    print(f"{str(indexed):10s}{bytes_per_element(indexed):>12.1f}"
+          + "".join(f"{time:>15.5f}" for time in times))
+
+
+output = """
+indexed     bytes/elem         append         search          index  remove+append
+False             87.2        0.01113        0.48849        0.39587        0.19462
+True             332.7        0.04685        0.00043        0.31396        0.00333
+
+append builds the whole 10,000 item list. The other columns are 1,000
+operations each. With the index, search and remove run in constant time,
+roughly 1000x and 60x faster here. index() still walks back to the head
+from the found node, so it only avoids comparing values. The costs are
+about 245 extra bytes per element for the dict entry and its one-node set,
+and roughly 4x slower appends.
+"""
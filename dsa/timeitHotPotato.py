@@ -0,0 +1,78 @@
+from .queue import Queue
+from .josephusProblem import josephus, josephus_order
+from time import perf_counter
+
+
+def pass_one_at_a_time(n: int, num: int) -> int:
+    """The textbook game: num dequeue/enqueue pairs per elimination."""
+    queue = Queue()
+    queue.enqueue_many(range(n))
+    while queue.size() > 1:
+        for _ in range(num):
+            queue.enqueue(queue.dequeue())
+        queue.dequeue()
+    return queue.dequeue()
+
+
+def pass_by_rotate(n: int, num: int) -> int:
+    """The same game with one relinking rotate per elimination."""
+    queue = Queue()
+    queue.enqueue_many(range(n))
+    while queue.size() > 1:
+        queue.rotate(num)
+        queue.dequeue()
+    return queue.dequeue()
+
+
+def survivor(n: int, num: int) -> int:
+    return josephus(n, num + 1)
+
+
+def full_order(n: int, num: int) -> int:
+    for last in josephus_order(n, num + 1):
+        pass
+    return last
+
+
+def seconds(run, n: int, num: int) -> float:
+    start = perf_counter()
+    result = run(n, num)
+    elapsed = perf_counter() - start
+    assert result == josephus(n, num + 1), f"{run.__name__} found the wrong survivor."
+    return elapsed
+
+
+print(f"{'players':>12s}{'num':>15s}{'one at a time s':>17s}{'rotate s':>10s}{'order s':>10s}{'survivor s':>12s}")
+for n, num in [(2_000, 7), (2_000, 1_000), (20_000, 7), (20_000, 10_000),
+               (10_000_000, 7), (10_000_000, 1_000), (10_000_000, 10**9)]:
+    small = n <= 20_000
+    columns = [seconds(pass_one_at_a_time, n, num) if small and num < 10_000 else None,
+               seconds(pass_by_rotate, n, num) if small else None,
+               seconds(full_order, n, num) if num < 10**9 else None,
+               seconds(survivor, n, num)]
+    print(f"{n:>12,}{num:>15,}" + "".join(
+        f"{'-' if value is None else f'{value:.3f}':>{width}s}"
+        for value, width in zip(columns, (17, 10, 10, 12))))
+
+
+output = """
+     players            num  one at a time s  rotate s   order s  survivor s
+       2,000              7            0.042     0.005     0.000       0.000
+       2,000          1,000            4.723     0.024     0.004       0.001
+      20,000              7            0.364     0.055     0.001       0.000
+      20,000         10,000                -     1.622     0.055       0.006
+  10,000,000              7                -         -     1.644       0.000
+  10,000,000          1,000                -         -     7.454       0.010
+  10,000,000  1,000,000,000                -         -         -       0.758
+
+Passing one at a time costs a dequeue and an enqueue per pass, so it
+grows with players * num. Queue.rotate relinks the head and tail after a
+walk of min(num, n - num) nodes. That is 200x faster at num=1,000, but
+it is still a simulation and still O(n) per elimination. josephus_order
+removes a whole lap with one slice deletion while num + 1 <= 4,096, and
+uses the Fenwick tree after that. It produces all 10 million
+eliminations in under 2 seconds for num=7, with a peak of about 400 MiB
+for the position lists. The survivor alone needs no lists. Its
+recurrence jumps over the steps that do not wrap, so small counts finish
+at once, and even num=10**9 takes under a second for 10 million players.
+"""
@@ -0,0 +1,72 @@
+from .unorderedList import UnorderedList
+from time import perf_counter
+import random
+import tracemalloc
+
+N = 100_000
+
+random.seed(0)
+random_items = [random.random() for _ in range(N)]
+nearly_sorted = sorted(random_items)
+for _ in range(N // 100):  # Swap 1% of the items out of place
+    i, j = random.randrange(N), random.randrange(N)
+    nearly_sorted[i], nearly_sorted[j] = nearly_sorted[j], nearly_sorted[i]
+inputs = {
+    "random": random_items,
+    "sorted": sorted(random_items),
+    "reversed": sorted(random_items, reverse=True),
+    "nearly sorted": nearly_sorted,
+}
+
+
+def relink_sort(ll: UnorderedList) -> UnorderedList:
+    ll.sort()
+    return ll
+
+
+def copy_sort_rebuild(ll: UnorderedList) -> UnorderedList:
+    rebuilt = UnorderedList()
+    rebuilt.extend(sorted(ll))
+    return rebuilt
+
+
+def measure(sort, items: list):
+    """Return the seconds a sort takes and the peak memory it allocates on top of the list."""
+    ll = UnorderedList()
+    ll.extend(items)
+    start = perf_counter()
+    sort(ll)
+    seconds = perf_counter() - start
+
+    ll = UnorderedList()
+    ll.extend(items)
+    tracemalloc.start()
+    result = sort(ll)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak
+
+
+print(f"{'input':16s}{'relink ms':>11s}{'peak KiB':>10s}{'copy+rebuild ms':>17s}{'peak KiB':>10s}")
+for name, items in inputs.items():
+    relink_seconds, relink_peak = measure(relink_sort, items)
+    copy_seconds, copy_peak = measure(copy_sort_rebuild, items)
+    print(f"{name:16s}{relink_seconds * 1e3:>11.1f}{relink_peak / 1024:>10,.0f}"
+          f"{copy_seconds * 1e3:>17.1f}{copy_peak / 1024:>10,.0f}")
+
+
+output = """
+input             relink ms  peak KiB  copy+rebuild ms  peak KiB
+random                263.9         0            132.3     6,250
+sorted                 16.3         0            126.2     6,250
+reversed               16.6         0            124.8     6,250
+nearly sorted         187.4         0             89.0     6,250
+
+100,000 floats. Relinking allocates nothing: the peak is the handful of
+bytes for one dummy node. Copying into a list, calling sorted() and
+rebuilding a new list of nodes peaks at about 6 MiB. Sorted and reversed
+input is one run, so the relink sort finishes in a single pass and is
+about 8x faster. On random or nearly sorted input every pass rescans its
+runs with Python-level comparisons, while sorted() merges in C, so the
+relink sort is about 2x slower. Timings vary by about 30% between runs.
+"""
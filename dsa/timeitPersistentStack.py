@@ -0,0 +1,70 @@
+from .persistentStack import PersistentStack
+from .stack import Stack
+from time import perf_counter
+import random
+import tracemalloc
+
+PERSISTENT_VERSIONS = 1_000_000
+COPIED_VERSIONS = 10_000  # Copying is quadratic, so fewer versions are kept
+
+
+def persistent_history(versions: int) -> list:
+    """Run a push-heavy workload and keep every version of a PersistentStack."""
+    rng = random.Random(0)
+    stack = PersistentStack()
+    history = []
+    for i in range(versions):
+        stack = stack.pop() if not stack.is_empty() and rng.random() < 0.4 else stack.push(i)
+        history.append(stack)  # The snapshot is the version itself
+    return history
+
+
+def copied_history(versions: int, backend: str) -> list:
+    """Run the same workload on a Stack and keep a copy of it after every step."""
+    rng = random.Random(0)
+    stack = Stack(backend)
+    history = []
+    for i in range(versions):
+        stack.pop() if not stack.is_empty() and rng.random() < 0.4 else stack.push(i)
+        snapshot = Stack(backend)
+        snapshot._items.extend(stack._items)
+        history.append(snapshot)
+    return history
+
+
+def measure(run, *args):
+    """Return the seconds per version and traced bytes per version of a run."""
+    start = perf_counter()
+    run(*args)
+    seconds = perf_counter() - start
+
+    tracemalloc.start()
+    history = run(*args)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return seconds / len(history), size / len(history)
+
+
+print(f"{'history':26s}{'versions':>10s}{'us/version':>12s}{'bytes/version':>15s}")
+
+for name, run, args in (("PersistentStack", persistent_history, (PERSISTENT_VERSIONS,)),
+                        ("Stack copy (list)", copied_history, (COPIED_VERSIONS, "list")),
+                        ("Stack copy (linked)", copied_history, (COPIED_VERSIONS, "linked"))):
+    seconds, size = measure(run, *args)
+    print(f"{name:26s}{args[0]:>10,}{seconds * 1e6:>12.2f}{size:>15,.0f}")
+
+
+output = """
+history                     versions  us/version  bytes/version
+PersistentStack            1,000,000        1.13             80
+Stack copy (list)             10,000       21.16          8,928
+Stack copy (linked)           10,000     1499.49         61,602
+
+Every step pushes, or pops with probability 0.4, and keeps a snapshot, so
+the stack grows by about one item every five steps. A PersistentStack
+snapshot is the version itself. A push allocates one cell and a pop
+allocates nothing, so the cost and memory per version stay flat over
+1e6 versions. A copied Stack costs time and memory in proportion to its
+depth, which is why only 1e4 copies are kept. At that point the depth is
+about 2,000, and the gap grows linearly as the history gets longer.
+"""
@@ -0,0 +1,99 @@
+from .indexedPriorityQueue import IndexedPriorityQueue
+from .orderedList import OrderedList
+from .priorityQueue import PriorityQueue
+from time import perf_counter
+import heapq
+import random
+
+N = 5_000
+BUILD = 100_000
+
+items = [random.random() for _ in range(N)]
+build_items = [random.random() for _ in range(BUILD)]
+
+
+def time_it(run) -> float:
+    """Return the seconds one call of run takes."""
+    start = perf_counter()
+    run()
+    return perf_counter() - start
+
+
+def ordered_list() -> None:
+    ol = OrderedList()
+    for item in items:
+        ol.add(item)
+    for _ in range(N):
+        ol.pop(0)
+
+
+def heapq_list() -> None:
+    heap = []
+    for item in items:
+        heapq.heappush(heap, item)
+    for _ in range(N):
+        heapq.heappop(heap)
+
+
+def priority_queue(arity: int):
+    def run() -> None:
+        pq = PriorityQueue(arity=arity)
+        for item in items:
+            pq.push(item)
+        for _ in range(N):
+            pq.pop()
+    return run
+
+
+def indexed_priority_queue() -> None:
+    pq = IndexedPriorityQueue()
+    for item in items:
+        pq.push(item, item)
+    for _ in range(N):
+        pq.pop()
+
+
+print(f"{'priority queue':26s}{'push+pop ops/sec':>18s}")
+for name, run in (("OrderedList", ordered_list), ("heapq", heapq_list),
+                  ("PriorityQueue arity 2", priority_queue(2)),
+                  ("PriorityQueue arity 4", priority_queue(4)),
+                  ("IndexedPriorityQueue", indexed_priority_queue)):
+    print(f"{name:26s}{2 * N / time_it(run):>18,.0f}")
+
+
+def build_by_push() -> None:
+    pq = PriorityQueue()
+    for item in build_items:
+        pq.push(item)
+
+
+print(f"\n{'build of 100,000 items':26s}{'ms':>18s}")
+for name, run in (("heapq.heapify", lambda: heapq.heapify(list(build_items))),
+                  ("PriorityQueue(items)", lambda: PriorityQueue(build_items)),
+                  ("PriorityQueue.push x n", build_by_push)):
+    print(f"{name:26s}{time_it(run) * 1e3:>18.1f}")
+
+
+output = """
+priority queue              push+pop ops/sec
+OrderedList                           40,676
+heapq                              4,359,306
+PriorityQueue arity 2                606,109
+PriorityQueue arity 4                444,069
+IndexedPriorityQueue                 438,446
+
+build of 100,000 items                    ms
+heapq.heapify                            7.8
+PriorityQueue(items)                    44.6
+PriorityQueue.push x n                  55.7
+
+push+pop: push 5,000 random floats, then pop them all. OrderedList.add
+walks the list to find each slot, so it is O(n) per push, and the heaps
+are 10-15x faster even at this size. The gap grows linearly with n.
+heapq is C code, so it stays about 7x ahead of the pure Python heap. The
+4-ary heap loses on pops here because every level scans a slice of four
+children. The indexed heap pays for a handle object and position updates,
+which is the price of O(log n) decrease_key and remove. heapify wins over
+repeated pushes, though only modestly on random input, where a push
+rises little more than one level on average.
+"""
@@ -0,0 +1,37 @@
+from .queue import Queue
+from .queueWithRearAtStartOfList import QueueWithRearAtStartOfList
+from .ringBufferQueue import RingBufferQueue
+from timeit import Timer
+
+NUMBER_OF_REPETITION = 200_000
+
+enqueue_dequeue = Timer("q.enqueue(0); q.dequeue()", "from __main__ import q")
+fill_drain = Timer("for _ in range(1_000): q.enqueue(0)\nfor _ in range(1_000): q.dequeue()",
+                   "from __main__ import q")
+print(f"{'queue':28s}{'steady ops/sec':>16s}{'burst ops/sec':>16s}")
+
+for container in (Queue, QueueWithRearAtStartOfList, RingBufferQueue):
+
+    q = container()
+    for _ in range(1_000):
+        q.enqueue(0)
+    steady_time = enqueue_dequeue.timeit(number=NUMBER_OF_REPETITION)
+
+    q = container()
+    burst_time = fill_drain.timeit(number=NUMBER_OF_REPETITION // 1_000)
+
+    print(f"{container.__name__:28s}{2 * NUMBER_OF_REPETITION / steady_time:>16,.0f}"
+          f"{2 * NUMBER_OF_REPETITION / burst_time:>16,.0f}")
+
+
+output = """
+queue                         steady ops/sec   burst ops/sec
+Queue                                658,671         538,766
+QueueWithRearAtStartOfList           685,357         688,591
+RingBufferQueue                    2,821,634       2,530,958
+
+steady: one enqueue and one dequeue at a time on a 1,000 item queue.
+burst: fill with 1,000 items, then drain, so the ring buffer grows and
+shrinks. The ring buffer is about 4x faster than both linked queues
+because it allocates no node per item and does no pointer bookkeeping.
+"""
@@ -0,0 +1,50 @@
+from .arrayLinkedList import ArrayLinkedList
+from .unorderedList import UnorderedList
+from timeit import Timer
+import gc
+import tracemalloc
+
+NUMBER_OF_REPETITION = 1_000_000
+LIST_SIZE = 100_000
+
+
+def bytes_per_element(container) -> float:
+    """Return the traced bytes allocated per element appended to the container."""
+    tracemalloc.start()
+    instance = container()
+    for _ in range(LIST_SIZE):
+        instance.append(None)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size / LIST_SIZE
+
+
+churn = Timer("ll.append(ll.pop(0))", "from __main__ import ll")
+print(f"{'list':18s}{'churn time':>12s}{'gc objects':>15s}{'bytes/elem':>12s}")
+
+for container in (UnorderedList, ArrayLinkedList):
+
+    tracked = len(gc.get_objects())
+    ll = container()
+    for i in range(LIST_SIZE):
+        ll.append(i)
+    tracked = len(gc.get_objects()) - tracked
+
+    churn_time = churn.timeit(number=NUMBER_OF_REPETITION)
+
+    print(f"{container.__name__:18s}{churn_time:>12.5f}{tracked:>15,d}"
+          f"{bytes_per_element(container):>12.1f}")
+
+
+output = """
+list                churn time     gc objects  bytes/elem
+UnorderedList          1.50057         99,581        56.0
+ArrayLinkedList        1.84361              3        24.3
+
+Churn is 1,000,000 rounds of append(pop(0)) on a 100,000 item list, the
+same pattern hot_potato uses. ArrayLinkedList reuses freed slots, so the
+churn allocates nothing and the garbage collector tracks 3 objects instead
+of one per element. Memory per element drops by about 2.3x. The time per
+operation is about 20% higher, because in pure Python every array('q')
+access boxes an int. The win is memory and GC pressure, not raw speed.
+"""
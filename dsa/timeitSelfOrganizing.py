@@ -0,0 +1,56 @@
+from .unorderedList import ORGANIZE_MODES, UnorderedList
+from time import perf_counter
+import random
+
+N = 1_000
+QUERIES = 20_000
+
+random.seed(0)
+keys = list(range(N))
+random.shuffle(keys)  # Popular keys start at random positions in the list
+ranks = list(range(N))
+random.shuffle(ranks)
+streams = {
+    "uniform": random.choices(keys, k=QUERIES),
+    "zipf s=1": random.choices(ranks, weights=[1 / (k + 1) for k in range(N)], k=QUERIES),
+    "zipf s=1.5": random.choices(ranks, weights=[1 / (k + 1) ** 1.5 for k in range(N)], k=QUERIES),
+}
+
+print(f"{'queries':12s}{'mode':16s}{'us/search':>12s}{'mean index':>12s}")
+for name, queries in streams.items():
+    for mode in (None,) + ORGANIZE_MODES:
+        ll = UnorderedList(organize=mode)
+        ll.extend(keys)
+        positions = 0
+        start = perf_counter()
+        for key in queries:
+            positions += ll.index(key)
+        elapsed = perf_counter() - start
+        print(f"{name:12s}{str(mode):16s}{elapsed / QUERIES * 1e6:>12.2f}{positions / QUERIES:>12.1f}")
+
+
+output = """
+queries     mode               us/search  mean index
+uniform     None                   18.76       500.8
+uniform     move_to_front          19.27       498.1
+uniform     transpose              27.26       500.8
+uniform     count                  23.97       500.8
+zipf s=1    None                   21.38       483.7
+zipf s=1    move_to_front           6.57       185.7
+zipf s=1    transpose              12.84       338.8
+zipf s=1    count                   6.81       148.9
+zipf s=1.5  None                   19.93       529.9
+zipf s=1.5  move_to_front           1.65        39.4
+zipf s=1.5  transpose               7.58       154.4
+zipf s=1.5  count                   1.81        32.0
+
+20,000 index() calls on a 1,000-item list. The mean index is the
+position where each item was found, which is how far the scan walked.
+With uniform queries no order helps, so reorganizing only adds its
+relinking cost. Timings vary by about 25% between runs. On Zipf queries
+move-to-front and count bring the popular keys to the head. At s=1 they
+come close to the best fixed order, a mean index of about N / H_N = 134.
+At s=1.5 the scan stops after about 35 items, which is close to
+constant. Transpose moves an item only one step per hit, so it is still
+converging after 20,000 queries.
+"""
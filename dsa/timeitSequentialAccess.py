@@ -0,0 +1,31 @@
+from .unorderedList import UnorderedList
+from timeit import Timer
+
+index_loop = Timer("for i in range(len(ll)): ll[i]", "from __main__ import ll")
+insert_loop = Timer("for i in range(middle, middle + len(ll) // 10): ll.insert(i, 0)",
+                    "from __main__ import ll, middle")
+print(f"{'n':12s}{'ll[i] us/step':>16s}{'insert us/step':>16s}")
+
+for i in (1_000, 10_000, 100_000, 1_000_000):
+
+    ll = UnorderedList()
+    for _ in range(i):
+        ll.append(0)
+    middle = i // 2
+
+    index_loop_time = index_loop.timeit(number=1) / i * 1e6
+    insert_loop_time = insert_loop.timeit(number=1) / (i // 10) * 1e6
+    print(f"{i:<12,d}{index_loop_time:>16.3f}{insert_loop_time:>16.3f}")
+
+
+output = """
+n              ll[i] us/step  insert us/step
+1,000                  1.087           2.077
+10,000                 1.099           2.054
+100,000                0.964           1.731
+1,000,000              0.934           1.423
+
+The cost per step stays flat as n grows by 1000x. Each ll[i] and each
+insert(i, x) walks from the finger left by the previous call. Without the
+finger, both loops start from the nearer end and are O(n^2) overall.
+"""
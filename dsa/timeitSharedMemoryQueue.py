@@ -0,0 +1,102 @@
+from .sharedMemoryQueue import SharedMemoryQueue
+from time import perf_counter
+import multiprocessing
+
+NUMBER_OF_MESSAGES = 100_000
+
+
+def produce_shared(q: SharedMemoryQueue, payload: bytes, count: int = NUMBER_OF_MESSAGES) -> None:
+    for _ in range(count):
+        q.enqueue(payload)
+
+
+def produce_pickled(q: multiprocessing.Queue, payload: bytes) -> None:
+    for _ in range(NUMBER_OF_MESSAGES):
+        q.put(payload)
+
+
+def consume_shared(q: SharedMemoryQueue, count: int = NUMBER_OF_MESSAGES) -> None:
+    for _ in range(count):
+        q.dequeue()
+
+
+def consume_view(q: SharedMemoryQueue) -> None:
+    for _ in range(NUMBER_OF_MESSAGES):
+        with q.dequeue_view() as view:
+            view[0]  # Touch the record in place without copying it
+
+
+def consume_pickled(q: multiprocessing.Queue) -> None:
+    for _ in range(NUMBER_OF_MESSAGES):
+        q.get()
+
+
+def run(q, produce, consume, payload: bytes) -> float:
+    """Stream the messages from a child process to this one; return messages per second."""
+    producer = multiprocessing.Process(target=produce, args=(q, payload))
+    start = perf_counter()
+    producer.start()
+    consume(q)
+    elapsed = perf_counter() - start
+    producer.join()
+    return NUMBER_OF_MESSAGES / elapsed
+
+
+def run_many(q: SharedMemoryQueue, payload: bytes, workers: int = 2) -> float:
+    """Stream the messages from several producer processes to as many consumer processes."""
+    share = NUMBER_OF_MESSAGES // workers
+    processes = [multiprocessing.Process(target=produce_shared, args=(q, payload, share)) for _ in range(workers)]
+    processes += [multiprocessing.Process(target=consume_shared, args=(q, share)) for _ in range(workers)]
+    start = perf_counter()
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    return share * workers / (perf_counter() - start)
+
+
+if __name__ == "__main__":
+    print(f"{'queue':28s}{'payload':>9s}{'msgs/sec':>12s}{'MB/sec':>10s}")
+
+    for size in (64, 4096):
+        payload = bytes(size)
+        runs = []
+
+        for mode in ("spsc", "mpmc"):
+            q = SharedMemoryQueue(capacity=1 << 22, mode=mode)
+            runs.append((f"SharedMemoryQueue {mode}", run(q, produce_shared, consume_shared, payload)))
+            runs.append((f"SharedMemoryQueue {mode} view", run(q, produce_shared, consume_view, payload)))
+            if mode == "mpmc":
+                runs.append(("SharedMemoryQueue mpmc 2x2", run_many(q, payload)))
+            q.close()
+            q.unlink()
+
+        runs.append(("multiprocessing.Queue", run(multiprocessing.Queue(), produce_pickled, consume_pickled, payload)))
+
+        for name, rate in runs:
+            print(f"{name:28s}{size:>9,d}{rate:>12,.0f}{rate * size / 1e6:>10.1f}")
+
+
+output = """
+queue                         payload    msgs/sec    MB/sec
+SharedMemoryQueue spsc             64     110,135       7.0
+SharedMemoryQueue spsc view        64     121,985       7.8
+SharedMemoryQueue mpmc             64     107,001       6.8
+SharedMemoryQueue mpmc view        64     110,482       7.1
+SharedMemoryQueue mpmc 2x2         64     101,860       6.5
+multiprocessing.Queue              64      68,166       4.4
+SharedMemoryQueue spsc          4,096      90,580     371.0
+SharedMemoryQueue spsc view     4,096      91,951     376.6
+SharedMemoryQueue mpmc          4,096      76,826     314.7
+SharedMemoryQueue mpmc view     4,096      99,792     408.7
+SharedMemoryQueue mpmc 2x2      4,096     107,137     438.8
+multiprocessing.Queue           4,096      66,959     274.3
+
+These numbers come from a single-CPU machine, so the producer and the
+consumer take turns instead of running in parallel. The shared-memory
+queue moves about one and a half times as many small messages as
+multiprocessing.Queue, because it has no pickling, pipe or feeder
+thread. With the view path, a 4 KiB record is read in place rather than
+copied out. The 2x2 rows run two producer and two consumer processes,
+which take turns on the locks.
+"""
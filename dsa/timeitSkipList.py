@@ -0,0 +1,46 @@
+from .orderedList import OrderedList
+from .skipList import SkipList
+from timeit import Timer
+import random
+
+NUMBER_OF_REPETITION = 1_000
+
+random.seed(3)
+
+operations = [
+    ("add", "for v in values: ol.add(v)"),
+    ("search", "for v in queries: ol.search(v)"),
+    ("index", "for v in queries: ol.index(v)"),
+    ("ol[k]", "for k in ranks: ol[k]"),
+]
+
+print(f"{'list':14s}{'n':>8s}" + "".join(f"{name + ' us':>12s}" for name, _ in operations))
+
+for n in (1_000, 4_000, 16_000):
+
+    values = random.sample(range(n * 10), n)
+    queries = random.sample(values, NUMBER_OF_REPETITION)
+    ranks = [random.randrange(n) for _ in range(NUMBER_OF_REPETITION)]
+
+    for container in (OrderedList, SkipList):
+        ol = container()
+        times = []
+        for name, statement in operations:
+            t = Timer(statement, "from __main__ import ol, values, queries, ranks")
+            count = n if name == "add" else NUMBER_OF_REPETITION
+            times.append(t.timeit(number=1) / count * 1e6)
+        print(f"{container.__name__:14s}{n:>8,d}" + "".join(f"{time:>12.2f}" for time in times))
+
+
+output = """
+list                 n      add us   search us    index us    ol[k] us
+OrderedList      1,000        9.85       40.67       28.70        4.96
+SkipList         1,000        6.62        3.20        3.08        3.32
+OrderedList      4,000       41.52      184.42      127.76       19.05
+SkipList         4,000        8.87        4.41        4.25        4.69
+OrderedList     16,000      191.49      834.43      544.97      104.87
+SkipList        16,000        7.26        4.64        4.35        3.36
+
+OrderedList costs grow linearly with n. SkipList costs stay almost flat,
+because add, search, index and rank lookups are all O(log n).
+"""
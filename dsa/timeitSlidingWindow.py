@@ -0,0 +1,72 @@
+from .minMaxStack import MinMaxStack
+from .stack import Stack
+from .slidingWindow import sliding_window_min
+from time import perf_counter
+import random
+
+N = 20_000
+
+readings = [random.random() for _ in range(N)]
+
+
+def rescan(items, width):
+    """Yield the minimum of every window by rescanning it, in O(width) per step."""
+    for i in range(len(items) - width + 1):
+        yield min(items[i:i + width])
+
+
+def items_per_second(run, *args) -> float:
+    """Return how many readings per second a window generator consumes."""
+    start = perf_counter()
+    for _ in run(*args):
+        pass
+    return N / (perf_counter() - start)
+
+
+print(f"{'window':>8s}{'rescan items/sec':>20s}{'monotonic items/sec':>22s}")
+for width in (10, 100, 1_000, 10_000):
+    print(f"{width:>8,}{items_per_second(rescan, readings, width):>20,.0f}"
+          f"{items_per_second(sliding_window_min, readings, width):>22,.0f}")
+
+
+def min_by_scan() -> None:
+    stack = Stack()
+    for reading in readings:
+        stack.push(reading)
+        min(stack._items)
+
+
+def min_by_min_max_stack() -> None:
+    stack = MinMaxStack()
+    for reading in readings:
+        stack.push(reading)
+        stack.get_min()
+
+
+print(f"\n{'stack':>8s}{'push+min ops/sec':>20s}")
+for name, run in (("scan", min_by_scan), ("MinMax", min_by_min_max_stack)):
+    start = perf_counter()
+    run()
+    print(f"{name:>8s}{N / (perf_counter() - start):>20,.0f}")
+
+
+output = """
+  window    rescan items/sec   monotonic items/sec
+      10           1,789,492               746,904
+     100             378,102               648,123
+   1,000              55,696               753,507
+  10,000               8,821               722,214
+
+   stack    push+min ops/sec
+    scan               1,505
+  MinMax             306,185
+
+Each row feeds 20,000 random readings through a window of the given
+width. Rescanning calls the C-level min on each window slice, so it
+costs O(width) per reading and slows linearly as the window grows. It
+still wins at width 10. The monotonic deque is about 700,000 readings a
+second at every width, so it is 13x faster at width 1,000 and 80x faster
+at 10,000. The stack rows push 20,000 readings and ask for the minimum
+after each push. A scan of the stack is O(n), while MinMaxStack reads the
+top of its minimum stack.
+"""
@@ -0,0 +1,53 @@
+from .queue import Queue
+from .ringBufferQueue import RingBufferQueue
+from .spillingQueue import SpillingQueue
+from time import perf_counter
+import tracemalloc
+
+BACKLOG = 1_000_000
+
+
+def fill_and_drain(q) -> float:
+    """Build the whole backlog, then drain it, and return the elapsed seconds."""
+    start = perf_counter()
+    for i in range(BACKLOG):
+        q.enqueue((i, "payload"))
+    for _ in range(BACKLOG):
+        q.dequeue()
+    return perf_counter() - start
+
+
+def peak_memory(make) -> int:
+    """Return the peak bytes allocated while a backlog is built in a new queue."""
+    tracemalloc.start()
+    q = make()
+    for i in range(BACKLOG):
+        q.enqueue((i, "payload"))
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+print(f"{'queue':18s}{'items/sec':>12s}{'peak MiB':>10s}")
+
+for name, make in (("Queue", Queue), ("RingBufferQueue", RingBufferQueue),
+                   ("SpillingQueue", SpillingQueue)):
+    q = make()
+    seconds = fill_and_drain(q)
+    print(f"{name:18s}{2 * BACKLOG / seconds:>12,.0f}{peak_memory(make) / 2**20:>10.1f}")
+
+
+output = """
+queue                items/sec  peak MiB
+Queue                  559,618     137.2
+RingBufferQueue      1,643,847      91.8
+SpillingQueue        1,190,517       2.5
+
+Each queue takes a backlog of 1,000,000 small tuples before anything is
+dequeued. The peak is the memory that tracemalloc saw while the backlog
+was built. The spilling queue holds at most 20,000 items in memory and
+writes the rest to disk in pickled chunks of 10,000. Its memory stays
+flat no matter how long the backlog grows. It is still twice as fast as
+the linked Queue, because each item is pickled as part of a chunk and
+the chunks are read with large sequential reads.
+"""
@@ -0,0 +1,31 @@
+from .stack import Stack
+from timeit import Timer
+
+NUMBER_OF_REPETITION = 100_000
+
+push_pop = Timer("stack.push(0); stack.pop()", "from __main__ import stack")
+print(f"{'n':12s}{'push+pop/sec':>15s}")
+
+for i in (1_000, 10_000, 100_000, 1_000_000, 10_000_000):
+
+    stack = Stack()
+    for _ in range(i):
+        stack.push(0)
+
+    push_pop_time = push_pop.timeit(number=NUMBER_OF_REPETITION)
+    print(f"{i:<12,d}{NUMBER_OF_REPETITION / push_pop_time:>15,.0f}")
+    del stack
+
+
+output = """
+n              push+pop/sec
+1,000               669,126
+10,000              765,742
+100,000             761,272
+1,000,000           704,547
+10,000,000          534,674
+
+Stack.pop() maps to LinkedList.pop(-1), which now starts its walk at the
+tail, so the throughput no longer depends on n. The small dip at 10,000,000
+comes from the cache and the garbage collector, not from traversal.
+"""
@@ -0,0 +1,47 @@
+from .unorderedList import UnorderedList
+from .unrolledUnorderedList import UnrolledUnorderedList
+from timeit import Timer
+import random
+
+NUMBER_OF_REPETITION = 200
+LIST_SIZE = 10_000
+
+random.seed(3)
+
+positions = [random.randrange(LIST_SIZE) for _ in range(NUMBER_OF_REPETITION)]
+
+lists = [("UnorderedList", UnorderedList())]
+for block_size in (16, 64, 256):
+    lists.append((f"Unrolled B={block_size}", UnrolledUnorderedList(block_size)))
+
+operations = [
+    ("ll[i]", "for i in positions: ll[i]"),
+    ("index", "for i in positions: ll.index(i)"),
+    ("search miss", "for _ in positions: ll.search(-1)"),
+]
+
+print(f"{'list':18s}" + "".join(f"{name:>14s}" for name, _ in operations))
+
+for name, ll in lists:
+    for i in range(LIST_SIZE):
+        ll.append(i)
+
+    times = []
+    for _, statement in operations:
+        t = Timer(statement, "from __main__ import ll, positions")
+        times.append(t.timeit(number=1))
+    print(f"{name:18s}" + "".join(f"{time:>14.5f}" for time in times))
+
+
+output = """
+list                       ll[i]         index   search miss
+UnorderedList            0.01596       0.07232       0.12756
+Unrolled B=16            0.00559       0.02838       0.05852
+Unrolled B=64            0.00155       0.02208       0.03410
+Unrolled B=256           0.00057       0.01757       0.02935
+
+Each column is 200 operations on a 10,000 item list. Positional access
+improves roughly in proportion to B, since one hop skips a whole block.
+Scans (index, search) improve 3-4x: the number of comparisons is the same,
+but they run inside list.__contains__ at C speed instead of in a Python loop.
+"""
@@ -0,0 +1,96 @@
+from .workStealingExecutor import WorkStealingExecutor
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+import random
+
+WORKERS = 4
+FIB_N, FIB_CUTOFF = 27, 12
+SORT_N, SORT_CUTOFF = 200_000, 2_000
+
+
+def fib(n: int) -> int:
+    return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+
+def merge(left: list, right: list) -> list:
+    merged, i, j = [], 0, 0
+    while i < len(left) and j < len(right):
+        if left[i] <= right[j]:
+            merged.append(left[i])
+            i += 1
+        else:
+            merged.append(right[j])
+            j += 1
+    return merged + left[i:] + right[j:]
+
+
+def fork_join_tasks(submit, join):
+    """Return recursive fib and merge sort tasks that fork with submit and wait with join."""
+    def fib_task(n: int) -> int:
+        if n <= FIB_CUTOFF:
+            return fib(n)
+        left = submit(fib_task, n - 1)
+        return fib_task(n - 2) + join(left)
+
+    def sort_task(items: list) -> list:
+        if len(items) <= SORT_CUTOFF:
+            return sorted(items)
+        middle = len(items) // 2
+        left = submit(sort_task, items[:middle])
+        right = sort_task(items[middle:])
+        return merge(join(left), right)
+
+    return (fib_task, FIB_N), (sort_task, items)
+
+
+def run(submit, join) -> list:
+    """Return the seconds each workload takes with the given fork and join."""
+    times = []
+    for task, argument in fork_join_tasks(submit, join):
+        start = perf_counter()
+        join(submit(task, argument))
+        times.append(perf_counter() - start)
+    return times
+
+
+def count_forks() -> int:
+    """Count the tasks the workloads submit, by running them inline."""
+    forks = []
+    run(lambda fn, *args: forks.append(None) or fn(*args), lambda value: value)
+    return len(forks)
+
+
+items = [random.random() for _ in range(SORT_N)]
+rows = [("sequential", run(lambda fn, *args: fn(*args), lambda value: value))]
+
+with WorkStealingExecutor(WORKERS) as executor:
+    rows.append((f"WorkStealingExecutor({WORKERS})", run(executor.submit, executor.join)))
+
+# A parent blocked in result() holds a pool thread, so the pool needs a
+# thread for every task of the fork-join tree to be safe from deadlock
+threads = count_forks()
+with ThreadPoolExecutor(threads) as executor:
+    rows.append((f"ThreadPoolExecutor({threads:,})", run(executor.submit, lambda future: future.result())))
+
+print(f"{'executor':32s}{'fib(27) ms':>12s}{'sort 200k ms':>14s}")
+for name, (fib_seconds, sort_seconds) in rows:
+    print(f"{name:32s}{fib_seconds * 1e3:>12.1f}{sort_seconds * 1e3:>14.1f}")
+
+
+output = """
+executor                          fib(27) ms  sort 200k ms
+sequential                              36.5         357.0
+WorkStealingExecutor(4)                 59.8         395.4
+ThreadPoolExecutor(1,725)              163.2         428.8
+
+Recorded on a single CPU, and with the GIL neither pool can beat the
+sequential run on pure Python work. The table therefore measures what
+each scheduler adds. fib forks 1,500 tasks of about 25 us each, which
+makes scheduling the dominant cost. The work-stealing pool adds about
+half the sequential time. ThreadPoolExecutor adds 3.5x that, because
+every blocked parent holds a thread. It needs one thread per task to
+avoid deadlock, and every fork goes through its single shared queue. The
+work-stealing pool keeps its 4 threads busy by running other tasks inside
+join(). The sort leaves are mostly C-level sorted(), so the overhead is
+smaller there. Run to run the noise is about 15%.
+"""
@@ -0,0 +1,369 @@
+from typing import Any, Callable, Iterable, Tuple
+from .linkedList import LinkedList
+from .node import CountedNode, Node
+import operator
+
+# Policies a self-organizing list applies to a node found by search or index
+ORGANIZE_MODES = ("move_to_front", "transpose", "count")
+
+class UnorderedList(LinkedList): 
+    """A class that implements an unordered linked list, inheriting from the LinkedList class.
+    
+    Operations: remove, search, is_empty, size, append, index, insert, pop
+                add, insert, extend, add_many, splice, concat, rotate, sort
+    
+    A list created with an organize mode rearranges itself after every
+    successful search or index, so frequently requested items drift
+    towards the head and later scans stop sooner:
+    
+    - "move_to_front" moves the found node to the head.
+    - "transpose" swaps the found node with the one before it.
+    - "count" counts the hits on every node and moves the found node ahead
+      of the nodes with fewer hits.
+    """
+    def __init__(self, indexed: bool = False, organize: str = None): 
+        """Initializes an empty list.
+        
+        Args:
+            indexed (bool): Keep a value-to-node hash index (default is False).
+            organize (str): One of ORGANIZE_MODES, or None to keep the order (default).
+        """
+        if organize is not None and organize not in ORGANIZE_MODES:
+            raise ValueError(f"Unknown organize mode {organize!r}; choose from {', '.join(ORGANIZE_MODES)}.")
+        super().__init__(indexed)
+        self.organize = organize
+        if organize == "count":
+            self.node_type = CountedNode
+
+
+    def search(self, item: Any) -> bool:
+        """Searches for an item, reorganizing the list if the item is found.
+        
+        Args:
+            item (Any): The item to search for in the list.
+        
+        Returns:
+            bool: True if the item is found, False otherwise.
+        """
+        if self.organize is None:
+            return super().search(item)
+        current = self._find_node(item)
+        if current:
+            self._reorganize(current)
+        return current is not None
+
+
+    def index(self, item: Any) -> int:
+        """Finds the index of an item, then reorganizes the list.
+        
+        The index returned is the one the item had when it was found.
+        
+        Raises:
+            ValueError: If the item is not found in the list.
+        """
+        if self.organize is None:
+            return super().index(item)
+        current, position = self._find_node_and_index(item)
+        if not current:
+            raise ValueError(f"{item} is not in list")
+        self._reorganize(current)
+        return position
+
+
+    def _reorganize(self, current: Node) -> None:
+        """Move a node that was just found according to the organize mode."""
+        if self.organize == "move_to_front":
+            target = self.head
+        elif self.organize == "transpose":
+            target = current.prev
+        else:
+            current.hits += 1
+            target = current
+            while target.prev and target.prev.hits < current.hits:
+                target = target.prev
+
+        if target and target is not current:
+            self._move_before(current, target)
+
+
+    def _move_before(self, current: Node, following: Node) -> None:
+        """Relink a node so that it sits just before an earlier node."""
+        current.prev.next = current.next
+        if current.next:
+            current.next.prev = current.prev
+        else:
+            self.tail = current.prev
+
+        current.prev, current.next = following.prev, following
+        if following.prev:
+            following.prev.next = current
+        else:
+            self.head = current
+        following.prev = current
+        self._version += 1
+
+
+    def add(self, item: Any) -> None: 
+        """Adds an item to the beginning of the list.
+        
+        Arg: 
+            item (Any): The item to insert.
+        """
+        self.insert(0, item)
+        
+    
+    def append(self, item: Any) -> None: 
+        """Adds an item to the end of the list.
+        
+        Arg: 
+            item (Any): The item to insert.
+        """
+        self.insert(self.size(), item)
+
+
+    def insert(self, index: int = 0, item: Any = None) -> None:
+        """
+        Inserts an item at a specific index in the list. If the index is negative,
+        it is treated as counting from the end of the list.
+        
+        Args:
+            item (Any): The item to insert.
+            index (int): The index to insert at (default is 0).
+        """
+        # Adjust negative index to a valid position
+        if index < 0:
+            index = self.size() + index if index >= -self.size() else 0
+
+        if index == 0 or self.is_empty():  # Insert at the head
+            index = 0
+            new_node = self.node_type(item, self.head)
+            
+            if self.head:  # If list is not empty, update previous head's prev pointer
+                self.head.prev = new_node
+            
+            self.head = new_node
+            
+            if self.tail is None:  # If the list was empty
+                self.tail = new_node
+                
+        elif index >= self.size():  # Insert at the tail
+            index = self.size()
+            new_node = self.node_type(item, None, self.tail)
+            self.tail.next = new_node
+            self.tail = new_node
+            
+        else:  # Insert at the middle
+            current = self._get_node(index)
+            prev_node = current.prev
+            new_node = self.node_type(item, current, prev_node)
+            prev_node.next = new_node
+            current.prev = new_node
+
+        self.count += 1  # Increment the size of the list
+        self._version += 1
+        self._index_node(new_node)
+        self._finger = (self._version, index, new_node)
+
+
+    def extend(self, items: Iterable[Any]) -> None:
+        """Adds every item of an iterable to the end of the list in one pass.
+        
+        Args:
+            items (Iterable[Any]): The items to append.
+        """
+        if items is self:
+            items = list(items)  # Snapshot, since appending would never end
+        self._link_chain(self.size(), *self._build_chain(items))
+
+
+    def add_many(self, items: Iterable[Any]) -> None:
+        """Adds every item of an iterable to the beginning of the list in one pass.
+        
+        The result is the same as calling add for each item in turn, so the
+        last item ends up at the head.
+        
+        Args:
+            items (Iterable[Any]): The items to add.
+        """
+        self._link_chain(0, *self._build_chain(list(items)[::-1]))
+
+
+    def splice(self, index: int, other: LinkedList) -> None:
+        """Moves every node of another list into this one before an index.
+        
+        Only the walk to the index costs time; the nodes are relinked rather
+        than copied, and the other list is left empty. Nodes of a type this
+        list does not use are copied into new nodes.
+        
+        Args:
+            index (int): The index to insert at, with the same rules as insert.
+            other (LinkedList): The list whose nodes are moved.
+        """
+        self._link_chain(index, *self._take_chain(other))
+
+
+    def concat(self, other: LinkedList) -> None:
+        """Moves every node of another list to the end of this one in O(1).
+        
+        Args:
+            other (LinkedList): The list whose nodes are moved; it is left empty.
+        """
+        self.splice(self.size(), other)
+
+
+    def rotate(self, count: int = 1) -> None:
+        """Moves the last count items to the front of the list, like collections.deque.rotate.
+
+        A negative count moves items from the front to the rear instead.
+        The chain is closed into a ring and cut again before the new head,
+        so only the walk to that node costs anything: O(min(k, n - k))
+        steps, starting from whichever end is nearer.
+
+        Args:
+            count (int): The number of steps to rotate to the right (default is 1).
+        """
+        if self.count < 2 or count % self.count == 0:
+            return
+        new_head = self._get_node(self.count - count % self.count)
+        new_tail = new_head.prev
+        self.tail.next, self.head.prev = self.head, self.tail
+        new_tail.next = new_head.prev = None
+        self.head, self.tail = new_head, new_tail
+        self._version += 1
+
+
+    def sort(self, key: Callable[[Any], Any] = None, reverse: bool = False) -> None:
+        """Sorts the list in place by relinking its nodes, with the same results as list.sort.
+        
+        This is a stable, natural bottom-up merge sort. Each pass splits the
+        chain into maximal ascending runs, reversing strictly descending
+        ones, and merges neighbouring runs pairwise. Sorted input therefore
+        takes one O(n) pass, and any input takes at most O(log n) passes.
+        Only the next pointers change during the passes. The prev pointers
+        and the tail are repaired in one final walk, so the sort allocates
+        no nodes and uses O(1) extra memory.
+        
+        The key function is called at each comparison rather than once per
+        item, which keeps the memory bound at the cost of extra calls.
+        
+        Args:
+            key (Callable[[Any], Any]): A function of one item to sort by (default is the item).
+            reverse (bool): Sort in descending order, keeping equal items in their order.
+        """
+        if self.count < 2:
+            return
+
+        # before(a, b) is True when a must come strictly before b
+        if key is None:
+            before = operator.gt if reverse else operator.lt
+        elif reverse:
+            before = lambda a, b: key(a) > key(b)
+        else:
+            before = lambda a, b: key(a) < key(b)
+
+        dummy = Node()  # Reused as the start of every merged chain
+        current = self.head
+        while True:
+            head = tail = None
+            merged_runs = 0
+            while current:
+                first_head, first_tail, current = self._take_run(current, before)
+                if current:
+                    second_head, second_tail, current = self._take_run(current, before)
+                    first_head, first_tail = self._merge_runs(dummy, first_head, first_tail,
+                                                              second_head, second_tail, before)
+                if tail:
+                    tail.next = first_head
+                else:
+                    head = first_head
+                tail = first_tail
+                merged_runs += 1
+            if merged_runs == 1:
+                break
+            current = head
+
+        # Rebuild the prev pointers from the final order
+        previous = None
+        current = head
+        while current:
+            current.prev = previous
+            previous, current = current, current.next
+        self.head, self.tail = head, previous
+        self._version += 1
+
+
+    def _take_run(self, start: Node, before: Callable[[Any, Any], bool]) -> Tuple[Node, Node, Node]:
+        """Cut off the run beginning at a node and return its head, tail and the node after it.
+        
+        A strictly descending run is reversed into an ascending one; runs
+        with equal neighbours are never reversed, which keeps the sort stable.
+        """
+        current, following = start, start.next
+        if following and before(following.data, current.data):
+            while following and before(following.data, current.data):
+                current, following = following, following.next
+            # Reverse start..current in place
+            previous, node = following, start
+            while node is not following:
+                node.next, previous, node = previous, node, node.next
+            start.next = None
+            return current, start, following
+
+        while following and not before(following.data, current.data):
+            current, following = following, following.next
+        current.next = None
+        return start, current, following
+
+
+    def _merge_runs(self, dummy: Node, first: Node, first_tail: Node, second: Node, second_tail: Node,
+                    before: Callable[[Any, Any], bool]) -> Tuple[Node, Node]:
+        """Merge two ascending runs by relinking and return the head and tail of the result.
+        
+        On ties the node from the first run goes first, which keeps the sort stable.
+        """
+        tail = dummy
+        first_data, second_data = first.data, second.data
+        while True:
+            if before(second_data, first_data):
+                tail.next = tail = second
+                second = second.next
+                if second is None:
+                    tail.next = first
+                    return dummy.next, first_tail
+                second_data = second.data
+            else:
+                tail.next = tail = first
+                first = first.next
+                if first is None:
+                    tail.next = second
+                    return dummy.next, second_tail
+                first_data = first.data
+
+
+    def _link_chain(self, index: int, head: Node, tail: Node, count: int) -> None:
+        """Link an unattached chain of nodes into the list before an index."""
+        if not head:
+            return
+
+        if index < 0:
+            index = self.size() + index if index >= -self.size() else 0
+
+        if index >= self.size():  # Attach at the tail
+            head.prev = self.tail
+            if self.tail:
+                self.tail.next = head
+            else:
+                self.head = head
+            self.tail = tail
+        else:
+            following = self._get_node(index)
+            preceding = following.prev
+            head.prev, tail.next = preceding, following
+            following.prev = tail
+            if preceding:
+                preceding.next = head
+            else:
+                self.head = head
+
+        self.count += count
+        self._version += 1
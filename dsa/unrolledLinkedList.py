@@ -0,0 +1,372 @@
+from typing import Any, List, Tuple, Union
+
+class UnrolledNode:
+    """A node of an unrolled linked list, holding a small list of items."""
+    __slots__ = ("items", "next", "prev")
+
+    def __init__(self, items: List[Any] = None,
+                 next: 'UnrolledNode' = None,
+                 prev: 'UnrolledNode' = None):
+        """
+        Initializes a new UnrolledNode.
+
+        Args:
+            items (List[Any]): The items stored in the node (default is an empty list).
+            next (UnrolledNode): A reference to the next node in the list (default is None).
+            prev (UnrolledNode): A reference to the previous node in the list (default is None).
+        """
+        self.items = [] if items is None else items
+        self.next = next
+        self.prev = prev
+
+
+class UnrolledLinkedList:
+    """A doubly linked list where every node holds up to block_size items.
+
+    Positional access and scans hop once per block instead of once per
+    item, and the scan inside a block runs at C speed. A node that grows
+    past block_size is split in half; a node that shrinks below half of
+    block_size is merged with a neighbour when both fit in one node.
+
+    Operations: remove, search, is_empty, size, append, index, insert, pop
+                pop_front_many, pop_rear_many
+    """
+
+    def __init__(self, block_size: int = 64) -> None:
+        """Initializes an empty list with no head, tail, and a count of 0.
+
+        Args:
+            block_size (int): The maximum number of items per node (default is 64).
+        """
+        if block_size < 2:
+            raise ValueError("block_size must be at least 2.")
+        self.block_size: int = block_size
+        self.head: UnrolledNode = None
+        self.tail: UnrolledNode = None
+        self.count: int = 0
+
+
+    def is_empty(self) -> bool:
+        """Checks if the list is empty.
+
+        Returns:
+            bool: True if the list is empty, False otherwise.
+        """
+        return self.head is None
+
+
+    def size(self) -> int:
+        """Returns the number of elements in the list.
+
+        Returns:
+            int: The number of elements in the list.
+        """
+        return self.count
+
+
+    def __len__(self) -> int:
+        """Returns the number of elements in the list.
+
+        Returns:
+            int: The number of elements in the list.
+        """
+        return self.size()
+
+
+    def search(self, item: Any) -> bool:
+        """Searches for an item in the list.
+
+        Args:
+            item (Any): The item to search for in the list.
+
+        Returns:
+            bool: True if the item is found, False otherwise.
+        """
+        try:
+            self.index(item)
+            return True
+        except ValueError:
+            return False
+
+
+    def _find(self, item: Any) -> Tuple[UnrolledNode, int, int]:
+        """Return the node, offset and list position of the first match of an item.
+
+        Raises:
+            ValueError: If the item is not found in the list.
+        """
+        current = self.head
+        position = 0
+        while current:
+            if item in current.items:
+                offset = current.items.index(item)
+                return current, offset, position + offset
+            position += len(current.items)
+            current = current.next
+        raise ValueError(f"{item} is not in list")
+
+
+    def index(self, item: Any) -> int:
+        """Finds the index of an item in the list.
+
+        Args:
+            item (Any): The item whose index to find.
+
+        Raises:
+            ValueError: If the item is not found in the list.
+
+        Returns:
+            int: The index of the item in the list.
+        """
+        return self._find(item)[2]
+
+
+    def remove(self, item: Any) -> None:
+        """Removes an item from the list.
+
+        Args:
+            item (Any): The item to remove from the list.
+
+        Raises:
+            ValueError: If the item is not found in the list.
+        """
+        try:
+            node, offset, _ = self._find(item)
+        except ValueError:
+            raise ValueError(f"{item} not found!") from None
+        self._delete(node, offset)
+
+
+    def pop(self, index: int = -1) -> Any:
+        """Removes and returns the element at the specified index in the list.
+
+        Args:
+            index (int): The index (default is -1) of the element to pop.
+
+        Raises:
+            IndexError: If the index is out of range or the list is empty.
+
+        Returns:
+            Any: The removed item.
+        """
+        if self.is_empty():
+            raise IndexError("Cannot pop from empty list.")
+
+        if not (0 <= index < self.size() or -self.size() <= index < 0):
+            raise IndexError(f"{index} is out of range.")
+
+        if index < 0:
+            index = self.size() + index
+
+        return self._delete(*self._locate(index))
+
+
+    def pop_front_many(self, count: int) -> List[Any]:
+        """Removes up to count items from the front of the list and returns them, front first.
+
+        Whole blocks are detached at once, so the cost is one slice per
+        block rather than one pop per item.
+
+        Args:
+            count (int): The largest number of items to remove.
+        """
+        count = min(count, self.count)
+        items = []
+        while len(items) < count:
+            block = self.head
+            wanted = count - len(items)
+            if len(block.items) <= wanted:
+                items.extend(block.items)
+                self._unlink(block)
+            else:
+                items.extend(block.items[:wanted])
+                del block.items[:wanted]
+                self._rebalance(block)
+        self.count -= len(items)
+        return items
+
+
+    def pop_rear_many(self, count: int) -> List[Any]:
+        """Removes up to count items from the rear of the list and returns them, rear first.
+
+        Args:
+            count (int): The largest number of items to remove.
+        """
+        count = min(count, self.count)
+        items = []
+        while len(items) < count:
+            block = self.tail
+            wanted = count - len(items)
+            if len(block.items) <= wanted:
+                items.extend(reversed(block.items))
+                self._unlink(block)
+            else:
+                items.extend(block.items[:-wanted - 1:-1])
+                del block.items[-wanted:]
+                self._rebalance(block)
+        self.count -= len(items)
+        return items
+
+
+    def _locate(self, index: int) -> Tuple[UnrolledNode, int]:
+        """Return the node and offset of a valid, non-negative index.
+
+        The walk starts from whichever end of the list is nearer and skips a
+        whole block per hop.
+        """
+        if index < self.count // 2:
+            current = self.head
+            while index >= len(current.items):
+                index -= len(current.items)
+                current = current.next
+            return current, index
+
+        index = self.count - 1 - index  # Distance from the tail
+        current = self.tail
+        while index >= len(current.items):
+            index -= len(current.items)
+            current = current.prev
+        return current, len(current.items) - 1 - index
+
+
+    def _insert_into(self, node: UnrolledNode, offset: int, item: Any) -> None:
+        """Insert an item at an offset inside a node, splitting the node if it overflows."""
+        items = node.items
+        items.insert(offset, item)
+        self.count += 1
+
+        if len(items) > self.block_size:
+            half = len(items) // 2
+            new_node = UnrolledNode(items[half:], node.next, node)
+            del items[half:]
+            if node.next:
+                node.next.prev = new_node
+            else:
+                self.tail = new_node
+            node.next = new_node
+
+
+    def _insert_first(self, item: Any) -> None:
+        """Insert an item into an empty list."""
+        self.head = self.tail = UnrolledNode([item])
+        self.count += 1
+
+
+    def _delete(self, node: UnrolledNode, offset: int) -> Any:
+        """Remove the item at an offset inside a node and rebalance the node."""
+        item = node.items.pop(offset)
+        self.count -= 1
+        self._rebalance(node)
+        return item
+
+
+    def _rebalance(self, node: UnrolledNode) -> None:
+        """Drop a node that has emptied, or merge one that is under half full with a neighbour."""
+        if not node.items:
+            self._unlink(node)
+        elif len(node.items) < self.block_size // 2:
+            following, preceding = node.next, node.prev
+            if following and len(node.items) + len(following.items) <= self.block_size:
+                node.items.extend(following.items)
+                self._unlink(following)
+            elif preceding and len(preceding.items) + len(node.items) <= self.block_size:
+                preceding.items.extend(node.items)
+                self._unlink(node)
+
+
+    def _unlink(self, node: UnrolledNode) -> None:
+        """Detach a node from the chain."""
+        if node.prev:
+            node.prev.next = node.next
+        else:
+            self.head = node.next
+
+        if node.next:
+            node.next.prev = node.prev
+        else:
+            self.tail = node.prev
+
+
+    def _get_list_items(self) -> List[Any]:
+        """Return a list of the items in order."""
+        items = []
+        current = self.head
+        while current:
+            items.extend(current.items)
+            current = current.next
+        return items
+
+
+    def _stringify(self,
+                   items: List[Any],
+                   start: str = "[",
+                   end: str = "]",
+                   separator: str = ", ") -> str:
+        """Return a string representation of the items with custom formatting."""
+        return f"{start}{separator.join(str(item) for item in items)}{end}"
+
+
+    def __str__(self) -> str:
+        """Returns a string representation of the list with arrows."""
+        return self._stringify(self._get_list_items(), start="Head | ", end=" | Ground", separator=" -> ")
+
+
+    def __repr__(self) -> str:
+        """Returns a detailed representation of the list."""
+        return self._stringify(self._get_list_items(), start="[", end="]", separator=", ")
+
+
+    def __getitem__(self, index: Union[int, slice] = 0) -> Union[Any, List[Any]]:
+        """
+        Retrieve an item by its index, or a list of items by a slice.
+
+        Follows the same indexing and slicing rules as LinkedList.__getitem__.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if isinstance(index, int):
+            if not (0 <= index < self.size() or -self.size() <= index < 0):
+                raise IndexError(f"{index} is out of range.")
+
+            if index < 0:
+                index = self.size() + index
+
+            node, offset = self._locate(index)
+            return node.items[offset]
+        else: # Handle slicing
+
+            if index.step:
+                raise NotImplementedError
+
+            start = index.start
+            stop = index.stop
+
+            # Edge case
+            if start > 0 and stop > 0 and start > stop:
+                return []
+
+            if start < 0:
+                start = self.size() + start
+
+            if stop < 0:
+                stop = self.size() + stop
+
+            starting_index = min(start, stop)
+            ending_index = max(start, stop)
+
+            # Nothing to return when the slice starts at or after the last item
+            position = max(starting_index, 0)
+            if position >= self.size() - 1:
+                return []
+
+            remaining = min(ending_index, self.size() - 1) - position + 1
+            node, offset = self._locate(position)
+            items = []
+            while remaining > 0:
+                chunk = node.items[offset:offset + remaining]
+                items.extend(chunk)
+                remaining -= len(chunk)
+                node, offset = node.next, 0
+
+            return items[:-1] if start < stop else items[::-1]
@@ -0,0 +1,58 @@
+from bisect import bisect_left
+from typing import Any
+from .unrolledLinkedList import UnrolledLinkedList
+
+class UnrolledOrderedList(UnrolledLinkedList):
+    """An ordered list on top of the unrolled linked list.
+
+    Whole blocks are skipped by comparing against their last item, and the
+    position inside a block is found by binary search.
+
+    Operations: remove, search, is_empty, size, append, index, insert, pop
+                add
+    """
+    def __init__(self, block_size: int = 64):
+        super().__init__(block_size)
+
+
+    def add(self, item: Any) -> None:
+        """
+        Adds an item to the ordered list while maintaining the sorted order.
+
+        Args:
+            item (Any): The item to insert into the list. It is assumed that the list
+                        supports comparison between elements to determine the order.
+        """
+        if self.is_empty():
+            self._insert_first(item)
+            return
+
+        current = self.head
+        while current.next and current.items[-1] < item:
+            current = current.next
+        self._insert_into(current, bisect_left(current.items, item), item)
+
+
+    def index(self, item: Any) -> int:
+        """Finds the index of an item, stopping at the first block that could hold it.
+
+        Args:
+            item (Any): The item whose index to find.
+
+        Raises:
+            ValueError: If the item is not found in the list.
+
+        Returns:
+            int: The index of the item in the list.
+        """
+        current = self.head
+        position = 0
+        while current and current.items[-1] < item:
+            position += len(current.items)
+            current = current.next
+
+        if current:
+            offset = bisect_left(current.items, item)
+            if offset < len(current.items) and current.items[offset] == item:
+                return position + offset
+        raise ValueError(f"{item} is not in list")
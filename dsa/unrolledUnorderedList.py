@@ -0,0 +1,116 @@
+from typing import Any, Iterable
+from .unrolledLinkedList import UnrolledLinkedList, UnrolledNode
+
+class UnrolledUnorderedList(UnrolledLinkedList):
+    """An unordered list on top of the unrolled linked list.
+
+    Operations: remove, search, is_empty, size, append, index, insert, pop
+                add, insert, extend, add_many, pop_front_many, pop_rear_many, rotate
+    """
+    def __init__(self, block_size: int = 64):
+        super().__init__(block_size)
+
+
+    def add(self, item: Any) -> None:
+        """Adds an item to the beginning of the list.
+
+        Arg:
+            item (Any): The item to insert.
+        """
+        self.insert(0, item)
+
+
+    def append(self, item: Any) -> None:
+        """Adds an item to the end of the list.
+
+        Arg:
+            item (Any): The item to insert.
+        """
+        self.insert(self.size(), item)
+
+
+    def insert(self, index: int = 0, item: Any = None) -> None:
+        """
+        Inserts an item at a specific index in the list. If the index is negative,
+        it is treated as counting from the end of the list.
+
+        Args:
+            item (Any): The item to insert.
+            index (int): The index to insert at (default is 0).
+        """
+        if index < 0:
+            index = self.size() + index if index >= -self.size() else 0
+
+        if self.is_empty():
+            self._insert_first(item)
+        elif index >= self.size():  # Insert at the tail
+            self._insert_into(self.tail, len(self.tail.items), item)
+        else:
+            self._insert_into(*self._locate(index), item)
+
+
+    def extend(self, items: Iterable[Any]) -> None:
+        """Adds every item of an iterable to the end of the list.
+
+        The tail block is topped up first and the rest is linked on as full
+        blocks, so no block is split.
+
+        Args:
+            items (Iterable[Any]): The items to append.
+        """
+        items = list(items)
+        if self.tail:
+            room = min(self.block_size - len(self.tail.items), len(items))
+            self.tail.items.extend(items[:room])
+            self.count += room
+            items = items[room:]
+
+        for start in range(0, len(items), self.block_size):
+            block = UnrolledNode(items[start:start + self.block_size], None, self.tail)
+            if self.tail:
+                self.tail.next = block
+            else:
+                self.head = block
+            self.tail = block
+            self.count += len(block.items)
+
+
+    def add_many(self, items: Iterable[Any]) -> None:
+        """Adds every item of an iterable to the beginning of the list, as repeated add would.
+
+        Args:
+            items (Iterable[Any]): The items to add.
+        """
+        items = list(items)[::-1]
+        if self.head:
+            room = min(self.block_size - len(self.head.items), len(items))
+            self.head.items[:0] = items[len(items) - room:]
+            self.count += room
+            items = items[:len(items) - room]
+
+        for end in range(len(items), 0, -self.block_size):
+            block = UnrolledNode(items[max(end - self.block_size, 0):end], self.head, None)
+            if self.head:
+                self.head.prev = block
+            else:
+                self.tail = block
+            self.head = block
+            self.count += len(block.items)
+
+
+    def rotate(self, count: int = 1) -> None:
+        """Moves the last count items to the front of the list, like collections.deque.rotate.
+
+        The shorter side of the rotation is moved as a batch, so the cost is
+        O(min(k, n - k)) items copied a block at a time.
+
+        Args:
+            count (int): The number of steps to rotate to the right; negative rotates left.
+        """
+        if self.count < 2:
+            return
+        count %= self.count
+        if count <= self.count // 2:
+            self.add_many(self.pop_rear_many(count))
+        else:
+            self.extend(self.pop_front_many(self.count - count))
@@ -0,0 +1,41 @@
+import threading
+from typing import Any
+from .blockDeque import BlockDeque
+
+class WorkStealingDeque(BlockDeque):
+    """A BlockDeque whose end operations are safe to call from several threads.
+
+    In a work-stealing scheduler one owner thread pushes and pops tasks at
+    the rear, so it keeps working on the newest and most cache-friendly
+    task, and other threads steal the oldest tasks from the front. Those
+    tend to be the largest pieces of a divide-and-conquer job. Every end
+    operation takes a per-deque lock, so owners and thieves of different
+    deques never contend with each other.
+
+    Operations: add_front, add_rear, pop_front, pop_rear, is_empty, size
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty deque and its lock."""
+        super().__init__()
+        self._lock = threading.Lock()
+
+    def add_front(self, item: Any) -> None:
+        """Add an item to the front of the deque"""
+        with self._lock:
+            super().add_front(item)
+
+    def add_rear(self, item: Any) -> None:
+        """Add an item to the rear of the deque"""
+        with self._lock:
+            super().add_rear(item)
+
+    def pop_front(self) -> Any:
+        """Remove the item at front of Deque."""
+        with self._lock:
+            return super().pop_front()
+
+    def pop_rear(self) -> Any:
+        """Remove an item from the rear of the deque"""
+        with self._lock:
+            return super().pop_rear()
@@ -0,0 +1,168 @@
+import os
+import random
+import threading
+from concurrent import futures
+from typing import Any, Callable, Optional
+from .workStealingDeque import WorkStealingDeque
+
+HELP_INTERVAL = 0.0005  # Seconds a joining worker waits before looking for work again
+
+class WorkStealingExecutor:
+    """A thread pool where every worker owns a deque and idle workers steal.
+
+    A task submitted from a worker goes onto the rear of that worker's
+    deque. A task submitted from outside the pool goes onto a shared
+    injection deque. A worker runs its own newest task first, then the
+    oldest injected task, then steals the oldest task from a random other
+    worker. Recursive jobs therefore spread out from the top of their call
+    tree without all passing through one central queue.
+
+    Inside a task, wait for a child with join(future) rather than
+    future.result(). join keeps running other tasks while it waits, so a
+    deep fork-join tree cannot tie up every worker and deadlock the pool.
+
+    Operations: submit, join, shutdown
+    """
+
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        """Start the worker threads.
+
+        Args:
+            max_workers (int): The number of worker threads
+                (default is the number of CPUs, at least 2).
+        """
+        if max_workers is None:
+            max_workers = max(2, os.cpu_count() or 1)
+        self.max_workers = max_workers
+        if self.max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+        self._deques = [WorkStealingDeque() for _ in range(self.max_workers)]
+        self._injected = WorkStealingDeque()
+        self._local = threading.local()
+        self._work_available = threading.Condition()
+        self._idle = 0
+        self._shutdown = False
+        self._threads = [threading.Thread(target=self._run, args=(index,), daemon=True)
+                         for index in range(self.max_workers)]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> futures.Future:
+        """Schedule fn(*args, **kwargs) and return a Future for its result.
+
+        Raises:
+            RuntimeError: If the executor has been shut down.
+        """
+        future = futures.Future()
+        task = (future, fn, args, kwargs)
+        index = getattr(self._local, "index", None)
+        if index is None:
+            # Check and push under the lock a worker holds while it decides to
+            # exit, so shutdown cannot let every worker leave before the push
+            with self._work_available:
+                if self._shutdown:
+                    raise RuntimeError("Cannot submit to an executor that has been shut down.")
+                self._injected.add_rear(task)
+                if self._idle:
+                    self._work_available.notify()
+            return future
+
+        # The submitting worker is still running, so it will run the task if no one steals it
+        if self._shutdown:
+            raise RuntimeError("Cannot submit to an executor that has been shut down.")
+        self._deques[index].add_rear(task)
+
+        # A worker counts itself idle before its last scan, so a task pushed
+        # after that scan always finds the count raised and wakes it
+        if self._idle:
+            with self._work_available:
+                self._work_available.notify()
+        return future
+
+    def join(self, future: futures.Future) -> Any:
+        """Return the result of a future, running other tasks until it is done.
+
+        Raises:
+            Exception: Whatever the task raised.
+        """
+        index = getattr(self._local, "index", None)
+        if index is not None:
+            while not future.done():
+                task = self._find_task(index)
+                if task is None:
+                    futures.wait([future], timeout=HELP_INTERVAL)
+                else:
+                    self._execute(task)
+        return future.result()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting tasks; the workers exit once no tasks are left.
+
+        Args:
+            wait (bool): Block until every worker has exited (default is True).
+        """
+        with self._work_available:
+            self._shutdown = True
+            self._work_available.notify_all()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def __enter__(self) -> 'WorkStealingExecutor':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+
+    def _find_task(self, index: int) -> Optional[tuple]:
+        """Return the next task for a worker, or None if there is no work anywhere."""
+        for deque, take in ((self._deques[index], WorkStealingDeque.pop_rear),
+                            (self._injected, WorkStealingDeque.pop_front)):
+            if not deque.is_empty():
+                try:
+                    return take(deque)
+                except IndexError:  # Another thread took the last task first
+                    pass
+
+        start = random.randrange(self.max_workers)
+        for offset in range(self.max_workers):
+            victim = self._deques[(start + offset) % self.max_workers]
+            if not victim.is_empty():
+                try:
+                    return victim.pop_front()
+                except IndexError:
+                    pass
+        return None
+
+    def _execute(self, task: tuple) -> None:
+        """Run a task and settle its future."""
+        future, fn, args, kwargs = task
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as exc:
+            future.set_exception(exc)
+        else:
+            future.set_result(result)
+
+    def _run(self, index: int) -> None:
+        """Run tasks as a worker until the executor shuts down and no work is left."""
+        self._local.index = index
+        while True:
+            task = self._find_task(index)
+            if task is not None:
+                self._execute(task)
+                continue
+
+            with self._work_available:
+                self._idle += 1
+                task = self._find_task(index)
+                if task is None:
+                    if self._shutdown:
+                        self._idle -= 1
+                        return
+                    self._work_available.wait()
+                self._idle -= 1
+            if task is not None:
+                self._execute(task)